@@ -0,0 +1,9 @@
+import os
+
+# Benchmarks run offline; settings only need placeholders
+os.environ.setdefault('DEEPSEEK_API_KEY', 'benchmark-key')
+os.environ.setdefault('SHEET_IDS', 'sheet-0')
+os.environ.setdefault('LLM_CACHE_ENABLED', 'false')
+# No read limit and no bucket file under data/
+os.environ.setdefault('SHEETS_READS_PER_MINUTE', '0')
+os.environ.setdefault('SHEETS_QUOTA_PATH', '')
@@ -0,0 +1,55 @@
+"""
+Compare the JSON and compact LLM payload encodings on synthetic survey rows.
+
+The compact size includes the question dictionary sent ahead of the answers,
+which is the same for every candidate and is also reported on its own.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_payload --sheets 3 --submissions 2
+"""
+import argparse
+import json
+
+from benchmarks.survey import survey_sheets
+from src.config import settings
+from src.core.booster import InterviewBooster, ResponseData
+from src.llm.tokens import estimate_tokens
+from src.utils.sheets import SheetsClient
+from src.utils.store import SheetStore
+from tests.fakes import FakeGspreadClient
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sheets', type=int, default=3)
+    parser.add_argument('--submissions', type=int, default=2,
+                        help='submissions per candidate in each sheet')
+    args = parser.parse_args()
+
+    email = 'user0@example.com'
+    sheet_data = {}
+    questions = {}
+    for sheet_id, values in survey_sheets(args.sheets, rows=args.submissions, candidates=1).items():
+        store = SheetStore(values[0], values[1:])
+        sheet_data[sheet_id] = InterviewBooster._responses_from_store(store, email)
+        questions[sheet_id] = InterviewBooster._questions_from_store(store)
+    data = ResponseData(email=email, sheet_data=sheet_data, questions=questions)
+
+    booster = InterviewBooster(sheets_client=SheetsClient('unused.json', client=FakeGspreadClient({})))
+    results = {}
+    for name in ('json', 'compact'):
+        settings.LLM_PAYLOAD_FORMAT = name
+        context = booster.question_context(data)
+        prompt = booster.format_for_llm(data)
+        if context:
+            prompt = context + '\n\n' + prompt
+        results[name] = {'chars': len(prompt), 'estimated_tokens': estimate_tokens(prompt),
+                         'shared_prefix_tokens': estimate_tokens(context)}
+    results['token_reduction'] = round(
+        1 - results['compact']['estimated_tokens'] / results['json']['estimated_tokens'], 3)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""
+Compare the markdown2/HTML-splitting PDF path with the single-pass converter.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pdf --sections 60 --repeat 3
+
+'story' times the markdown-to-flowables step alone; 'pdf' includes layout.
+"""
+import argparse
+import io
+import json
+import time
+import tracemalloc
+
+import markdown2
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+from src.utils.pdf import PDFGenerator
+
+
+def synthetic_report(sections: int, structured: bool = True) -> str:
+    """
+    A long report in the shape the LLM produces.
+
+    ``structured`` adds the h3 headings, lists and table of real reports,
+    which the previous implementation flattened into body paragraphs (so it
+    lays out fewer flowables); without them both paths produce the same
+    document.
+    """
+    parts = ["# Interview Feedback Report\n",
+             "## Overall Score and Summary\n",
+             "Your overall score is **72/100**. You are close to the 80 mark and improving.\n"]
+    if structured:
+        parts.append("| Section | Score |\n|---|---|\n| Job Search | 20/35 |\n| Resume | 18/25 |\n")
+    for n in range(1, sections + 1):
+        parts.append(f"## Section {n}: Job Search Strategies (20/35)\n")
+        parts.append("You apply consistently and track your applications, which is a *strong* habit. "
+                     "Tailoring each resume to the role would raise your response rate.\n")
+        if structured:
+            parts.append("### What You're Doing Well\n")
+            parts.append("- You apply to **10+ roles** a week\n- You use referrals when possible\n"
+                         "  - Especially for larger companies\n")
+            parts.append("### Areas for Improvement\n")
+            parts.append("1. Customize your resume for each job description\n"
+                         "2. Follow up `within a week` of applying\n")
+        else:
+            parts.append("Networking is your **biggest opportunity**: reach out to two people a week.\n")
+    return '\n'.join(parts)
+
+
+def legacy_story(gen: PDFGenerator, markdown_content: str, email: str) -> list:
+    """The previous implementation: markdown2 to HTML, then string splitting"""
+    html = markdown2.markdown(markdown_content, extras=['tables', 'fenced-code-blocks'])
+    story = [Paragraph(f"<b>Interview Report for {email}</b>", gen.styles['Heading1']), Spacer(1, 20)]
+    sections = html.split('<h2>')
+    first_section = sections[0].replace('<p>', '').replace('</p>', '')
+    for paragraph in first_section.split('<br />'):
+        if paragraph.strip():
+            story.append(Paragraph(paragraph, gen.styles['CustomBodyText']))
+            story.append(Spacer(1, 8))
+    for section in sections[1:]:
+        if '</h2>' in section:
+            heading, content = section.split('</h2>', 1)
+            story.append(Paragraph(heading, gen.styles['CustomHeading2']))
+            story.append(Spacer(1, 10))
+            content = content.replace('<p>', '').replace('</p>', '')
+            for paragraph in content.split('<br />'):
+                if paragraph.strip():
+                    story.append(Paragraph(paragraph, gen.styles['CustomBodyText']))
+                    story.append(Spacer(1, 8))
+    return story
+
+
+def legacy_render(gen: PDFGenerator, markdown_content: str, email: str) -> bytes:
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
+                            topMargin=72, bottomMargin=72)
+    try:
+        doc.build(legacy_story(gen, markdown_content, email))
+    except Exception:
+        # Markup reportlab rejects made the old code build a plain-text document
+        buffer = io.BytesIO()
+        SimpleDocTemplate(buffer, pagesize=letter).build([
+            Paragraph(f"<b>Interview Report for {email}</b>", gen.styles['Heading1']),
+            Spacer(1, 20),
+            Paragraph("Error creating formatted report. Displaying plain text:", gen.styles['CustomBodyText']),
+            Spacer(1, 10),
+            Paragraph(markdown_content, gen.styles['CustomBodyText']),
+        ])
+    return buffer.getvalue()
+
+
+def measure(render, repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'render_s': round(min(times), 4), 'peak_alloc_mb': round(peak / 1e6, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sections', type=int, default=60)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    gen = PDFGenerator()
+    email = 'user0@example.com'
+    results = {}
+    for kind in ('prose', 'structured'):
+        report = synthetic_report(args.sections, structured=kind == 'structured')
+        legacy = {
+            'flowables': len(legacy_story(gen, report, email)),
+            'story': measure(lambda: legacy_story(gen, report, email), args.repeat),
+            'pdf': measure(lambda: legacy_render(gen, report, email), args.repeat),
+        }
+        single_pass = {
+            'flowables': len(gen._build_story(report, email)),
+            'story': measure(lambda: gen._build_story(report, email), args.repeat),
+            'pdf': measure(lambda: gen.render(report, email), args.repeat),
+        }
+        results[kind] = {
+            'report_chars': len(report),
+            'markdown2_html_split': legacy,
+            'single_pass': single_pass,
+            'story_speedup': round(legacy['story']['render_s'] / single_pass['story']['render_s'], 2),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+End-to-end pipeline benchmark against local stand-ins for Sheets and DeepSeek.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pipeline --sizes 3x500x24,3x5000x24,3x5000x80 --output results.json
+
+Each size is SHEETSxROWSxCOLUMNS. Sheets are served by the fake gspread
+client from tests/fakes.py (answer columns beyond the survey's questions
+repeat them, giving duplicate headers); completions come from the local
+OpenAI-compatible stub server. Every stage is timed separately and end to
+end, and the JSON output records the git revision so runs of different
+versions can be compared.
+"""
+import argparse
+import contextlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.survey import survey_sheets
+from src.config import settings
+from src.core.booster import InterviewBooster
+from src.llm.async_client import AsyncLLMClient
+from src.llm.client import LLMClient
+from src.utils import metrics
+from src.utils.sheets import SheetsClient
+from tests.fakes import FakeGspreadClient, FakeOpenAIServer
+
+EMAIL = 'user0@example.com'
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def summarize(times: List[float]) -> Dict[str, float]:
+    return {'median_s': round(statistics.median(times), 5), 'min_s': round(min(times), 5)}
+
+
+def timed(run: Callable, repeat: int) -> Dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def bench_size(sheet_count: int, rows: int, columns: int, args, server: FakeOpenAIServer,
+               output_dir: str) -> Dict:
+    sheets = survey_sheets(sheet_count, rows, candidates=max(1, rows // 3), columns=columns)
+    fake = FakeGspreadClient(sheets, {sheet_id: args.sheets_latency for sheet_id in sheets})
+    llm_client = LLMClient(cache=None, async_client=AsyncLLMClient(
+        api_key='benchmark-key', base_url=server.base_url, max_retries=0))
+
+    def new_booster() -> InterviewBooster:
+        # A fresh SheetsClient starts with an empty snapshot cache
+        booster = InterviewBooster(sheets_client=SheetsClient('unused.json', client=fake),
+                                   llm_client=llm_client)
+        booster.sheet_ids = list(sheets)
+        return booster
+
+    warm = new_booster()
+    data = warm.get_all_responses(EMAIL)
+    payload = warm.format_for_llm(data)
+    report = warm.generate_report(data)
+    markdown_content = warm.format_as_markdown(report)
+
+    # Token counts come from the metrics records of one report
+    usage: Dict[str, int] = {}
+
+    def collect(record):
+        if record['stage'] == 'llm.complete':
+            usage.update(prompt_tokens=record.get('prompt_tokens'),
+                         completion_tokens=record.get('completion_tokens'),
+                         prompt_cache_hit_tokens=record.get('prompt_cache_hit_tokens'))
+
+    metrics.add_hook(collect)
+    try:
+        warm.generate_report(data)
+    finally:
+        metrics.remove_hook(collect)
+
+    def end_to_end():
+        booster = new_booster()
+        result = booster.get_all_responses(EMAIL)
+        text = booster.generate_report(result)
+        booster.pdf_gen.create_report(booster.format_as_markdown(text), EMAIL, output_dir)
+
+    return {
+        'sheets': sheet_count,
+        'rows_per_sheet': rows,
+        'answer_columns': columns,
+        'submissions': sum(len(r) for r in data.sheet_data.values()),
+        'payload_chars': len(payload),
+        **usage,
+        'stages': {
+            'get_all_responses_cold': timed(lambda: new_booster().get_all_responses(EMAIL), args.repeat),
+            'get_all_responses_cached': timed(lambda: warm.get_all_responses(EMAIL), args.repeat),
+            'format_for_llm': timed(lambda: warm.format_for_llm(data), args.repeat),
+            'generate_report': timed(lambda: warm.generate_report(data), args.repeat),
+            'create_report': timed(lambda: warm.pdf_gen.create_report(markdown_content, EMAIL, output_dir),
+                                   args.repeat),
+        },
+        'end_to_end': timed(end_to_end, args.repeat),
+    }
+
+
+def parse_sizes(value: str) -> List[tuple]:
+    return [tuple(int(n) for n in size.lower().split('x')) for size in value.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('3x500x24,3x5000x24,3x5000x80'),
+                        help='comma-separated SHEETSxROWSxCOLUMNS')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--sheets-latency', type=float, default=0.05, help='seconds per fake Sheets call')
+    parser.add_argument('--llm-latency', type=float, default=0.2, help='seconds before the stub answers')
+    parser.add_argument('--completion-tokens', type=int, default=800,
+                        help='approximate length of the stub report')
+    parser.add_argument('--output', help='also write the JSON results to this file')
+    args = parser.parse_args()
+
+    # Everything measured here is served by stand-ins, which have no quota
+    settings.LLM_CACHE_ENABLED = False
+    settings.SHEETS_READS_PER_MINUTE = 0
+    content = '## Overall Score and Summary\n\n' + ' '.join(['word'] * max(1, args.completion_tokens * 4 // 5))
+
+    results = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'settings': {
+            'sheets_lookup_mode': settings.SHEETS_LOOKUP_MODE,
+            'llm_payload_format': settings.LLM_PAYLOAD_FORMAT,
+            'report_mode': settings.REPORT_MODE,
+        },
+        'config': {k: v for k, v in vars(args).items() if k != 'output'},
+        'runs': [],
+    }
+    # Progress prints from the pipeline go to stderr so stdout stays valid JSON
+    with FakeOpenAIServer(content=content, latency=args.llm_latency) as server, \
+            tempfile.TemporaryDirectory() as output_dir, contextlib.redirect_stdout(sys.stderr):
+        for sheet_count, rows, columns in args.sizes:
+            results['runs'].append(bench_size(sheet_count, rows, columns, args, server, output_dir))
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Measure Streamlit cold start and per-rerun overhead, eager vs lazy.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup --runs 5
+
+'eager' reproduces the previous startup: every client is built and every
+heavy library imported when the booster is created, on each rerun. 'lazy'
+is the current path: a cheap booster created once per process, as
+st.cache_resource does in the app. Google
+authorization needs network access and is left out of both, as is the
+in-memory sheet cache that an eager rerun threw away.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+COLD_START = """
+import time
+start = time.perf_counter()
+from src.core.booster import InterviewBooster
+booster = InterviewBooster()
+if {eager}:
+    import gspread
+    from google.oauth2.service_account import Credentials
+    booster.llm_client, booster.pdf_gen, booster.scoring
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(eager: bool, runs: int) -> dict:
+    """Import and construct the booster in fresh interpreters"""
+    times = []
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', COLD_START.format(eager=eager)],
+                                cwd=root, env=os.environ.copy(), capture_output=True,
+                                text=True, check=True).stdout
+        times.append(float(output.strip().splitlines()[-1]))
+    return {'median_s': round(statistics.median(times), 4), 'min_s': round(min(times), 4)}
+
+
+def per_rerun(build, reruns: int) -> float:
+    build()
+    start = time.perf_counter()
+    for _ in range(reruns):
+        build()
+    return round((time.perf_counter() - start) / reruns * 1e3, 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per cold start measurement')
+    parser.add_argument('--reruns', type=int, default=200, help='simulated Streamlit reruns')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='simulated Sheets API latency in seconds for the rerun-with-lookup case')
+    args = parser.parse_args()
+
+    import functools
+    import tempfile
+    from src.config import settings
+    from src.core.booster import InterviewBooster
+
+    # Production default: the LLM response cache is on
+    settings.LLM_CACHE_ENABLED = True
+    settings.LLM_CACHE_DIR = tempfile.mkdtemp()
+    # The fake sheets have no quota
+    settings.SHEETS_READS_PER_MINUTE = 0
+
+    from benchmarks.survey import survey_sheets
+    from src.utils.sheets import SheetsClient
+    from tests.fakes import FakeGspreadClient
+
+    sheets = survey_sheets(3, rows=2000)
+    fake = FakeGspreadClient(sheets, {sheet_id: args.latency for sheet_id in sheets})
+    settings.SHEET_IDS = ','.join(sheets)
+
+    def eager_booster():
+        booster = InterviewBooster(sheets_client=SheetsClient('unused.json', client=fake))
+        booster.llm_client, booster.pdf_gen, booster.scoring
+        return booster
+
+    # st.cache_resource only caches inside a running app; functools.cache
+    # gives the same one-instance-per-process behaviour here
+    @functools.cache
+    def cached_booster():
+        return InterviewBooster(sheets_client=SheetsClient('unused.json', client=fake))
+
+    results = {
+        'cold_start': {
+            'eager': cold_start(True, args.runs),
+            'lazy': cold_start(False, args.runs),
+        },
+        'per_rerun_ms': {
+            'eager': per_rerun(eager_booster, args.reruns),
+            'cached_resource': per_rerun(cached_booster, args.reruns),
+        },
+        # A rerun followed by one report lookup: an eager rerun starts with an
+        # empty sheet cache and downloads every sheet again
+        'per_rerun_with_lookup_ms': {
+            'eager': per_rerun(lambda: eager_booster().get_all_responses('user0@example.com'), 10),
+            'cached_resource': per_rerun(lambda: cached_booster().get_all_responses('user0@example.com'), 10),
+        },
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
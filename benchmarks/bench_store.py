@@ -0,0 +1,82 @@
+"""
+Compare the list-of-dicts records path with the columnar SheetStore.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_store --rows 100000 --columns 30
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from src.utils.store import SheetStore, make_unique_headers
+
+
+def synthetic_sheet(rows: int, columns: int, candidates: int):
+    headers = ['Timestamp', 'Email Address'] + [f'Question {i}' for i in range(columns - 2)]
+    answers = ['Strongly agree', 'Agree', 'Neutral', 'Disagree', 'Yes', 'No', '']
+    data = [
+        [f'2024-01-01 10:{i % 60:02d}:00', f'user{i % candidates}@example.com']
+        + [answers[(i + j) % len(answers)] for j in range(columns - 2)]
+        for i in range(rows)
+    ]
+    return headers, data
+
+
+def list_of_dicts_lookup(records, email):
+    return [r for r in records if r.get('Email Address', '').lower() == email.lower()]
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def time_lookups(lookup, emails):
+    start = time.perf_counter()
+    for email in emails:
+        lookup(email)
+    return (time.perf_counter() - start) / len(emails)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--columns', type=int, default=30)
+    parser.add_argument('--candidates', type=int, default=20_000)
+    parser.add_argument('--lookups', type=int, default=20)
+    args = parser.parse_args()
+
+    headers, data = synthetic_sheet(args.rows, args.columns, args.candidates)
+    emails = [f'USER{i}@example.com' for i in range(args.lookups)]
+
+    unique_headers = make_unique_headers(headers)
+    records, records_build, records_bytes = measure(
+        lambda: [dict(zip(unique_headers, row)) for row in data])
+    store, store_build, store_bytes = measure(lambda: SheetStore(headers, data))
+
+    results = {
+        'rows': args.rows,
+        'columns': args.columns,
+        'list_of_dicts': {
+            'build_s': round(records_build, 4),
+            'memory_mb': round(records_bytes / 1e6, 1),
+            'lookup_ms': round(time_lookups(lambda e: list_of_dicts_lookup(records, e), emails) * 1e3, 3),
+        },
+        'sheet_store': {
+            'build_s': round(store_build, 4),
+            'memory_mb': round(store_bytes / 1e6, 1),
+            'lookup_ms': round(time_lookups(lambda e: store.records(store.positions(e)), emails) * 1e3, 3),
+        },
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
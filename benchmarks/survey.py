@@ -0,0 +1,100 @@
+"""Synthetic survey sheets shaped like the real Google Forms exports"""
+import random
+from typing import Dict, List, Optional, Tuple
+
+LIKERT = ['Strongly agree', 'Agree', 'Neutral', 'Disagree', 'Strongly disagree']
+YES_NO = ['Yes', 'No']
+
+SECTIONS = {
+    'Current Status Evaluation': [
+        ('text', 'What is your current employment status and how long have you been actively job searching?'),
+        ('likert', 'I am satisfied with the number of interview invitations I have received in the past three months.'),
+        ('yes_no', 'Have you received at least one interview invitation in the past month?'),
+        ('likert', 'I feel confident that my current job search approach will lead to an offer within six months.'),
+    ],
+    'Goals and Interest Areas': [
+        ('text', 'Which roles, industries and companies are you most interested in, and why?'),
+        ('text', 'What are your salary expectations and preferred work arrangement (remote, hybrid, on-site)?'),
+    ],
+    'Job Search Strategies & Awareness': [
+        ('likert', 'I tailor my resume and cover letter to each job description before applying.'),
+        ('likert', 'I track every application, its status and follow-up dates in a structured way.'),
+        ('yes_no', 'Do you apply to jobs within the first 48 hours after they are posted?'),
+        ('likert', 'I research the company, team and interviewers before every interview.'),
+        ('yes_no', 'Do you use job alerts on LinkedIn or other job boards for your target roles?'),
+    ],
+    'Resume & LinkedIn Optimization': [
+        ('likert', 'My resume highlights quantified achievements rather than listing responsibilities.'),
+        ('yes_no', 'Is your LinkedIn headline tailored to the roles you are targeting?'),
+        ('likert', 'My LinkedIn profile is complete, including a summary, skills and recommendations.'),
+        ('upload', 'Please upload your current resume (PDF or DOCX).'),
+    ],
+    'Networking & Referrals': [
+        ('likert', 'I regularly reach out to people working at my target companies.'),
+        ('yes_no', 'Have you asked for at least one referral in the past month?'),
+        ('likert', 'I attend industry events, meetups or webinars to expand my network.'),
+    ],
+    'Mental Health Evaluation': [
+        ('likert', 'I feel motivated and energetic about my job search most days.'),
+        ('likert', 'Rejections do not significantly affect my confidence or mood.'),
+        ('text', 'Is there anything about your job search that is causing you stress right now?'),
+    ],
+}
+
+TEXT_ANSWERS = [
+    'Currently employed as a data analyst, searching actively for about four months.',
+    'Product analytics or data science roles at mid-size tech companies; I enjoy working close to product teams.',
+    'Around 120k base, hybrid preferred, open to remote.',
+    'Mostly the silence after applying; I rarely hear back from companies.',
+]
+
+
+def _questions(columns: Optional[int] = None) -> List[Tuple[str, str]]:
+    """
+    Question (kind, text) pairs for ``columns`` answer columns.
+
+    By default every question appears once plus one repeat. Larger counts
+    cycle through the questions again, so the extra columns are duplicate
+    headers as in real exports that reuse questions.
+    """
+    questions = [q for section in SECTIONS.values() for q in section]
+    questions.append(SECTIONS['Mental Health Evaluation'][0])
+    if columns is None:
+        return questions
+    return [questions[i % len(questions)] for i in range(columns)]
+
+
+def survey_headers(columns: Optional[int] = None) -> List[str]:
+    # Real exports repeat some headers when a question is reused in a form
+    return ['Timestamp', 'Email Address'] + [text for _, text in _questions(columns)]
+
+
+def _answer(kind: str, rng: random.Random) -> str:
+    if rng.random() < 0.15:
+        return ''
+    if kind == 'likert':
+        return rng.choice(LIKERT)
+    if kind == 'yes_no':
+        return rng.choice(YES_NO)
+    if kind == 'upload':
+        return 'https://drive.google.com/open?id=1AbCdEfGhIjKlMnOpQrStUvWxYz'
+    return rng.choice(TEXT_ANSWERS)
+
+
+def survey_rows(count: int, candidates: int = 1000, seed: int = 0,
+                columns: Optional[int] = None) -> List[List[str]]:
+    rng = random.Random(seed)
+    kinds = [kind for kind, _ in _questions(columns)]
+    return [
+        [f'{1 + i % 12}/{1 + i % 28}/2024 {i % 24}:{i % 60:02d}:{i % 60:02d}', f'user{i % candidates}@example.com']
+        + [_answer(kind, rng) for kind in kinds]
+        for i in range(count)
+    ]
+
+
+def survey_sheets(sheet_count: int, rows: int, candidates: int = 1000,
+                  columns: Optional[int] = None) -> Dict[str, List[List[str]]]:
+    return {
+        f'sheet-{n}': [survey_headers(columns)] + survey_rows(rows, candidates, seed=n, columns=columns)
+        for n in range(sheet_count)
+    }
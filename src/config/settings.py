@@ -1,12 +1,85 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 import json
+import threading
 from pathlib import Path
 
 class Settings(BaseSettings):
     DEEPSEEK_API_KEY: str
     SHEET_IDS: str
     CREDENTIALS_PATH: str = 'credentials.json'
+    # Seconds a cached sheet snapshot is served before checking for new rows
+    SHEETS_CACHE_TTL: float = 60.0
+    # Maximum number of sheet snapshots kept in memory (0 disables caching)
+    SHEETS_CACHE_MAX_SHEETS: int = 32
+    # Seconds after which a snapshot is downloaded in full again instead of
+    # extended, picking up cells edited in place without a new timestamp
+    SHEETS_SNAPSHOT_MAX_AGE: float = 900.0
+    # Maximum number of sheets fetched concurrently per request
+    SHEETS_MAX_CONCURRENCY: int = 4
+    # Sheets API reads per minute (0 for no limit); Google's default quota is 60
+    # per minute per user, service accounts included
+    SHEETS_READS_PER_MINUTE: float = 60.0
+    # SQLite file holding the read bucket, so the app, tools/batch.py and
+    # tools/watch.py share one quota; empty gives every process its own bucket.
+    # A relative path is taken from the repository root
+    SHEETS_QUOTA_PATH: str = 'data/sheets_quota.sqlite3'
+    # Reads allowed at once after an idle period
+    SHEETS_READ_BURST: int = 10
+    # Retries of a read rejected with a quota error, with exponential backoff in seconds
+    SHEETS_MAX_RETRIES: int = 5
+    SHEETS_BACKOFF_BASE: float = 1.0
+    SHEETS_BACKOFF_MAX: float = 60.0
+    # 'full' downloads whole sheets; 'targeted' fetches only the candidate's rows
+    SHEETS_LOOKUP_MODE: str = 'full'
+    # 'sheets' reads the Google Sheets API; 'mirror' serves from the local mirror only
+    DATA_SOURCE: str = 'sheets'
+    # SQLite file written by tools/sync.py
+    MIRROR_PATH: str = 'data/mirror.sqlite3'
+    # JSON file mapping sheets/questions to survey sections for local scoring
+    SCORING_CONFIG_PATH: str = 'scoring.json'
+    # 'single' asks for the whole report in one call; 'sections' generates the
+    # sections concurrently (requires the scoring config)
+    REPORT_MODE: str = 'single'
+    # Also save rendered PDFs here; empty keeps them in memory only
+    REPORTS_DIR: str = ''
+    # Rendered PDFs keyed by a hash of their markdown, reused instead of rendering
+    # again; empty disables the store
+    ARTIFACTS_DIR: str = '.cache/reports'
+    # Least recently used artifacts are evicted past this total size
+    ARTIFACTS_MAX_BYTES: int = 200 * 1024 * 1024
+    # Append per-stage timing records (JSON lines) to this file; empty disables
+    METRICS_PATH: str = ''
+    # SQLite file of report jobs submitted from the app, with their results
+    JOBS_DB_PATH: str = 'data/jobs.sqlite3'
+    # Report jobs processed at once; their LLM calls also share LLM_MAX_IN_FLIGHT
+    JOBS_MAX_WORKERS: int = 4
+    # Finished jobs and their PDFs are deleted after this many days
+    JOBS_RETENTION_DAYS: float = 7.0
+    # tools/watch.py: seconds between polls of the sheets for new submissions
+    WATCH_INTERVAL: float = 300.0
+    # Reports pre-generated at once by the watcher
+    WATCH_MAX_CONCURRENCY: int = 2
+    # Prompt plus completion tokens the watcher may spend per day (0 for no limit)
+    WATCH_DAILY_TOKEN_BUDGET: int = 2_000_000
+    # Rows seen, pending candidates and today's spend, kept across restarts
+    WATCH_STATE_PATH: str = 'data/watch_state.json'
+    # 'compact' lists question texts once per sheet; 'json' dumps every submission
+    LLM_PAYLOAD_FORMAT: str = 'compact'
+    # DeepSeek (OpenAI-compatible) endpoint and request policy
+    LLM_BASE_URL: str = 'https://api.deepseek.com'
+    LLM_MODEL: str = 'deepseek-chat'
+    # Maximum concurrent LLM requests across the whole process
+    LLM_MAX_IN_FLIGHT: int = 8
+    LLM_MAX_RETRIES: int = 4
+    # Per-request timeout and exponential backoff bounds, in seconds
+    LLM_TIMEOUT: float = 120.0
+    LLM_BACKOFF_BASE: float = 1.0
+    LLM_BACKOFF_MAX: float = 30.0
+    # On-disk cache of LLM completions, keyed by model, prompt and payload
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_DIR: str = '.cache/llm'
+    LLM_CACHE_MAX_BYTES: int = 50 * 1024 * 1024
     
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -69,5 +142,38 @@ class Settings(BaseSettings):
         # If no credentials found, return empty dict
         return {}
 
+class _LazySettings:
+    """
+    Proxy that creates the Settings singleton on first attribute access.
+
+    Importing the config package therefore neither reads the environment nor
+    fails when required variables are missing; that happens the first time a
+    setting is used.
+    """
+
+    def __init__(self):
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _get(self) -> Settings:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = Settings()
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._get(), name)
+
+
 # Singleton instance
-settings = Settings()
+settings = _LazySettings()
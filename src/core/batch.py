@@ -0,0 +1,144 @@
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from ..utils import quota
+from ..utils.pdf import render_report_file
+from .booster import InterviewBooster
+
+
+class Checkpoint:
+    """
+    Append-only JSON lines file of finished candidates.
+
+    Each line records one email and the path of its PDF. Lines are flushed
+    as soon as a report is written, so an interrupted run loses at most the
+    reports that were still in progress.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by an interrupted write
+                        continue
+                    self.done[entry['email']] = entry['pdf']
+
+    def __contains__(self, email: str) -> bool:
+        return email.lower() in self.done
+
+    def mark_done(self, email: str, pdf_path: str):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self.done[email.lower()] = pdf_path
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'email': email.lower(), 'pdf': pdf_path, 'finished_at': time.time()}) + '\n')
+
+
+class BatchResult(BaseModel):
+    written: Dict[str, str] = {}
+    skipped: List[str] = []
+    # Email -> error message; failed candidates are retried on the next run
+    failed: Dict[str, str] = {}
+    elapsed: float = 0.0
+    reports_per_minute: float = 0.0
+
+
+class BatchRunner:
+    """
+    Generate reports for many candidates as a fetch -> LLM -> PDF pipeline.
+
+    Fetching and report generation are I/O bound and run on a thread pool;
+    the LLM calls inside share the process-wide in-flight limit of the async
+    client. Rendering is CPU bound and runs on a process pool, so PDFs for
+    finished reports are built while other candidates are still waiting on
+    the LLM.
+
+    Args:
+        booster: InterviewBooster used to fetch responses and write reports
+        output_dir: Directory the PDFs are saved to
+        checkpoint: Candidates already done; they are skipped and new ones are added
+        llm_workers: Candidates fetched and sent to the LLM at once
+        pdf_workers: Processes rendering PDFs
+        refresh: Regenerate reports instead of reusing cached completions
+    """
+
+    def __init__(self, booster: InterviewBooster, output_dir: str, checkpoint: Checkpoint,
+                 llm_workers: int = 8, pdf_workers: Optional[int] = None, refresh: bool = False):
+        self.booster = booster
+        self.output_dir = output_dir
+        self.checkpoint = checkpoint
+        self.llm_workers = max(1, llm_workers)
+        self.pdf_workers = max(1, pdf_workers or os.cpu_count() or 1)
+        self.refresh = refresh
+
+    def _write_report(self, email: str) -> str:
+        """Fetch one candidate's responses and return the report markdown"""
+        with quota.priority(quota.BATCH):
+            data = self.booster.get_all_responses(email)
+        if data.errors:
+            raise RuntimeError('could not load sheets: ' + ', '.join(data.errors))
+        if not any(data.sheet_data.values()):
+            raise LookupError('no responses found')
+        report = self.booster.generate_report(data, refresh=self.refresh)
+        return self.booster.format_as_markdown(report)
+
+    def run(self, emails: Optional[List[str]] = None) -> BatchResult:
+        """
+        Generate reports for ``emails``, or for every respondent in the sheets.
+
+        Returns:
+            BatchResult with the PDFs written in this run, the candidates
+            skipped through the checkpoint and the ones that failed
+        """
+        start = time.perf_counter()
+        if emails is None:
+            with quota.priority(quota.BATCH):
+                emails = self.booster.get_all_emails()
+        result = BatchResult(skipped=[e for e in emails if e in self.checkpoint])
+        pending = [e for e in emails if e not in self.checkpoint]
+        print(f"{len(pending)} reports to generate, {len(result.skipped)} already done")
+
+        # Spawned workers only import the PDF module, and never inherit the
+        # LLM event loop thread
+        context = multiprocessing.get_context('spawn')
+        with ThreadPoolExecutor(max_workers=self.llm_workers) as llm_pool, \
+                ProcessPoolExecutor(max_workers=self.pdf_workers, mp_context=context) as pdf_pool:
+            stage = {llm_pool.submit(self._write_report, email): ('llm', email) for email in pending}
+            while stage:
+                finished, _ = wait(stage, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step, email = stage.pop(future)
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        print(f"{email}: failed: {e}")
+                        result.failed[email] = str(e)
+                        continue
+                    if step == 'llm':
+                        stage[pdf_pool.submit(render_report_file, value, email, self.output_dir)] = ('pdf', email)
+                        continue
+
+                    self.checkpoint.mark_done(email, value)
+                    result.written[email] = value
+                    rate = len(result.written) * 60 / (time.perf_counter() - start)
+                    print(f"[{len(result.written)}/{len(pending)}] {email}: {value} ({rate:.1f} reports/min)")
+
+        result.elapsed = time.perf_counter() - start
+        if result.elapsed > 0:
+            result.reports_per_minute = len(result.written) * 60 / result.elapsed
+        return result
@@ -1,37 +1,328 @@
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 from pydantic import BaseModel
-from ..utils.sheets import SheetsClient
-from ..llm.client import LLMClient
+from ..utils.store import SheetStore
+from ..utils.mirror import SheetMirror
 from ..config import settings
-from ..utils.pdf import PDFGenerator
+from ..prompts.section_prompt import (
+    DEFAULT_SECTION_GUIDANCE, SECTION_GUIDANCE, SECTION_PROMPT, SUMMARY_PROMPT
+)
+from ..llm.tokens import estimate_tokens
+from ..utils import metrics
+from ..utils.singleflight import SingleFlight
+from ..utils.artifacts import ArtifactStore
+import contextvars
+import hashlib
 import json
+import re
+import threading
+
+# gspread, openai, reportlab and pandas take most of the import time, so the
+# clients that need them are imported and built on first use
+if TYPE_CHECKING:
+    from ..utils.sheets import SheetsClient
+    from ..llm.client import LLMClient
+    from ..utils.pdf import PDFGenerator
+    from .scoring import CandidateScores, ScoringEngine, SectionScore
+
+_UNSET = object()
+
+
+def _short_timestamp(timestamp: str) -> str:
+    """Drop the seconds from a form timestamp, keeping the sheet's own date format"""
+    return re.sub(r'(\d{1,2}:\d{2}):\d{2}(\.\d+)?', r'\1', timestamp, count=1)
+
+
+def _email_key(email: str) -> str:
+    return email.strip().lower()
+
+
+def _data_version(data: 'ResponseData') -> str:
+    """Digest of the fetched responses, so reports of different data never coalesce"""
+    content = json.dumps([data.sheet_data, data.errors, data.questions], sort_keys=True, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _section_score_text(s: 'SectionScore') -> str:
+    if s.weight == 0:
+        return "no score assigned"
+    if s.score is None:
+        return "no scored answers"
+    return f"{s.score:g} / {s.weight:g} ({s.earned:g} of {s.possible:g} points)"
+
+
+def _priority_recommendations(scores: 'CandidateScores') -> str:
+    """Rank sections 3-5 by score, with mental health first when it scores below 6"""
+    by_section = {s.section: s for s in scores.sections}
+    ranked = sorted((by_section[n] for n in (3, 4, 5) if by_section[n].score is not None),
+                    key=lambda s: s.score / s.weight)
+    lines = []
+    mental_health = by_section[6]
+    if mental_health.score is not None and mental_health.score < 6:
+        lines.append(f"**{mental_health.name}** ({mental_health.score:g}/{mental_health.weight:g}): "
+                     f"look after your wellbeing first; see the suggestions in Section 6.")
+    for s in ranked:
+        lines.append(f"**{s.name}** ({s.score:g}/{s.weight:g}): "
+                     f"see the Areas for Improvement in Section {s.section}.")
+    if not lines:
+        return "Not enough scored answers to rank the sections."
+    return '\n'.join(f"{i}. {line}" for i, line in enumerate(lines, 1))
+
 
 class ResponseData(BaseModel):
     email: str
     sheet_data: Dict[str, List[Dict]]
+    # Sheet id -> error message for sheets that could not be fetched
+    errors: Dict[str, str] = {}
+    # Sheet id -> question headers in sheet order, the same for every candidate
+    questions: Dict[str, List[str]] = {}
 
 class InterviewBooster:
-    def __init__(self):
-        self.sheets_client = SheetsClient(settings.CREDENTIALS_PATH)
-        self.llm_client = LLMClient()
-        self.pdf_gen = PDFGenerator()
+    """
+    Fetch survey responses and turn them into feedback reports.
+
+    Clients that are not injected are created on first use, so constructing
+    a booster is cheap and does not authorize with Google or import the LLM
+    and PDF libraries until a request needs them.
+
+    A booster is meant to be shared (the app keeps one per process).
+    Concurrent requests for the same candidate share one in-flight fetch, and
+    concurrent reports and PDFs for the same email and data share one LLM
+    call and render; see ``SingleFlight``.
+    """
+
+    def __init__(self, sheets_client: Optional['SheetsClient'] = None,
+                 llm_client: Optional['LLMClient'] = None,
+                 pdf_gen: Optional['PDFGenerator'] = None,
+                 mirror: Optional[SheetMirror] = None,
+                 scoring: Optional['ScoringEngine'] = None,
+                 artifacts: Optional[ArtifactStore] = None):
+        if mirror is None and settings.DATA_SOURCE == 'mirror':
+            mirror = SheetMirror(settings.MIRROR_PATH)
+        self.mirror = mirror
+        self._sheets_client = sheets_client
+        self._llm_client = llm_client
+        self._pdf_gen = pdf_gen
+        self._scoring = _UNSET if scoring is None else scoring
+        self._artifacts = _UNSET if artifacts is None else artifacts
+        self._init_lock = threading.Lock()
+        self._flights = SingleFlight()
+        if settings.METRICS_PATH:
+            metrics.enable_json_lines(settings.METRICS_PATH)
         self.sheet_ids = [id.strip() for id in settings.SHEET_IDS.split(',')]
 
+    @property
+    def sheets_client(self) -> Optional['SheetsClient']:
+        # In mirror mode requests never touch the Sheets API
+        if self._sheets_client is None and self.mirror is None:
+            with self._init_lock:
+                if self._sheets_client is None:
+                    from ..utils.sheets import SheetsClient
+                    self._sheets_client = SheetsClient(settings.CREDENTIALS_PATH)
+        return self._sheets_client
+
+    @sheets_client.setter
+    def sheets_client(self, value: Optional['SheetsClient']):
+        self._sheets_client = value
+
+    @property
+    def llm_client(self) -> 'LLMClient':
+        if self._llm_client is None:
+            with self._init_lock:
+                if self._llm_client is None:
+                    from ..llm.client import LLMClient
+                    self._llm_client = LLMClient()
+        return self._llm_client
+
+    @llm_client.setter
+    def llm_client(self, value: 'LLMClient'):
+        self._llm_client = value
+
+    @property
+    def pdf_gen(self) -> 'PDFGenerator':
+        if self._pdf_gen is None:
+            with self._init_lock:
+                if self._pdf_gen is None:
+                    from ..utils.pdf import PDFGenerator
+                    self._pdf_gen = PDFGenerator()
+        return self._pdf_gen
+
+    @pdf_gen.setter
+    def pdf_gen(self, value: 'PDFGenerator'):
+        self._pdf_gen = value
+
+    @property
+    def scoring(self) -> Optional['ScoringEngine']:
+        # Without a scoring config the LLM computes the scores itself
+        if self._scoring is _UNSET:
+            with self._init_lock:
+                if self._scoring is _UNSET:
+                    from .scoring import ScoringConfig, ScoringEngine
+                    scoring_config = ScoringConfig.load(settings.SCORING_CONFIG_PATH)
+                    self._scoring = ScoringEngine(scoring_config) if scoring_config else None
+        return self._scoring
+
+    @scoring.setter
+    def scoring(self, value: Optional['ScoringEngine']):
+        self._scoring = value
+
+    @property
+    def artifacts(self) -> Optional[ArtifactStore]:
+        # Without ARTIFACTS_DIR every PDF is rendered again
+        if self._artifacts is _UNSET:
+            with self._init_lock:
+                if self._artifacts is _UNSET:
+                    self._artifacts = ArtifactStore(settings.ARTIFACTS_DIR, settings.ARTIFACTS_MAX_BYTES) \
+                        if settings.ARTIFACTS_DIR else None
+        return self._artifacts
+
+    @artifacts.setter
+    def artifacts(self, value: Optional[ArtifactStore]):
+        self._artifacts = value
+
     def get_all_responses(self, email: str) -> ResponseData:
-        """Fetch responses from all configured sheets"""
-        all_data = {}
+        """
+        Fetch responses from all configured sheets.
+
+        Sheets are fetched concurrently, up to ``SHEETS_MAX_CONCURRENCY`` at a
+        time. A sheet that fails is reported in ``ResponseData.errors`` and does
+        not stop the others. Concurrent calls for the same email share one
+        fetch.
+        """
+        # Normalized before fetching too, so every caller sharing the fetch gets the same rows
+        email = _email_key(email)
+        return self._flights.do(('fetch', email), lambda: self._fetch_all_responses(email))
+
+    def _fetch_all_responses(self, email: str) -> ResponseData:
+        with metrics.stage('report.fetch', sheets=len(self.sheet_ids)) as s:
+            workers = max(1, min(settings.SHEETS_MAX_CONCURRENCY, len(self.sheet_ids)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # Each fetch runs in a copy of the caller's context, keeping its Sheets quota priority
+                futures = [pool.submit(contextvars.copy_context().run, self._get_sheet_responses, sheet_id, email)
+                           for sheet_id in self.sheet_ids]
+
+            all_data = {}
+            errors = {}
+            questions = {}
+            for sheet_id, future in zip(self.sheet_ids, futures):
+                try:
+                    questions[sheet_id], all_data[sheet_id] = future.result()
+                except Exception as e:
+                    print(f"Error fetching sheet {sheet_id}: {e}")
+                    errors[sheet_id] = str(e)
+            s.set(submissions=sum(len(responses) for responses in all_data.values()), errors=len(errors))
+        return ResponseData(email=email, sheet_data=all_data, errors=errors, questions=questions)
+
+    def get_all_emails(self) -> List[str]:
+        """
+        Distinct lowercased email addresses across all configured sheets.
+
+        Emails are ordered by first appearance, sheet by sheet. A sheet that
+        fails is reported and skipped.
+        """
+        emails: Dict[str, None] = {}
         for sheet_id in self.sheet_ids:
-            records = self.sheets_client.get_sheet_data(sheet_id)
-            all_data[sheet_id] = [{
-                'timestamp': r['Timestamp'],
-                'email': r['Email Address'],
-                'responses': {k:v for k,v in r.items() 
-                            if not k.startswith(('Timestamp', 'Email Address'))}
-            } for r in records if r.get('Email Address', '').lower() == email.lower()]
-        return ResponseData(email=email, sheet_data=all_data)
+            try:
+                if self.mirror is not None:
+                    sheet_emails = self.mirror.get_emails(sheet_id)
+                else:
+                    sheet_emails = self.sheets_client.get_sheet_store(sheet_id).emails()
+            except Exception as e:
+                print(f"Error fetching sheet {sheet_id}: {e}")
+                continue
+            emails.update(dict.fromkeys(sheet_emails))
+        return list(emails)
+
+    def _get_sheet_responses(self, sheet_id: str, email: str) -> Tuple[List[str], List[Dict]]:
+        """Fetch one sheet and return its questions and the rows submitted by ``email``"""
+        if self.mirror is not None:
+            store = self.mirror.get_email_store(sheet_id, email)
+        elif settings.SHEETS_LOOKUP_MODE == 'targeted':
+            store = self.sheets_client.get_email_store(sheet_id, email)
+        else:
+            store = self.sheets_client.get_sheet_store(sheet_id)
+        return self._questions_from_store(store), self._responses_from_store(store, email)
+
+    @staticmethod
+    def _is_question(header: str) -> bool:
+        return not header.startswith(('Timestamp', 'Email Address'))
+
+    @classmethod
+    def _questions_from_store(cls, store: SheetStore) -> List[str]:
+        return [h for h in store.headers if cls._is_question(h)]
+
+    @classmethod
+    def _responses_from_store(cls, store: SheetStore, email: str) -> List[Dict]:
+        """Build response entries straight from the store's columns via its email index"""
+        positions = store.positions(email)
+        if not positions:
+            return []
+
+        timestamps = store.column('Timestamp')
+        emails = store.column('Email Address')
+        response_columns = [(h, column) for h, column in zip(store.headers, store.columns)
+                            if cls._is_question(h)]
+        return [{
+            'timestamp': timestamps[p],
+            'email': emails[p],
+            'responses': {h: column[p] for h, column in response_columns}
+        } for p in positions]
 
     def format_for_llm(self, data: ResponseData) -> str:
-        """Structure data for LLM processing"""
+        """
+        Structure the candidate's answers for LLM processing.
+
+        The compact encoding (default) refers to questions by the ids of
+        ``question_context`` and gives every submission only its answered
+        questions. Its output is therefore not self-contained: it has the
+        ``Q<n>`` ids but not the question texts, so send it together with
+        ``question_context(data)``. Set ``LLM_PAYLOAD_FORMAT=json`` for the original
+        one-JSON-object-per-submission layout. When a scoring config is
+        present the locally computed scores are appended so the model only
+        writes the narrative.
+        """
+        with metrics.stage('report.format', format=settings.LLM_PAYLOAD_FORMAT) as s:
+            payload = self._format_responses(data)
+            if self.scoring is not None:
+                payload += '\n\n' + self.scoring.score_responses(data).format_for_llm()
+            s.set(payload_chars=len(payload), estimated_tokens=estimate_tokens(payload))
+        return payload
+
+    def question_context(self, data: ResponseData) -> str:
+        """
+        Question dictionary sent ahead of the candidate's answers.
+
+        Every sheet's questions are listed in sheet order with ids ``Q<n>``,
+        whichever of them the candidate answered, so the text is byte-identical
+        for every candidate of a cohort. Placed right after the system prompt it
+        forms a prefix DeepSeek serves from its context cache. Empty for the
+        json format, which repeats the questions in every submission.
+        """
+        if settings.LLM_PAYLOAD_FORMAT == 'json':
+            return ''
+        lines = ["Survey questions, listed once per sheet [S<n>] as Q<n>; "
+                 "submissions refer to them by id and list answered questions only."]
+        for n, questions in enumerate(self._sheet_questions(data).values(), 1):
+            if questions:
+                lines.append(f"\n[S{n}] Questions")
+                lines.extend(f"Q{i}: {q}" for i, q in enumerate(questions, 1))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _sheet_questions(data: ResponseData) -> Dict[str, List[str]]:
+        """Questions per sheet; data built without them falls back to the questions in its responses"""
+        questions = dict(data.questions)
+        for sheet_id, responses in data.sheet_data.items():
+            if sheet_id not in questions:
+                questions[sheet_id] = list(dict.fromkeys(q for r in responses for q in r['responses']))
+        return questions
+
+    def _format_responses(self, data: ResponseData) -> str:
+        if settings.LLM_PAYLOAD_FORMAT == 'json':
+            return self._format_json(data)
+        return self._format_compact(data)
+
+    def _format_json(self, data: ResponseData) -> str:
         return f"User: {data.email}\nResponses:\n" + \
             '\n'.join(
                 f'- {sheet_id}: {json.dumps(resp)}' 
@@ -39,14 +330,163 @@ class InterviewBooster:
                 for resp in responses
             )
 
-    def generate_report(self, data) -> str:
-        """Generate personalized feedback report"""
+    def _format_compact(self, data: ResponseData) -> str:
+        lines = [f"User: {data.email}"]
+        for n, (sheet_id, questions) in enumerate(self._sheet_questions(data).items(), 1):
+            for j, r in enumerate(data.sheet_data.get(sheet_id, []), 1):
+                lines.append(f"[S{n}] Submission {j} ({_short_timestamp(r['timestamp'])})")
+                for i, q in enumerate(questions, 1):
+                    answer = str(r['responses'].get(q, '')).strip()
+                    if answer:
+                        lines.append(f"Q{i}: {' / '.join(answer.splitlines())}")
+        return '\n'.join(lines)
+
+    def _report_key(self, kind: str, data: ResponseData, refresh: bool) -> tuple:
+        # Settings that change the prompt are part of the key as well
+        return (kind, _email_key(data.email), _data_version(data), refresh,
+                settings.REPORT_MODE, settings.LLM_PAYLOAD_FORMAT)
+
+    def generate_report(self, data, refresh: bool = False) -> str:
+        """
+        Generate personalized feedback report, reusing a cached one unless ``refresh``.
+
+        Concurrent calls for the same email and data share one generation.
+        """
+        return self._flights.do(self._report_key('report', data, refresh),
+                                lambda: self._generate_report(data, refresh))
+
+    def _generate_report(self, data: ResponseData, refresh: bool) -> str:
+        with metrics.stage('report.generate', mode=settings.REPORT_MODE):
+            if self._sectioned():
+                return ''.join(self._sectioned_report(data, refresh))
+            formatted_data = self.format_for_llm(data)
+            return self.llm_client.generate_feedback(formatted_data, refresh=refresh,
+                                                     context=self.question_context(data))
+
+    def stream_report(self, data, refresh: bool = False) -> Iterator[str]:
+        """
+        Generate the feedback report, yielding text chunks as they arrive.
+
+        Concurrent streams for the same email and data read from one
+        generation, each from its first chunk.
+        """
+        return self._flights.stream(self._report_key('stream', data, refresh),
+                                    lambda: self._stream_report(data, refresh))
+
+    def _stream_report(self, data: ResponseData, refresh: bool) -> Iterator[str]:
+        if self._sectioned():
+            return self._sectioned_report(data, refresh)
         formatted_data = self.format_for_llm(data)
-        return self.llm_client.generate_feedback(formatted_data)
+        return self.llm_client.stream_feedback(formatted_data, refresh=refresh,
+                                               context=self.question_context(data))
+
+    def _sectioned(self) -> bool:
+        return settings.REPORT_MODE == 'sections' and self.scoring is not None
+
+    def _sectioned_report(self, data: ResponseData, refresh: bool = False) -> Iterator[str]:
+        """
+        Generate the report as concurrent per-section calls.
+
+        Each section with responses gets its own short LLM call, and one more
+        call writes the overall summary and closing commentary; all of them
+        run at once. The scores, section headings and priority ranking come
+        from the scoring engine, so the assembled report keeps the structure
+        required by SYSTEM_PROMPT. Parts are yielded in report order as soon
+        as they are ready.
+        """
+        scores = self.scoring.score_responses(data)
+        split = self.scoring.split_by_section(data)
+
+        summary = self.llm_client.submit_feedback(
+            self.format_for_llm(data), refresh=refresh, system_prompt=SUMMARY_PROMPT,
+            context=self.question_context(data))
+        questions = self._sheet_questions(data)
+        sections = {}
+        for s in scores.sections:
+            if s.section not in split:
+                continue
+            # Each section call gets only that section's questions, again the same for every candidate
+            section_data = ResponseData(email=data.email, sheet_data=split[s.section], questions={
+                sheet_id: [q for q in sheet_questions if self.scoring.section_of(sheet_id, q) == s.section]
+                for sheet_id, sheet_questions in questions.items()
+            })
+            payload = self._format_responses(section_data) + '\n\n' + \
+                f"Precomputed section score: {_section_score_text(s)}"
+            prompt = SECTION_PROMPT.format(
+                number=s.section, name=s.name,
+                guidance=SECTION_GUIDANCE.get(s.section, DEFAULT_SECTION_GUIDANCE))
+            sections[s.section] = self.llm_client.submit_feedback(
+                payload, refresh=refresh, system_prompt=prompt, context=self.question_context(section_data))
+
+        parts = re.split(r'^#{1,6}\s*Additional Commentary\s*$', summary.result().strip(),
+                         maxsplit=1, flags=re.MULTILINE | re.IGNORECASE)
+        opening = re.sub(r'^#{1,6}\s*Overall Score and Summary\s*\n', '', parts[0].strip(),
+                         flags=re.IGNORECASE)
+        yield "## Overall Score and Summary\n\n" + opening.strip() + "\n\n"
+
+        for s in scores.sections:
+            heading = f"## Section {s.section}: {s.name}"
+            if s.score is not None:
+                heading += f" ({s.score:g}/{s.weight:g})"
+            if s.section in sections:
+                body = sections[s.section].result().strip()
+            else:
+                body = "No responses were provided for this section."
+            yield f"{heading}\n\n{body}\n\n"
+
+        yield "## Priority Recommendations\n\n" + _priority_recommendations(scores) + "\n\n"
+        if len(parts) > 1:
+            yield "## Additional Commentary\n\n" + parts[1].strip() + "\n"
+
+    def render_pdf_report(self, report_text: str, email: str) -> tuple[bytes, str]:
+        """
+        Render a PDF report from the report text in memory.
+        
+        Args:
+            report_text: The text content of the report
+            email: The email of the candidate
+            
+        Returns:
+            Tuple containing the PDF bytes and the markdown content
+        """
+        digest = hashlib.sha256(report_text.encode('utf-8')).hexdigest()
+        return self._flights.do(('pdf', _email_key(email), digest),
+                                lambda: self._render_pdf_report(report_text, email))
+
+    def _render_pdf_report(self, report_text: str, email: str) -> tuple[bytes, str]:
+        markdown_content = self.format_as_markdown(report_text)
+        pdf_bytes, _ = self._stored_pdf(markdown_content, email)
+        if settings.REPORTS_DIR:
+            self.pdf_gen.save(pdf_bytes, email, settings.REPORTS_DIR)
+        return pdf_bytes, markdown_content
+
+    def _stored_pdf(self, markdown_content: str, email: str) -> tuple[bytes, Optional[str]]:
+        """
+        PDF for the markdown, from the artifact store when it was rendered before.
+
+        Returns:
+            Tuple of the PDF bytes and the stored artifact's path (None
+            without a store)
+        """
+        store = self.artifacts
+        if store is None:
+            return self.pdf_gen.render(markdown_content, email), None
+
+        key = store.make_key(markdown_content, email)
+        pdf_bytes = store.get(key)
+        metrics.record('pdf.artifact', hit=pdf_bytes is not None)
+        if pdf_bytes is not None:
+            return pdf_bytes, store.path(key)
+        pdf_bytes = self.pdf_gen.render(markdown_content, email)
+        return pdf_bytes, store.put(key, pdf_bytes)
 
     def generate_pdf_report(self, report_text: str, email: str) -> tuple[str, str]:
         """
-        Generate a PDF report from the report text.
+        Generate a PDF report from the report text and save it to disk.
+
+        With an artifact store the PDF is stored (or found) there under its
+        content hash, so earlier versions are kept and concurrent writers
+        never collide. Otherwise it is written to ``REPORTS_DIR``.
         
         Args:
             report_text: The text content of the report
@@ -56,12 +496,15 @@ class InterviewBooster:
             Tuple containing the path to the PDF file and the markdown content
         """
         # Convert the report text to markdown format
-        markdown_content = self._format_as_markdown(report_text)
+        markdown_content = self.format_as_markdown(report_text)
         # Generate the PDF
-        pdf_path = self.pdf_gen.create_report(markdown_content, email)
+        if self.artifacts is not None:
+            _, pdf_path = self._stored_pdf(markdown_content, email)
+        else:
+            pdf_path = self.pdf_gen.create_report(markdown_content, email, settings.REPORTS_DIR or 'reports')
         return pdf_path, markdown_content
 
-    def _format_as_markdown(self, report_text: str) -> str:
+    def format_as_markdown(self, report_text: str) -> str:
         """
         Format the report text as markdown.
         
@@ -0,0 +1,256 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Dict, List, Optional, Set
+
+from pydantic import BaseModel
+
+from .booster import InterviewBooster
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    refresh INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    warnings TEXT NOT NULL DEFAULT '[]',
+    markdown TEXT,
+    pdf BLOB,
+    pdf_name TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_email ON jobs (email, status);
+"""
+
+# Stages in the order a job goes through them; 'done' and 'failed' are final
+STAGES = ['queued', 'fetching', 'generating', 'rendering', 'done']
+FINISHED = ('done', 'failed')
+
+_COLUMNS = 'id, email, refresh, status, error, warnings, markdown, pdf_name, created_at, updated_at'
+
+
+class Job(BaseModel):
+    id: str
+    email: str
+    refresh: bool = False
+    status: str = 'queued'
+    error: Optional[str] = None
+    # Sheets that could not be loaded; the report uses the others
+    warnings: List[str] = []
+    # Report text so far while generating, the final markdown once done
+    markdown: Optional[str] = None
+    pdf_name: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the stages completed, for progress bars"""
+        if self.status == 'failed':
+            return 1.0
+        return STAGES.index(self.status) / (len(STAGES) - 1)
+
+
+class JobStore:
+    """
+    SQLite table of report jobs and their results.
+
+    Finished jobs keep their markdown and PDF, so a result outlives Streamlit
+    reruns, browser refreshes and app restarts until it is purged.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps the store thread-safe
+        return sqlite3.connect(self.path, timeout=30)
+
+    def create(self, email: str, refresh: bool = False) -> Job:
+        now = time.time()
+        job = Job(id=uuid.uuid4().hex, email=email, refresh=refresh, created_at=now, updated_at=now)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT INTO jobs (id, email, refresh, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (job.id, job.email, int(refresh), job.status, now, now))
+        return job
+
+    def update(self, job_id: str, **fields):
+        """Set columns of one job, e.g. ``update(id, status='rendering')``"""
+        if 'warnings' in fields:
+            fields['warnings'] = json.dumps(fields['warnings'])
+        fields.setdefault('updated_at', time.time())
+        assignments = ', '.join(f'{name} = ?' for name in fields)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f'UPDATE jobs SET {assignments} WHERE id = ?', (*fields.values(), job_id))
+
+    @staticmethod
+    def _job(row) -> Job:
+        values = dict(zip(_COLUMNS.split(', '), row))
+        values['refresh'] = bool(values['refresh'])
+        values['warnings'] = json.loads(values['warnings'])
+        return Job(**values)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(f'SELECT {_COLUMNS} FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._job(row) if row else None
+
+    def get_pdf(self, job_id: str) -> Optional[bytes]:
+        with closing(self._connect()) as conn:
+            row = conn.execute('SELECT pdf FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return bytes(row[0]) if row and row[0] is not None else None
+
+    def find_active(self, email: str, refresh: bool, stale_after: float) -> Optional[Job]:
+        """The unfinished job for ``email``, if one is queued or running and updated within ``stale_after`` seconds"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f'SELECT {_COLUMNS} FROM jobs WHERE email = ? AND refresh = ? AND status NOT IN (?, ?) '
+                'AND updated_at >= ? ORDER BY created_at DESC LIMIT 1',
+                (email, int(refresh), *FINISHED, time.time() - stale_after)).fetchone()
+        return self._job(row) if row else None
+
+    def touch(self, job_ids: List[str]):
+        """Record that the process running these jobs is still alive"""
+        if not job_ids:
+            return
+        placeholders = ', '.join('?' * len(job_ids))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f'UPDATE jobs SET updated_at = ? WHERE id IN ({placeholders}) AND status NOT IN (?, ?)',
+                         (time.time(), *job_ids, *FINISHED))
+
+    def fail_stale(self, stale_after: float, error: str = 'interrupted by an app restart') -> int:
+        """Mark unfinished jobs not updated for ``stale_after`` seconds as failed; their process has stopped"""
+        with closing(self._connect()) as conn, conn:
+            now = time.time()
+            return conn.execute(
+                'UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE status NOT IN (?, ?) AND updated_at < ?',
+                ('failed', error, now, *FINISHED, now - stale_after)).rowcount
+
+    def purge(self, older_than: float) -> int:
+        """Delete jobs last updated more than ``older_than`` seconds ago"""
+        with closing(self._connect()) as conn, conn:
+            return conn.execute('DELETE FROM jobs WHERE updated_at < ?', (time.time() - older_than,)).rowcount
+
+
+class JobQueue:
+    """
+    Run report jobs on a bounded pool of worker threads.
+
+    ``submit`` returns a job id straight away; a worker then fetches the
+    responses, streams the report and renders the PDF, recording each stage
+    in the store. Callers poll ``get`` for progress. While a job is
+    generating, ``get`` also returns the report text received so far, which
+    is kept in memory rather than written to the store on every chunk.
+
+    At most ``max_workers`` jobs run at once; the LLM requests they make
+    also share the process-wide ``LLM_MAX_IN_FLIGHT`` limit, so the number of
+    paid calls stays bounded however many users submit jobs.
+
+    Several processes may share one store (e.g. Streamlit workers). Every
+    ``HEARTBEAT`` seconds a queue refreshes ``updated_at`` of the jobs it owns
+    and fails other unfinished jobs not updated for ``STALE`` seconds, whose
+    process must have stopped.
+
+    Args:
+        booster: InterviewBooster used to run the pipeline
+        store: Where jobs and their results are kept
+        max_workers: Jobs processed at once
+    """
+
+    # Seconds between heartbeats, and without one after which a job counts as abandoned
+    HEARTBEAT = 15.0
+    STALE = 60.0
+
+    def __init__(self, booster: InterviewBooster, store: JobStore, max_workers: int = 4):
+        self.booster = booster
+        self.store = store
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='report-job')
+        self._lock = threading.Lock()
+        # Chunks received so far per generating job, joined only when read
+        self._partial: Dict[str, List[str]] = {}
+        # Jobs queued or running in this process
+        self._owned: Set[str] = set()
+        self._stopped = threading.Event()
+        self.store.fail_stale(self.STALE)
+        threading.Thread(target=self._heartbeat, name='report-job-heartbeat', daemon=True).start()
+
+    def submit(self, email: str, refresh: bool = False) -> str:
+        """
+        Queue a report for ``email``.
+
+        Returns:
+            The job id; an unfinished job for the same email is reused
+        """
+        email = email.strip().lower()
+        with self._lock:
+            active = self.store.find_active(email, refresh, self.STALE)
+            if active is not None:
+                return active.id
+            job = self.store.create(email, refresh)
+            self._owned.add(job.id)
+        self._pool.submit(self._run, job.id, email, refresh)
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        job = self.store.get(job_id)
+        if job is not None and job.status == 'generating':
+            job.markdown = ''.join(self._partial.get(job_id, ()))
+        return job
+
+    def get_pdf(self, job_id: str) -> Optional[bytes]:
+        return self.store.get_pdf(job_id)
+
+    def _run(self, job_id: str, email: str, refresh: bool):
+        try:
+            self.store.update(job_id, status='fetching')
+            data = self.booster.get_all_responses(email)
+            if not any(data.sheet_data.values()):
+                raise LookupError('No responses found for this email')
+
+            self.store.update(job_id, status='generating', warnings=list(data.errors))
+            parts = self._partial[job_id] = []
+            for chunk in self.booster.stream_report(data, refresh=refresh):
+                parts.append(chunk)
+
+            self.store.update(job_id, status='rendering')
+            pdf_bytes, markdown_content = self.booster.render_pdf_report(''.join(parts), email)
+            self.store.update(job_id, status='done', markdown=markdown_content, pdf=pdf_bytes,
+                              pdf_name=self.booster.pdf_gen.report_filename(email))
+        except Exception as e:
+            print(f"Report job {job_id} for {email} failed: {e}")
+            self.store.update(job_id, status='failed', error=str(e))
+        finally:
+            self._partial.pop(job_id, None)
+            with self._lock:
+                self._owned.discard(job_id)
+
+    def _heartbeat(self):
+        while not self._stopped.wait(self.HEARTBEAT):
+            try:
+                with self._lock:
+                    owned = list(self._owned)
+                self.store.touch(owned)
+                self.store.fail_stale(self.STALE)
+            except Exception as e:
+                print(f"Report job heartbeat failed: {e}")
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+        self._stopped.set()
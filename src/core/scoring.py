@@ -0,0 +1,256 @@
+import json
+import os
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from pydantic import BaseModel
+
+from ..utils.store import SheetStore
+
+# Section number -> (name, weight in points out of 100), as in SYSTEM_PROMPT
+SECTIONS = {
+    1: ('Current Status Evaluation', 10),
+    2: ('Goals and Interest Areas', 0),
+    3: ('Job Search Strategies & Awareness', 35),
+    4: ('Resume & LinkedIn Optimization', 25),
+    5: ('Networking & Referrals', 20),
+    6: ('Mental Health Evaluation', 10),
+}
+
+# Points for Likert and Yes/No answers, matched case-insensitively
+ANSWER_POINTS = {
+    'strongly agree': 1.0,
+    'agree': 1.0,
+    'somewhat agree': 1.0,
+    'neutral': 0.5,
+    'somewhat disagree': 0.0,
+    'disagree': 0.0,
+    'strongly disagree': 0.0,
+    'yes': 1.0,
+    'no': 0.0,
+}
+
+# Points for 1-5 linear scale answers (question type 'scale')
+SCALE_POINTS = {'1': 0.0, '2': 0.0, '3': 0.5, '4': 1.0, '5': 1.0}
+
+# Question types that are summarized by the LLM but never scored
+UNSCORED_TYPES = ('text', 'upload', 'info')
+
+
+class QuestionRule(BaseModel):
+    section: Optional[int] = None
+    # 'auto' scores Likert and Yes/No labels; see also 'scale' and UNSCORED_TYPES
+    type: str = 'auto'
+
+
+class ScoringConfig(BaseModel):
+    """
+    Which survey columns belong to which section.
+
+    ``sheet_sections`` assigns every column of a sheet to one section;
+    ``questions`` overrides the section or type of individual columns,
+    keyed by (unique) header text.
+    """
+    sheet_sections: Dict[str, int] = {}
+    questions: Dict[str, QuestionRule] = {}
+
+    @classmethod
+    def load(cls, path: str) -> Optional['ScoringConfig']:
+        """Load a config from a JSON file, or return None if it does not exist"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return cls(**json.load(f))
+
+
+class SectionScore(BaseModel):
+    section: int
+    name: str
+    weight: float
+    earned: float
+    possible: float
+    # None when the section carries no weight or has no scored answers
+    score: Optional[float] = None
+
+
+class CandidateScores(BaseModel):
+    email: str
+    sections: List[SectionScore]
+    total: Optional[float] = None
+
+    def format_for_llm(self) -> str:
+        """Render the scores as a block the LLM can quote in its narrative"""
+        lines = ["Precomputed scores (computed from the scoring rules; use these values as given "
+                 "and do not recalculate them):"]
+        for s in self.sections:
+            if s.weight == 0:
+                lines.append(f"- Section {s.section}: {s.name}: no score assigned")
+            elif s.score is None:
+                lines.append(f"- Section {s.section}: {s.name}: no scored answers")
+            else:
+                lines.append(f"- Section {s.section}: {s.name}: {s.score:g} / {s.weight:g} "
+                             f"({s.earned:g} of {s.possible:g} points)")
+        if self.total is not None:
+            lines.append(f"- Total score: {self.total:g} / 100")
+        return '\n'.join(lines)
+
+
+class ScoringEngine:
+    """
+    Apply the SYSTEM_PROMPT scoring rules locally.
+
+    Answers are mapped to points column by column with pandas, so the same
+    code scores one candidate or every row of a sheet at once. Each scored
+    question is worth one point: full for Agree-or-above and Yes, half for
+    Neutral, none otherwise; unanswered questions are not counted. A section
+    scores ``weight * earned / possible``, and the total is rescaled to 100
+    over the weighted sections that have scored answers.
+    """
+
+    def __init__(self, config: ScoringConfig):
+        self.config = config
+
+    def _column_rule(self, sheet_id: str, column: str) -> Tuple[Optional[int], str]:
+        rule = self.config.questions.get(column)
+        section = rule.section if rule and rule.section is not None else self.config.sheet_sections.get(sheet_id)
+        return section, (rule.type if rule else 'auto')
+
+    def section_of(self, sheet_id: str, column: str) -> Optional[int]:
+        """Section a column belongs to, or None if it is not mapped"""
+        return self._column_rule(sheet_id, column)[0]
+
+    def _scored_rules(self, sheet_id: str, columns) -> Dict[str, Tuple[int, str]]:
+        """Section and type of the columns that carry points"""
+        rules = {column: self._column_rule(sheet_id, column) for column in columns}
+        return {column: (section, kind) for column, (section, kind) in rules.items()
+                if section in SECTIONS and kind not in UNSCORED_TYPES}
+
+    def split_by_section(self, data) -> Dict[Optional[int], Dict[str, List[Dict]]]:
+        """
+        Split a candidate's ResponseData.sheet_data by survey section.
+
+        Returns:
+            Section number (None for unmapped columns) -> sheet data holding
+            only that section's questions
+        """
+        split: Dict[Optional[int], Dict[str, List[Dict]]] = {}
+        for sheet_id, responses in data.sheet_data.items():
+            for r in responses:
+                by_section: Dict[Optional[int], Dict] = {}
+                for question, answer in r['responses'].items():
+                    section = self._column_rule(sheet_id, question)[0]
+                    by_section.setdefault(section, {})[question] = answer
+                for section, answers in by_section.items():
+                    split.setdefault(section, {}).setdefault(sheet_id, []).append({**r, 'responses': answers})
+        return split
+
+    def section_points(self, sheet_id: str, answers: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Score every row of ``answers`` (one column per question).
+
+        Returns:
+            Two frames with one column per section number: points earned and
+            points possible for each row
+        """
+        rules = self._scored_rules(sheet_id, answers.columns)
+        scored = list(rules)
+
+        # One long Series of (row, column) -> answer. Answers repeat a lot, so
+        # normalize and score each distinct value once and broadcast by code
+        values = answers[scored].stack()
+        codes, uniques = pd.factorize(values)
+        normalized = pd.Index(uniques).astype(str).str.strip().str.lower()
+        points = normalized.map(ANSWER_POINTS).to_numpy(dtype=float)[codes]
+        columns = values.index.get_level_values(1)
+        scale_columns = [column for column in scored if rules[column][1] == 'scale']
+        if scale_columns:
+            is_scale = columns.isin(scale_columns)
+            points[is_scale] = normalized.map(SCALE_POINTS).to_numpy(dtype=float)[codes[is_scale]]
+
+        grouped = pd.DataFrame({
+            'row': values.index.get_level_values(0),
+            'section': columns.map({column: rules[column][0] for column in scored}),
+            'points': points,
+        }).groupby(['row', 'section'])['points']
+        shape = {'index': answers.index, 'columns': list(SECTIONS), 'fill_value': 0.0}
+        earned = grouped.sum().unstack().reindex(**shape).fillna(0.0)
+        possible = grouped.count().unstack().reindex(**shape).fillna(0.0).astype(float)
+        return earned, possible
+
+    @staticmethod
+    def _totals(earned: pd.DataFrame, possible: pd.DataFrame) -> pd.DataFrame:
+        weights = pd.Series({n: float(w) for n, (_, w) in SECTIONS.items()})
+        ratio = earned / possible.where(possible > 0)
+        scores = ratio.mul(weights, axis=1)
+        scores.loc[:, weights[weights == 0].index] = float('nan')
+        answered_weight = ratio.notna().mul(weights, axis=1).sum(axis=1)
+        total = scores.sum(axis=1, min_count=1) * 100 / answered_weight.where(answered_weight > 0)
+        result = scores.round(1).add_prefix('section_')
+        result['total'] = total.round(1)
+        return result
+
+    def score_responses(self, data) -> CandidateScores:
+        """
+        Score one candidate's ResponseData.
+
+        Only the latest submission in each sheet is scored.
+        """
+        earned = pd.DataFrame(0.0, index=[0], columns=list(SECTIONS))
+        possible = pd.DataFrame(0.0, index=[0], columns=list(SECTIONS))
+        for sheet_id, responses in data.sheet_data.items():
+            if not responses:
+                continue
+            answers = pd.DataFrame([responses[-1]['responses']])
+            sheet_earned, sheet_possible = self.section_points(sheet_id, answers)
+            earned += sheet_earned
+            possible += sheet_possible
+
+        totals = self._totals(earned, possible).iloc[0]
+        sections = [
+            SectionScore(
+                section=n, name=name, weight=weight,
+                earned=float(earned.at[0, n]), possible=float(possible.at[0, n]),
+                score=None if pd.isna(totals[f'section_{n}']) else float(totals[f'section_{n}'])
+            )
+            for n, (name, weight) in SECTIONS.items()
+        ]
+        total = None if pd.isna(totals['total']) else float(totals['total'])
+        return CandidateScores(email=data.email, sections=sections, total=total)
+
+    def score_cohort(self, stores: Dict[str, SheetStore]) -> pd.DataFrame:
+        """
+        Score every candidate found in the given sheet stores.
+
+        Args:
+            stores: Sheet id -> SheetStore with all rows of that sheet
+
+        Returns:
+            Frame indexed by lowercased email with ``section_<n>`` and
+            ``total`` columns
+        """
+        earned_parts = []
+        possible_parts = []
+        for sheet_id, store in stores.items():
+            if not len(store) or store.email_column not in store.headers:
+                continue
+            # Only each candidate's latest submission and the scored columns
+            # are converted to pandas
+            latest = store.latest_positions()
+            pick = itemgetter(*latest.values())
+            rules = self._scored_rules(sheet_id, store.headers)
+            answers = pd.DataFrame(
+                {h: list(pick(column)) if len(latest) > 1 else [pick(column)]
+                 for h, column in zip(store.headers, store.columns) if h in rules},
+                index=pd.Index(list(latest), dtype=object)
+            )
+            sheet_earned, sheet_possible = self.section_points(sheet_id, answers)
+            earned_parts.append(sheet_earned)
+            possible_parts.append(sheet_possible)
+
+        if not earned_parts:
+            return self._totals(pd.DataFrame(columns=list(SECTIONS), dtype=float),
+                                pd.DataFrame(columns=list(SECTIONS), dtype=float))
+        earned = pd.concat(earned_parts).groupby(level=0).sum()
+        possible = pd.concat(possible_parts).groupby(level=0).sum()
+        return self._totals(earned, possible)
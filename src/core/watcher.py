@@ -0,0 +1,214 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from ..utils import metrics, quota
+from ..utils.files import atomic_write
+from .booster import InterviewBooster
+
+# Columns that identify a submission; Google Forms updates the timestamp when
+# a response is edited, so an edit shows up as a changed row
+KEY_COLUMNS = ['Timestamp', 'Email Address']
+
+
+class TokenBudget:
+    """
+    Tokens spent on LLM calls today, counted from the metrics records.
+
+    Only uncached completions are counted. The count resets when the local
+    date changes.
+    """
+
+    def __init__(self, limit: int, date: str = '', spent: int = 0):
+        self.limit = limit
+        self.date = date
+        self.spent = spent
+        self._lock = threading.Lock()
+
+    def _roll(self):
+        today = time.strftime('%Y-%m-%d')
+        if self.date != today:
+            self.date, self.spent = today, 0
+
+    def __call__(self, record: Dict):
+        if record['stage'] not in ('llm.complete', 'llm.stream') or record.get('cached'):
+            return
+        tokens = (record.get('prompt_tokens') or 0) + (record.get('completion_tokens') or 0)
+        with self._lock:
+            self._roll()
+            self.spent += tokens
+
+    def exhausted(self) -> bool:
+        """True once today's spend reaches the limit; a limit of 0 means no limit"""
+        with self._lock:
+            self._roll()
+            return self.limit > 0 and self.spent >= self.limit
+
+
+class SubmissionWatcher:
+    """
+    Pre-generate reports for candidates with new or changed submissions.
+
+    Each poll reads only the timestamp and email columns of every sheet and
+    diffs them against the rows seen by the previous poll. Candidates whose
+    rows were added or changed get their report generated in the background,
+    which fills the LLM response cache, so the report is served from the
+    cache when someone asks for it later. An app running in another process
+    reads the edited rows once its own snapshot expires; see
+    ``SheetsClient.get_sheet_data``.
+
+    The rows seen, the candidates still waiting and today's token spend are
+    saved to ``state_path`` after every poll, so a restarted watcher neither
+    regenerates reports nor forgets pending ones. On the very first poll the
+    existing rows are only recorded, unless ``backfill`` is set.
+
+    Args:
+        booster: InterviewBooster used to fetch responses and write reports
+        state_path: JSON file holding the watcher state
+        max_concurrency: Reports generated at once
+        daily_token_budget: Prompt plus completion tokens spent per day before
+            pre-generation pauses until the next day (0 for no limit). Reports
+            already running when it is reached still finish
+        backfill: Also pre-generate for every existing submission on the first poll
+    """
+
+    def __init__(self, booster: InterviewBooster, state_path: str, max_concurrency: int = 2,
+                 daily_token_budget: int = 0, backfill: bool = False):
+        self.booster = booster
+        self.state_path = state_path
+        self.max_concurrency = max(1, max_concurrency)
+        self.backfill = backfill
+        self.budget = TokenBudget(daily_token_budget)
+        # Sheet id -> header row and one key per data row, as of the last poll
+        self.seen: Dict[str, Dict] = {}
+        self.pending: List[str] = []
+        self._running: Dict[str, Future] = {}
+        self._paused = False
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='pregenerate')
+        self._load()
+        metrics.add_hook(self.budget)
+
+    def _load(self):
+        if not os.path.exists(self.state_path):
+            return
+        with open(self.state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        self.seen = state.get('sheets', {})
+        self.pending = state.get('pending', [])
+        budget = state.get('budget', {})
+        self.budget.date, self.budget.spent = budget.get('date', ''), budget.get('spent', 0)
+
+    def _save(self):
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state = {
+            'sheets': self.seen,
+            'pending': self.pending + [e for e in self._running if e not in self.pending],
+            'budget': {'date': self.budget.date, 'spent': self.budget.spent},
+        }
+        atomic_write(self.state_path, json.dumps(state).encode('utf-8'))
+
+    def _changed_emails(self, sheet_id: str) -> Set[str]:
+        """Emails of the rows added or changed in one sheet since the last poll"""
+        sheets_client = self.booster.sheets_client
+        previous = self.seen.get(sheet_id)
+        headers, columns = sheets_client.get_columns(
+            sheet_id, KEY_COLUMNS, previous['headers'] if previous else None)
+        emails = [e.strip().lower() for e in columns.get('Email Address', [])]
+        timestamps = columns.get('Timestamp', [''] * len(emails))
+        keys = [f'{t}\t{e}' for t, e in zip(timestamps, emails)]
+        self.seen[sheet_id] = {'headers': headers, 'rows': keys}
+
+        if previous is None and not self.backfill:
+            return set()
+        # Compared as a set, so sorting or deleting rows in the sheet is not a change
+        old = set(previous['rows']) if previous else set()
+        changed = {email for key, email in zip(keys, emails) if email and key not in old}
+        if changed:
+            # The booster's snapshot of this sheet may predate the changes
+            sheets_client.invalidate(sheet_id)
+        return changed
+
+    def poll(self) -> List[str]:
+        """
+        Check every sheet once and start reports for changed candidates.
+
+        Returns:
+            The candidates found with new or changed submissions
+        """
+        found: Set[str] = set()
+        for sheet_id in self.booster.sheet_ids:
+            try:
+                with quota.priority(quota.BACKGROUND):
+                    found |= self._changed_emails(sheet_id)
+            except Exception as e:
+                print(f"Error polling sheet {sheet_id}: {e}")
+        self.pending.extend(sorted(e for e in found if e not in self.pending))
+        self._dispatch()
+        self._save()
+        return sorted(found)
+
+    def _dispatch(self):
+        for email, future in list(self._running.items()):
+            if future.done():
+                del self._running[email]
+        # Candidates that changed again while their report runs go after it
+        waiting = []
+        while self.pending and len(self._running) < self.max_concurrency:
+            if self.budget.exhausted():
+                if not self._paused:
+                    print(f"Daily token budget of {self.budget.limit} reached, "
+                          f"{len(self.pending)} reports wait for tomorrow")
+                self._paused = True
+                break
+            self._paused = False
+            email = self.pending.pop(0)
+            if email in self._running:
+                waiting.append(email)
+                continue
+            self._running[email] = self._pool.submit(self._pregenerate, email)
+        self.pending = waiting + self.pending
+
+    def _pregenerate(self, email: str):
+        start = time.perf_counter()
+        try:
+            with quota.priority(quota.BACKGROUND):
+                data = self.booster.get_all_responses(email)
+            if not any(data.sheet_data.values()):
+                return
+            self.booster.generate_report(data)
+            print(f"Pre-generated report for {email} ({time.perf_counter() - start:.1f}s)")
+        except Exception as e:
+            print(f"Pre-generating report for {email} failed: {e}")
+
+    def run(self, interval: float, stop: Optional[threading.Event] = None):
+        """Poll every ``interval`` seconds until ``stop`` is set"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            found = self.poll()
+            if found:
+                print(f"{len(found)} candidates with new submissions, {len(self.pending)} waiting")
+            # Start waiting reports as others finish, between polls of the sheets
+            deadline = time.monotonic() + interval
+            while not stop.wait(min(1.0, max(0.0, deadline - time.monotonic()))):
+                if time.monotonic() >= deadline:
+                    break
+                self._dispatch()
+
+    def wait(self):
+        """Block until the started reports, and those the budget allows after them, have finished"""
+        while self._running:
+            for future in list(self._running.values()):
+                future.result()
+            self._dispatch()
+
+    def close(self):
+        """Wait for running reports, stop counting tokens and save the state"""
+        self._pool.shutdown(wait=True)
+        self._running.clear()
+        metrics.remove_hook(self.budget)
+        self._save()
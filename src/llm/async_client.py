@@ -0,0 +1,204 @@
+import asyncio
+import concurrent.futures
+import queue
+import random
+import threading
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+import openai
+
+from ..config import settings
+
+# Errors worth retrying: throttling, server faults and transport problems
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+
+_STREAM_END = object()
+
+
+class _Runtime:
+    """
+    Background event loop shared by every AsyncLLMClient in the process.
+
+    Running all requests on one loop lets the pooled HTTP clients and the
+    global in-flight limit be shared by sync callers, Streamlit sessions and
+    async callers on other loops alike.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='llm-event-loop', daemon=True)
+        self.thread.start()
+        self.clients: Dict[tuple, openai.AsyncOpenAI] = {}
+        self.limiter = asyncio.Semaphore(settings.LLM_MAX_IN_FLIGHT)
+        self.lock = threading.Lock()
+
+    def get_client(self, api_key: str, base_url: str) -> openai.AsyncOpenAI:
+        with self.lock:
+            key = (api_key, base_url)
+            if key not in self.clients:
+                # Retries are handled by AsyncLLMClient so backoff is shared
+                self.clients[key] = openai.AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+            return self.clients[key]
+
+
+_runtime: Optional[_Runtime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> _Runtime:
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = _Runtime()
+        return _runtime
+
+
+class AsyncLLMClient:
+    """
+    Async chat completion client with retries and a concurrency limit.
+
+    All clients share one ``openai.AsyncOpenAI`` per endpoint and, unless
+    ``max_in_flight`` is given, one process-wide limit of
+    ``LLM_MAX_IN_FLIGHT`` concurrent requests. Rate-limit (429), 5xx,
+    timeout and connection errors are retried with exponential backoff and
+    full jitter, honouring ``Retry-After`` when the server sends it.
+
+    The coroutine methods can be awaited from any event loop; the ``*_sync``
+    methods block the calling thread instead.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 model: Optional[str] = None, max_in_flight: Optional[int] = None,
+                 max_retries: Optional[int] = None, timeout: Optional[float] = None,
+                 client: Optional[openai.AsyncOpenAI] = None):
+        self.runtime = get_runtime()
+        self.client = client or self.runtime.get_client(
+            api_key or settings.DEEPSEEK_API_KEY, base_url or settings.LLM_BASE_URL
+        )
+        self.model = model or settings.LLM_MODEL
+        self.limiter = asyncio.Semaphore(max_in_flight) if max_in_flight else self.runtime.limiter
+        self.max_retries = settings.LLM_MAX_RETRIES if max_retries is None else max_retries
+        self.timeout = settings.LLM_TIMEOUT if timeout is None else timeout
+        self.backoff_base = settings.LLM_BACKOFF_BASE
+        self.backoff_max = settings.LLM_BACKOFF_MAX
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the shared event loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.runtime.loop)
+
+    async def _complete(self, messages: List[Dict], **kwargs):
+        attempt = 0
+        while True:
+            try:
+                async with self.limiter:
+                    return await self.client.chat.completions.create(
+                        model=self.model, messages=messages, timeout=self.timeout, **kwargs
+                    )
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                print(f"LLM request failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _stream(self, messages: List[Dict], emit: Callable[[object], None],
+                      on_usage: Optional[Callable[[object], None]] = None, **kwargs):
+        """
+        Stream a completion, passing each text delta to ``emit``.
+
+        The final chunk's token ``usage`` is passed to ``on_usage``.
+        """
+        attempt = 0
+        started = False
+        try:
+            while True:
+                try:
+                    async with self.limiter:
+                        stream = await self.client.chat.completions.create(
+                            model=self.model, messages=messages, timeout=self.timeout,
+                            stream=True, stream_options={'include_usage': True}, **kwargs
+                        )
+                        try:
+                            async for chunk in stream:
+                                if getattr(chunk, 'usage', None) is not None and on_usage is not None:
+                                    on_usage(chunk.usage)
+                                if not chunk.choices:
+                                    continue
+                                text = chunk.choices[0].delta.content
+                                if text:
+                                    started = True
+                                    emit(text)
+                        finally:
+                            # Closing the response also stops generation when the stream is cancelled
+                            if hasattr(stream, 'close'):
+                                await stream.close()
+                    emit(_STREAM_END)
+                    return
+                except RETRYABLE_ERRORS as e:
+                    # Text already shown to the caller cannot be taken back
+                    if started or attempt >= self.max_retries:
+                        raise
+                    delay = self._retry_delay(attempt, e)
+                    print(f"LLM stream failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                    attempt += 1
+                    await asyncio.sleep(delay)
+        except Exception as e:
+            emit(e)
+
+    async def complete(self, messages: List[Dict], **kwargs):
+        """Create a chat completion and return the response object"""
+        return await asyncio.wrap_future(self.submit(self._complete(messages, **kwargs)))
+
+    def complete_sync(self, messages: List[Dict], **kwargs):
+        return self.submit(self._complete(messages, **kwargs)).result()
+
+    async def stream(self, messages: List[Dict], on_usage: Optional[Callable[[object], None]] = None,
+                     **kwargs) -> AsyncIterator[str]:
+        """Yield the text deltas of a streamed chat completion"""
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        future = self.submit(self._stream(messages, lambda item: loop.call_soon_threadsafe(chunks.put_nowait, item),
+                                          on_usage, **kwargs))
+        try:
+            while True:
+                item = await chunks.get()
+                if item is _STREAM_END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # A reader that stops early must not keep paying for the completion or hold its slot
+            future.cancel()
+
+    def stream_sync(self, messages: List[Dict], on_usage: Optional[Callable[[object], None]] = None,
+                    **kwargs) -> Iterator[str]:
+        """Like stream(), but block the calling thread between chunks"""
+        chunks: queue.Queue = queue.Queue()
+        future = self.submit(self._stream(messages, chunks.put, on_usage, **kwargs))
+        try:
+            while True:
+                item = chunks.get()
+                if item is _STREAM_END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
@@ -0,0 +1,64 @@
+import hashlib
+import json
+import threading
+from typing import Dict, Optional
+
+from ..utils.files import LRUFiles, atomic_write
+
+
+class ResponseCache:
+    """
+    On-disk cache of LLM completions keyed by a hash of the full request.
+
+    The key covers the model name, the system prompt and the exact user
+    message, so editing the prompt invalidates old entries automatically.
+    Entries are files whose modification time is refreshed on every hit;
+    when the total size exceeds ``max_bytes`` the least recently used
+    entries are removed.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._files = LRUFiles(directory, max_bytes, ['.json'])
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_content: str) -> str:
+        payload = json.dumps([model, system_prompt, user_content], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for ``key``, or None on a miss"""
+        try:
+            with open(self._files.path(key), 'r', encoding='utf-8') as f:
+                content = json.load(f)['content']
+            self._files.touch(key)
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def set(self, key: str, content: str):
+        """Store a completion and evict old entries past the size limit"""
+        data = json.dumps({'content': content}, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+
+        atomic_write(self._files.path(key), data)
+        with self._lock:
+            self._files.add(key, len(data))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._files),
+                'bytes': self._files.total_bytes(),
+            }
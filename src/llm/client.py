@@ -1,20 +1,142 @@
-import openai
+import concurrent.futures
+import time
+from typing import Iterator, Optional
 from ..config import settings
 from ..prompts.system_prompt import SYSTEM_PROMPT
+from .async_client import AsyncLLMClient
+from .cache import ResponseCache
+from ..utils import metrics
+
+
+# Prompt tokens DeepSeek served from its context cache, and the rest
+CACHE_USAGE_FIELDS = ('prompt_cache_hit_tokens', 'prompt_cache_miss_tokens')
+
+
+def _usage_fields(usage) -> dict:
+    """Token counts from a completion's ``usage`` for metrics records"""
+    if usage is None:
+        return {}
+    fields = {'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+              'completion_tokens': getattr(usage, 'completion_tokens', None)}
+    for name in CACHE_USAGE_FIELDS:
+        value = getattr(usage, name, None)
+        if value is not None:
+            fields[name] = value
+    return fields
+
 
 class LLMClient:
-    def __init__(self):
-        self.client = openai.OpenAI(
-            api_key=settings.DEEPSEEK_API_KEY,
-            base_url="https://api.deepseek.com"
-        )
-
-    def generate_feedback(self, user_data: str) -> str:
-        response = self.client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[
-                 {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": "Here are the user's survey responses:\n\n" + user_data}
-            ]
-        )
-        return response.choices[0].message.content
+    def __init__(self, cache: Optional[ResponseCache] = None,
+                 async_client: Optional[AsyncLLMClient] = None):
+        # Requests run on the shared async client; the methods here wrap it
+        self.async_client = async_client or AsyncLLMClient()
+        self.model = self.async_client.model
+        if cache is None and settings.LLM_CACHE_ENABLED:
+            cache = ResponseCache(settings.LLM_CACHE_DIR, settings.LLM_CACHE_MAX_BYTES)
+        self.cache = cache
+
+    def _prepare(self, user_data: str, system_prompt: Optional[str] = None, context: str = ''):
+        """
+        Build the chat messages and their cache key (None when caching is off).
+
+        The text shared by every candidate (system prompt, then ``context``)
+        comes first and the candidate's data last, so the provider's prompt
+        cache can reuse the longest possible prefix.
+        """
+        system_prompt = system_prompt or SYSTEM_PROMPT
+        user_content = "Here are the user's survey responses:\n\n" + user_data
+        if context:
+            user_content = context + "\n\n" + user_content
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(self.model, system_prompt, user_content)
+        messages = [
+             {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+        ]
+        return messages, key
+
+    def _cached(self, key: Optional[str], refresh: bool) -> Optional[str]:
+        if key is None or refresh:
+            return None
+        return self.cache.get(key)
+
+    def _store(self, key: Optional[str], content: Optional[str]):
+        if key is not None and content:
+            self.cache.set(key, content)
+
+    def generate_feedback(self, user_data: str, refresh: bool = False,
+                          system_prompt: Optional[str] = None, context: str = '') -> str:
+        """
+        Generate the feedback report for the formatted survey responses.
+
+        Args:
+            user_data: Output of InterviewBooster.format_for_llm
+            refresh: Skip the response cache lookup and store a fresh completion
+            system_prompt: Replaces SYSTEM_PROMPT, e.g. for per-section calls
+            context: Text shared by every candidate, e.g. the question dictionary
+                from InterviewBooster.question_context, sent before user_data
+
+        Returns:
+            The report text produced by the model
+        """
+        messages, key = self._prepare(user_data, system_prompt, context)
+        with metrics.stage('llm.complete', model=self.model, payload_chars=len(user_data)) as s:
+            cached = self._cached(key, refresh)
+            s.set(cached=cached is not None)
+            if cached is not None:
+                return cached
+
+            response = self.async_client.complete_sync(messages)
+            if s:
+                s.set(**_usage_fields(response.usage))
+        content = response.choices[0].message.content
+        self._store(key, content)
+        return content
+
+    async def agenerate_feedback(self, user_data: str, refresh: bool = False,
+                                 system_prompt: Optional[str] = None, context: str = '') -> str:
+        """Async version of generate_feedback()"""
+        messages, key = self._prepare(user_data, system_prompt, context)
+        with metrics.stage('llm.complete', model=self.model, payload_chars=len(user_data)) as s:
+            cached = self._cached(key, refresh)
+            s.set(cached=cached is not None)
+            if cached is not None:
+                return cached
+
+            response = await self.async_client.complete(messages)
+            if s:
+                s.set(**_usage_fields(response.usage))
+        content = response.choices[0].message.content
+        self._store(key, content)
+        return content
+
+    def submit_feedback(self, user_data: str, refresh: bool = False,
+                        system_prompt: Optional[str] = None, context: str = '') -> concurrent.futures.Future:
+        """Start generate_feedback() in the background and return its future"""
+        return self.async_client.submit(self.agenerate_feedback(user_data, refresh, system_prompt, context))
+
+    def stream_feedback(self, user_data: str, refresh: bool = False,
+                        system_prompt: Optional[str] = None, context: str = '') -> Iterator[str]:
+        """
+        Like generate_feedback(), but yield the report text as it is generated.
+
+        A cached report is yielded as a single chunk. A streamed completion is
+        cached once the stream has finished.
+        """
+        messages, key = self._prepare(user_data, system_prompt, context)
+        with metrics.stage('llm.stream', model=self.model, payload_chars=len(user_data)) as s:
+            cached = self._cached(key, refresh)
+            s.set(cached=cached is not None)
+            if cached is not None:
+                yield cached
+                return
+
+            parts = []
+            on_usage = (lambda usage: s.set(**_usage_fields(usage))) if s else None
+            for text in self.async_client.stream_sync(messages, on_usage=on_usage):
+                if not parts and s:
+                    s.set(first_chunk_seconds=round(time.perf_counter() - s.start, 6))
+                parts.append(text)
+                yield text
+        self._store(key, ''.join(parts))
@@ -0,0 +1,11 @@
+import math
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for DeepSeek/OpenAI-style BPE tokenizers.
+
+    English prose averages about four characters per token; this is only
+    meant for comparing payloads, not for enforcing context limits.
+    """
+    return math.ceil(len(text) / 4)
@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+from .files import LRUFiles, atomic_write
+
+
+class ArtifactStore:
+    """
+    Rendered PDF reports on disk, keyed by a hash of their content.
+
+    The key covers the final markdown and the candidate email (printed in the
+    PDF header), so identical reports are rendered once and never overwrite
+    each other. Lookups read the file directly, so artifacts stored by other
+    processes (the app, batch runs, the watcher) are found too. The
+    modification time of a PDF is refreshed on every hit; when the total size
+    exceeds ``max_bytes`` the least recently used artifacts are removed.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._files = LRUFiles(directory, max_bytes, ['.pdf'])
+
+    @staticmethod
+    def make_key(markdown_content: str, email: str) -> str:
+        payload = json.dumps([email.strip().lower(), markdown_content], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path(self, key: str) -> str:
+        """Path of the artifact's PDF"""
+        return self._files.path(key)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the PDF for ``key``, or None if it was never stored or has been evicted"""
+        try:
+            with open(self.path(key), 'rb') as f:
+                pdf_bytes = f.read()
+            self._files.touch(key)
+        except OSError:
+            return None
+        return pdf_bytes
+
+    def put(self, key: str, pdf_bytes: bytes) -> str:
+        """
+        Store a PDF and evict old ones past the size limit.
+
+        Returns:
+            The path of the stored PDF
+        """
+        atomic_write(self.path(key), pdf_bytes)
+        with self._lock:
+            self._files.add(key, len(pdf_bytes))
+        return self.path(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'artifacts': len(self._files),
+                'bytes': self._files.total_bytes(),
+            }
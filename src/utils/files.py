@@ -0,0 +1,116 @@
+import os
+import tempfile
+from typing import Dict, List, Optional, Sequence
+
+
+def atomic_write(path: str, data: bytes):
+    """
+    Write ``data`` to ``path`` so that readers see either the old file or the new one.
+
+    The bytes go to a temporary file in the same directory first, which then
+    replaces ``path``.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class LRUFiles:
+    """
+    Sizes of the entries in a directory, with least recently used eviction.
+
+    An entry is one or more files named ``<key><extension>``. The directory
+    may be shared by several processes (the app, the watcher and batch runs
+    write the same caches), so ``evict`` rescans it and the size cap applies
+    to all of them together. The modification time of an entry's first file
+    records its last use: ``touch`` it on every hit. Not thread-safe; callers
+    hold their own lock around ``add`` and ``evict``.
+
+    Args:
+        directory: Directory holding the entries, created if missing
+        max_bytes: Total size above which entries are evicted
+        extensions: File extensions of an entry, the first one being its main file
+    """
+
+    def __init__(self, directory: str, max_bytes: int, extensions: Sequence[str]):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.extensions = tuple(extensions)
+        os.makedirs(directory, exist_ok=True)
+        self.sizes: Dict[str, int] = self._scan()
+
+    def _scan(self) -> Dict[str, int]:
+        """Entry sizes as found on disk, including entries written by other processes"""
+        sizes: Dict[str, int] = {}
+        for name in os.listdir(self.directory):
+            key, ext = os.path.splitext(name)
+            if ext in self.extensions:
+                try:
+                    size = os.path.getsize(os.path.join(self.directory, name))
+                except OSError:
+                    # Evicted by another process in the meantime
+                    continue
+                sizes[key] = sizes.get(key, 0) + size
+        return sizes
+
+    def path(self, key: str, extension: Optional[str] = None) -> str:
+        return os.path.join(self.directory, key + (extension or self.extensions[0]))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.sizes
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def total_bytes(self) -> int:
+        return sum(self.sizes.values())
+
+    def touch(self, key: str):
+        """Mark an entry as just used; raises OSError if its file is gone"""
+        os.utime(self.path(key))
+
+    def add(self, key: str, size: int) -> List[str]:
+        """
+        Record an entry written to disk, then evict others past ``max_bytes``.
+
+        Returns:
+            The keys of the evicted entries
+        """
+        self.sizes[key] = size
+        return self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """Remove least recently used entries, except ``keep``, until the total fits ``max_bytes``"""
+        self.sizes = self._scan()
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return []
+
+        def last_used(key):
+            try:
+                return os.path.getmtime(self.path(key))
+            except OSError:
+                return 0.0
+
+        evicted = []
+        for key in sorted(self.sizes, key=last_used):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self.sizes.pop(key)
+            evicted.append(key)
+            for extension in self.extensions:
+                try:
+                    os.remove(self.path(key, extension))
+                except OSError:
+                    pass
+        return evicted
@@ -0,0 +1,213 @@
+import re
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.platypus import (
+    Flowable, ListFlowable, ListItem, Paragraph, Preformatted, Spacer, Table, TableStyle
+)
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_LIST_ITEM = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(.*)$')
+_TABLE_SEPARATOR = re.compile(r'^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$')
+_RULE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+
+# Inline markup, applied to already escaped text in a single substitution
+_INLINE = re.compile(
+    r'`([^`]+)`'                      # code
+    r'|\*\*(.+?)\*\*|__(.+?)__'       # bold
+    r'|\*(?!\s)(.+?)\*|\b_(.+?)_\b'   # italic
+    r'|\[([^\]]+)\]\(([^)\s]+)\)'     # link
+)
+
+
+def _inline_markup(match: re.Match) -> str:
+    code, bold, bold2, italic, italic2, link_text, url = match.groups()
+    if code is not None:
+        return f'<font face="Courier">{code}</font>'
+    if bold is not None or bold2 is not None:
+        return f'<b>{_INLINE.sub(_inline_markup, bold or bold2)}</b>'
+    if italic is not None or italic2 is not None:
+        return f'<i>{_INLINE.sub(_inline_markup, italic or italic2)}</i>'
+    return f'<link href="{url}" color="blue">{link_text}</link>'
+
+
+def inline_to_markup(text: str) -> str:
+    """Convert inline markdown (bold, italic, code, links) to reportlab paragraph markup"""
+    return _INLINE.sub(_inline_markup, escape(text))
+
+
+def _split_row(line: str) -> List[str]:
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+
+class MarkdownConverter:
+    """
+    Convert the LLM's markdown report straight into reportlab flowables.
+
+    The text is read line by line in one pass; headings, paragraphs, bullet
+    and numbered lists (nested by indentation), pipe tables, fenced code and
+    horizontal rules each become flowables as soon as their block ends.
+    Text is escaped before inline markup is added, so the result is always
+    valid paragraph markup.
+
+    Args:
+        styles: Stylesheet holding CustomHeading2, CustomHeading3 and CustomBodyText
+        width: Frame width in points, used to size table columns
+    """
+
+    def __init__(self, styles, width: float):
+        self.styles = styles
+        self.width = width
+        self.body = styles['CustomBodyText']
+        self.heading_styles = {
+            1: styles['Heading1'],
+            2: styles['CustomHeading2'],
+            3: styles['CustomHeading3'],
+        }
+
+    def convert(self, markdown_content: str) -> List[Flowable]:
+        story: List[Flowable] = []
+        paragraph: List[str] = []
+        # (indent, ordered, text) for the list being read
+        items: List[Tuple[int, bool, str]] = []
+        table: List[str] = []
+        code: Optional[List[str]] = None
+
+        def flush():
+            if paragraph:
+                self._add_paragraph(story, ' '.join(paragraph))
+                paragraph.clear()
+            if items:
+                i = 0
+                while i < len(items):
+                    flowable, i = self._list(items, i, len(items))
+                    story.append(flowable)
+                story.append(Spacer(1, 8))
+                items.clear()
+            if table:
+                self._add_table(story, table)
+                table.clear()
+
+        for line in markdown_content.splitlines():
+            if code is not None:
+                if line.lstrip().startswith('```'):
+                    story.append(Preformatted('\n'.join(code), self.styles['Code']))
+                    story.append(Spacer(1, 8))
+                    code = None
+                else:
+                    code.append(line)
+                continue
+
+            stripped = line.strip()
+            if not stripped:
+                flush()
+                continue
+            if stripped.startswith('```'):
+                flush()
+                code = []
+                continue
+
+            if stripped.startswith('|'):
+                if not table:
+                    flush()
+                table.append(stripped)
+                continue
+            if table:
+                flush()
+
+            heading = _HEADING.match(stripped)
+            if heading:
+                flush()
+                level = len(heading.group(1))
+                story.append(self._paragraph(heading.group(2), self.heading_styles.get(level, self.heading_styles[3])))
+                story.append(Spacer(1, 10 if level <= 2 else 6))
+                continue
+            if _RULE.match(stripped):
+                flush()
+                story.append(Spacer(1, 12))
+                continue
+
+            item = _LIST_ITEM.match(line)
+            if item:
+                if paragraph:
+                    flush()
+                indent = len(item.group(1).expandtabs(4))
+                items.append((indent, item.group(2)[0].isdigit(), item.group(3)))
+            elif items and line[:1].isspace():
+                # Indented continuation of the previous list item
+                indent, ordered, text = items[-1]
+                items[-1] = (indent, ordered, f'{text} {stripped}')
+            else:
+                if items:
+                    flush()
+                paragraph.append(stripped)
+
+        if code is not None:
+            story.append(Preformatted('\n'.join(code), self.styles['Code']))
+        flush()
+        return story
+
+    def _paragraph(self, text: str, style) -> Paragraph:
+        try:
+            return Paragraph(inline_to_markup(text), style)
+        except ValueError:
+            # Unbalanced inline markup: show the text as written
+            return Paragraph(escape(text), style)
+
+    def _add_paragraph(self, story: List[Flowable], text: str):
+        story.append(self._paragraph(text, self.body))
+        story.append(Spacer(1, 8))
+
+    def _list(self, items, start: int, end: int) -> Tuple[ListFlowable, int]:
+        """Build the list starting at ``items[start]``; deeper items become nested lists"""
+        indent, ordered, _ = items[start]
+        entries: List[List[Flowable]] = []
+        i = start
+        while i < end and items[i][0] >= indent:
+            if items[i][0] == indent and items[i][1] != ordered:
+                # Switching between bullets and numbers starts a new list
+                break
+            if items[i][0] > indent and entries:
+                # A deeper list belongs to the item before it
+                nested, i = self._list(items, i, end)
+                entries[-1].append(nested)
+                continue
+            entries.append([self._paragraph(items[i][2], self.body)])
+            i += 1
+        flowable = ListFlowable(
+            [ListItem(entry) for entry in entries],
+            bulletType='1' if ordered else 'bullet',
+            start=None if ordered else '•',
+            bulletFontName=self.body.fontName,
+            bulletFontSize=self.body.fontSize,
+            leftIndent=18,
+        )
+        return flowable, i
+
+    def _add_table(self, story: List[Flowable], lines: List[str]):
+        rows = [_split_row(line) for line in lines if not _TABLE_SEPARATOR.match(line)]
+        if not rows:
+            return
+        columns = max(len(row) for row in rows)
+        header = len(lines) > 1 and bool(_TABLE_SEPARATOR.match(lines[1]))
+        data = []
+        for r, row in enumerate(rows):
+            row = row + [''] * (columns - len(row))
+            data.append([self._paragraph(f'**{cell}**' if header and r == 0 and cell else cell, self.body)
+                         for cell in row])
+        table = Table(data, colWidths=[self.width / columns] * columns, repeatRows=1 if header else 0)
+        style = [
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]
+        if header:
+            style.append(('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey))
+        table.setStyle(TableStyle(style))
+        story.append(table)
+        story.append(Spacer(1, 8))
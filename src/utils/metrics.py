@@ -0,0 +1,135 @@
+"""
+Per-stage timing records for the report pipeline.
+
+Code wraps each stage in ``with stage('sheets.fetch', sheet_id=...) as s:``
+and may attach counters with ``s.set(rows=...)``. When a stage ends, one
+record (a flat dict with ``stage``, ``seconds``, ``ok`` and the fields) is
+passed to every registered hook. With no hooks registered ``stage`` returns a
+shared no-op object, so instrumentation costs one function call per stage;
+guard expensive counters with ``if s:``.
+"""
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List
+
+Hook = Callable[[Dict], None]
+
+_hooks: List[Hook] = []
+_hooks_lock = threading.Lock()
+_json_lines_paths: Dict[str, Hook] = {}
+
+
+def add_hook(hook: Hook):
+    """Call ``hook`` with every record from now on"""
+    global _hooks
+    with _hooks_lock:
+        # Replace rather than mutate so emitting threads never see a partial list
+        _hooks = _hooks + [hook]
+
+
+def remove_hook(hook: Hook):
+    global _hooks
+    with _hooks_lock:
+        _hooks = [h for h in _hooks if h is not hook]
+
+
+def enabled() -> bool:
+    return bool(_hooks)
+
+
+def emit(record: Dict):
+    """Pass a finished record to every hook; hook errors are reported, not raised"""
+    for hook in _hooks:
+        try:
+            hook(record)
+        except Exception as e:
+            print(f"Metrics hook failed: {e}")
+
+
+def record(name: str, **fields):
+    """Emit a record for something that is not timed, e.g. a cache hit"""
+    if _hooks:
+        emit({'stage': name, 'time': time.time(), **fields})
+
+
+class _Stage:
+    __slots__ = ('name', 'fields', 'start')
+
+    def __init__(self, name: str, fields: Dict):
+        self.name = name
+        self.fields = fields
+        self.start = 0.0
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+    def __enter__(self) -> '_Stage':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        emit({
+            'stage': self.name,
+            'time': time.time(),
+            'seconds': round(time.perf_counter() - self.start, 6),
+            'ok': exc_type is None,
+            **self.fields,
+        })
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def set(self, **fields):
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __enter__(self) -> '_NullStage':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str, **fields):
+    """Time a block of code and emit its record when it ends"""
+    if not _hooks:
+        return _NULL_STAGE
+    return _Stage(name, fields)
+
+
+class JsonLinesHook:
+    """Append each record as one JSON line to ``path``"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, record: Dict):
+        line = json.dumps(record, default=str) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+def enable_json_lines(path: str) -> Hook:
+    """Register a JsonLinesHook for ``path`` once per process"""
+    global _hooks
+    with _hooks_lock:
+        if path not in _json_lines_paths:
+            _json_lines_paths[path] = JsonLinesHook(path)
+        hook = _json_lines_paths[path]
+        if hook not in _hooks:
+            _hooks = _hooks + [hook]
+        return hook
@@ -0,0 +1,146 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import List, Optional
+
+from .store import SheetStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheets (
+    sheet_id TEXT PRIMARY KEY,
+    headers TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    sheet_id TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    email TEXT NOT NULL,
+    cells TEXT NOT NULL,
+    PRIMARY KEY (sheet_id, row_number)
+);
+CREATE INDEX IF NOT EXISTS rows_by_email ON rows (sheet_id, email);
+"""
+
+
+class SheetMirror:
+    """
+    Local SQLite copy of the survey sheets.
+
+    Each sheet's header row and data rows are stored together with the number
+    of rows already mirrored (the high-water mark), so a sync only appends
+    the rows submitted since the previous one, unless the header row or the
+    timestamp of a mirrored row has changed. Rows are indexed by lowercased
+    email address, which lets InterviewBooster serve requests without calling
+    the Sheets API.
+    """
+
+    def __init__(self, path: str, email_column: str = 'Email Address'):
+        self.path = path
+        self.email_column = email_column
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps the mirror thread-safe
+        return sqlite3.connect(self.path, timeout=30)
+
+    def sync(self, sheets_client, sheet_id: str, full: bool = False) -> int:
+        """
+        Bring one sheet up to date.
+
+        Args:
+            sheets_client: SheetsClient used to read the sheet
+            sheet_id: The spreadsheet key
+            full: Reload every row even if the header row is unchanged
+
+        Returns:
+            Number of rows written
+        """
+        state = self.get_state(sheet_id)
+        if state is not None and not full:
+            headers, row_count = state
+            # Google Forms rewrites a row's timestamp when its response is edited
+            new_rows = sheets_client.get_rows_after(sheet_id, headers, row_count,
+                                                    self._timestamps(sheet_id, headers))
+            if new_rows is not None:
+                self._write_rows(sheet_id, headers, row_count, new_rows, replace=False)
+                return len(new_rows)
+            print(f"Header row or existing rows changed for sheet {sheet_id}, reloading mirror")
+
+        store = sheets_client.get_sheet_store(sheet_id, use_cache=False)
+        rows = [store.row(p) for p in range(len(store))]
+        self._write_rows(sheet_id, store.raw_headers, 0, rows, replace=True)
+        return len(rows)
+
+    def _write_rows(self, sheet_id: str, headers: List[str], row_count: int,
+                    rows: List[List[str]], replace: bool):
+        email_index = headers.index(self.email_column) if self.email_column in headers else None
+        records = [
+            (sheet_id, row_count + i + 2,
+             (row[email_index] if email_index is not None and email_index < len(row) else '').lower(),
+             json.dumps(row))
+            for i, row in enumerate(rows)
+        ]
+        with closing(self._connect()) as conn, conn:
+            if replace:
+                conn.execute('DELETE FROM rows WHERE sheet_id = ?', (sheet_id,))
+            conn.executemany(
+                'INSERT OR REPLACE INTO rows (sheet_id, row_number, email, cells) VALUES (?, ?, ?, ?)',
+                records
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO sheets (sheet_id, headers, row_count, synced_at) VALUES (?, ?, ?, ?)',
+                (sheet_id, json.dumps(headers), row_count + len(rows), time.time())
+            )
+
+    def _timestamps(self, sheet_id: str, headers: List[str]) -> Optional[List[str]]:
+        """Timestamp column of the mirrored rows, in sheet order"""
+        if 'Timestamp' not in headers:
+            return None
+        column = headers.index('Timestamp')
+        with closing(self._connect()) as conn:
+            rows = conn.execute('SELECT cells FROM rows WHERE sheet_id = ? ORDER BY row_number',
+                                (sheet_id,)).fetchall()
+        cells = [json.loads(r[0]) for r in rows]
+        return [row[column] if column < len(row) else '' for row in cells]
+
+    def get_state(self, sheet_id: str) -> Optional[tuple]:
+        """Return ``(headers, row_count)`` for a mirrored sheet, or None"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                'SELECT headers, row_count FROM sheets WHERE sheet_id = ?', (sheet_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def get_emails(self, sheet_id: str) -> List[str]:
+        """Distinct lowercased email addresses mirrored for a sheet, in order of first submission"""
+        if self.get_state(sheet_id) is None:
+            raise LookupError(f"Sheet {sheet_id} has not been mirrored; run tools/sync.py first")
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT email FROM rows WHERE sheet_id = ? AND email != '' "
+                'GROUP BY email ORDER BY MIN(row_number)',
+                (sheet_id,)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def get_email_store(self, sheet_id: str, email: str) -> SheetStore:
+        """Rows submitted by ``email`` as a columnar store, in sheet order"""
+        state = self.get_state(sheet_id)
+        if state is None:
+            raise LookupError(f"Sheet {sheet_id} has not been mirrored; run tools/sync.py first")
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                'SELECT cells FROM rows WHERE sheet_id = ? AND email = ? ORDER BY row_number',
+                (sheet_id, email.lower())
+            ).fetchall()
+        return SheetStore(state[0], [json.loads(r[0]) for r in rows], self.email_column)
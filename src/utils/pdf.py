@@ -1,11 +1,19 @@
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
-import markdown2
+from xml.sax.saxutils import escape
+from .flowables import MarkdownConverter
+from . import metrics
+from .files import atomic_write
+import io
 import os
 import re
 
+MARGIN = 72
+# Width available to the report body on a letter page
+CONTENT_WIDTH = letter[0] - 2 * MARGIN
+
 class PDFGenerator:
     def __init__(self):
         self.styles = getSampleStyleSheet()
@@ -44,98 +52,97 @@ class PDFGenerator:
         if style.name not in self.styles:
             self.styles.add(style)
 
-    def create_report(self, markdown_content: str, email: str) -> str:
+    @staticmethod
+    def report_filename(email: str) -> str:
+        """File name for a candidate's report, with the email sanitized"""
+        safe_email = re.sub(r'[^\w\-_\.]', '_', email)
+        return f'{safe_email}_report.pdf'
+
+    def render(self, markdown_content: str, email: str) -> bytes:
         """
-        Create a PDF report from markdown content.
+        Render a PDF report from markdown content in memory.
         
         Args:
             markdown_content: The markdown content to convert to PDF
-            email: The email of the candidate for the filename
+            email: The email of the candidate for the report header
             
         Returns:
-            The path to the generated PDF file
+            The PDF file contents
         """
-        # Ensure reports directory exists
-        os.makedirs('reports', exist_ok=True)
-        
-        # Create a sanitized filename from the email
-        safe_email = re.sub(r'[^\w\-_\.]', '_', email)
-        pdf_path = f'reports/{safe_email}_report.pdf'
-        
-        # Create the PDF document
-        doc = SimpleDocTemplate(
-            pdf_path, 
-            pagesize=letter,
-            rightMargin=72, 
-            leftMargin=72,
-            topMargin=72, 
-            bottomMargin=72
-        )
-        
-        # Convert markdown to HTML
-        try:
-            html = markdown2.markdown(
-                markdown_content,
-                extras=['tables', 'fenced-code-blocks']
-            )
-        except Exception as e:
-            # Fallback to plain text if markdown conversion fails
-            html = f"<p>{markdown_content}</p>"
-        
-        # Build the PDF content
-        story = []
-        
-        # Add header
-        story.append(Paragraph(f"<b>Interview Report for {email}</b>", self.styles['Heading1']))
-        story.append(Spacer(1, 20))
-        
-        # Process content with proper handling of markdown elements
-        sections = html.split('<h2>')
-        
-        # Process the first section (if any)
-        if sections:
-            first_section = sections[0].replace('<p>', '').replace('</p>', '')
-            for paragraph in first_section.split('<br />'):
-                if paragraph.strip():
-                    story.append(Paragraph(paragraph, self.styles['CustomBodyText']))
-                    story.append(Spacer(1, 8))
-        
-        # Process any h2 sections
-        for i in range(1, len(sections)):
-            section = sections[i]
-            if section.strip():
-                # Extract the heading
-                if '</h2>' in section:
-                    heading, content = section.split('</h2>', 1)
-                    story.append(Paragraph(heading, self.styles['CustomHeading2']))
-                    story.append(Spacer(1, 10))
-                    
-                    # Process the content
-                    content = content.replace('<p>', '').replace('</p>', '')
-                    for paragraph in content.split('<br />'):
-                        if paragraph.strip():
-                            story.append(Paragraph(paragraph, self.styles['CustomBodyText']))
-                            story.append(Spacer(1, 8))
-                else:
-                    # No heading found, just process the content
-                    for paragraph in section.split('<br />'):
-                        if paragraph.strip():
-                            story.append(Paragraph(paragraph, self.styles['CustomBodyText']))
-                            story.append(Spacer(1, 8))
-        
-        # Build the PDF
+        with metrics.stage('pdf.render', markdown_chars=len(markdown_content)) as s:
+            pdf_bytes = self._render(markdown_content, email)
+            s.set(bytes=len(pdf_bytes))
+        return pdf_bytes
+
+    def _render(self, markdown_content: str, email: str) -> bytes:
+        buffer = io.BytesIO()
         try:
-            doc.build(story)
-            return pdf_path
+            self._build(buffer, self._build_story(markdown_content, email))
         except Exception as e:
             # If there's an error building the PDF, create a simple version
-            doc = SimpleDocTemplate(pdf_path, pagesize=letter)
+            buffer = io.BytesIO()
             story = [
-                Paragraph(f"<b>Interview Report for {email}</b>", self.styles['Heading1']),
+                Paragraph(f"<b>Interview Report for {escape(email)}</b>", self.styles['Heading1']),
                 Spacer(1, 20),
                 Paragraph("Error creating formatted report. Displaying plain text:", self.styles['CustomBodyText']),
                 Spacer(1, 10),
-                Paragraph(markdown_content, self.styles['CustomBodyText'])
+                Paragraph(escape(markdown_content), self.styles['CustomBodyText'])
             ]
-            doc.build(story)
-            return pdf_path
+            SimpleDocTemplate(buffer, pagesize=letter).build(story)
+        return buffer.getvalue()
+
+    def create_report(self, markdown_content: str, email: str, output_dir: str = 'reports') -> str:
+        """
+        Create a PDF report from markdown content and save it to disk.
+        
+        Args:
+            markdown_content: The markdown content to convert to PDF
+            email: The email of the candidate for the filename
+            output_dir: Directory the PDF is written to
+            
+        Returns:
+            The path to the generated PDF file
+        """
+        return self.save(self.render(markdown_content, email), email, output_dir)
+
+    def save(self, pdf_bytes: bytes, email: str, output_dir: str = 'reports') -> str:
+        """Write rendered PDF bytes to ``output_dir`` and return the file path"""
+        os.makedirs(output_dir, exist_ok=True)
+        pdf_path = os.path.join(output_dir, self.report_filename(email))
+        atomic_write(pdf_path, pdf_bytes)
+        return pdf_path
+
+    def _build(self, buffer, story):
+        doc = SimpleDocTemplate(
+            buffer, 
+            pagesize=letter,
+            rightMargin=MARGIN, 
+            leftMargin=MARGIN,
+            topMargin=MARGIN, 
+            bottomMargin=MARGIN
+        )
+        doc.build(story)
+
+    def _build_story(self, markdown_content: str, email: str) -> list:
+        """Convert the markdown report into a list of reportlab flowables"""
+        story = [
+            Paragraph(f"<b>Interview Report for {escape(email)}</b>", self.styles['Heading1']),
+            Spacer(1, 20),
+        ]
+        story.extend(MarkdownConverter(self.styles, CONTENT_WIDTH).convert(markdown_content))
+        return story
+
+
+_process_generator = None
+
+
+def render_report_file(markdown_content: str, email: str, output_dir: str) -> str:
+    """
+    Render and save one report, reusing a PDFGenerator per process.
+
+    Module-level so it can run as a ProcessPoolExecutor task.
+    """
+    global _process_generator
+    if _process_generator is None:
+        _process_generator = PDFGenerator()
+    return _process_generator.create_report(markdown_content, email, output_dir)
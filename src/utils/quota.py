@@ -0,0 +1,297 @@
+"""
+Shared rate limiting for Google Sheets API reads.
+
+Every SheetsClient call that reaches the API first takes tokens from one
+bucket, refilled at ``SHEETS_READS_PER_MINUTE``. With ``SHEETS_QUOTA_PATH``
+set the bucket lives in a SQLite file, so the app, batch runs and the
+submission watcher share it even though they run as separate processes.
+Waiting callers are served by priority, then in arrival order, so a coach
+waiting on the app goes ahead of batch runs and the watcher. Code sets its
+priority with ``with priority(BACKGROUND):``; it applies to the calls made in
+that context (copy the context when handing work to other threads).
+"""
+import contextvars
+import heapq
+import itertools
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing, contextmanager
+from typing import Callable, Optional, TypeVar
+
+from . import metrics
+
+INTERACTIVE = 0
+BATCH = 1
+BACKGROUND = 2
+
+_priority = contextvars.ContextVar('sheets_priority', default=INTERACTIVE)
+
+T = TypeVar('T')
+
+
+@contextmanager
+def priority(level: int):
+    """Run the Sheets calls in this block at ``level`` (INTERACTIVE, BATCH or BACKGROUND)"""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+def is_quota_error(error: Exception) -> bool:
+    """True for HTTP 429 errors, as raised by gspread's APIError"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(error, 'code', None)
+    return status == 429
+
+
+class QuotaScheduler:
+    """
+    Token bucket with prioritized waiters and shared backoff.
+
+    Args:
+        reads_per_minute: Refill rate; 0 disables the limit
+        burst: Bucket size, i.e. reads allowed at once after an idle period
+        max_retries: Retries of a call rejected with a quota error
+        backoff_base: First backoff in seconds, doubled on every retry
+        backoff_max: Upper bound of one backoff in seconds
+    """
+
+    def __init__(self, reads_per_minute: float, burst: int = 10, max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.rate = reads_per_minute / 60
+        self.capacity = max(1, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        # A quota error stops every caller until then
+        self._paused_until = 0.0
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float):
+        # During a pause _updated lies ahead, so nothing is credited until the pause ends
+        if now > self._updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _take(self, reads: int, level: int, since: float) -> float:
+        """Take ``reads`` tokens for the first waiter; returns 0 if taken, else the seconds to wait"""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        if self.tokens >= reads:
+            self.tokens -= reads
+            return 0.0
+        return (reads - self.tokens) / self.rate
+
+    def _leave(self):
+        """Called when the first waiter gives up without taking tokens"""
+
+    def acquire(self, reads: int = 1, level: Optional[int] = None):
+        """Block until ``reads`` tokens are available and this caller is first in line"""
+        level = current_priority() if level is None else level
+        reads = min(reads, self.capacity)
+        with self._condition:
+            entry = (level, next(self._sequence))
+            since = time.time()
+            heapq.heappush(self._waiters, entry)
+            taken = False
+            try:
+                while True:
+                    delay = None
+                    if self._waiters[0] == entry:
+                        delay = self._take(reads, level, since)
+                        if delay <= 0:
+                            taken = True
+                            break
+                    # Only the first waiter times its wait; the others are woken when it leaves
+                    self._condition.wait(delay)
+            finally:
+                if not taken:
+                    self._leave()
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def _pause(self, seconds: float):
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # The bucket starts refilling empty once the pause is over
+        self.tokens = 0.0
+        self._updated = self._paused_until
+
+    def pause(self, seconds: float):
+        """Hold every caller for ``seconds``, e.g. after the API reported the quota exhausted"""
+        with self._condition:
+            self._pause(seconds)
+            self._condition.notify_all()
+
+    def _retry_delay(self, attempt: int) -> float:
+        return random.uniform(self.backoff_base, min(self.backoff_max, self.backoff_base * 2 ** (attempt + 1)))
+
+    def call(self, fn: Callable[[], T], reads: int = 1) -> T:
+        """
+        Run one API call under the quota.
+
+        Quota errors pause the whole bucket with exponential backoff and
+        jitter, then the call is retried; other errors are raised at once.
+        """
+        attempt = 0
+        while True:
+            self.acquire(reads)
+            try:
+                return fn()
+            except Exception as e:
+                if not is_quota_error(e) or attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                print(f"Sheets read quota exceeded, retrying in {delay:.1f}s")
+                metrics.record('sheets.throttled', attempt=attempt + 1, delay=round(delay, 3))
+                self.pause(delay)
+                attempt += 1
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bucket (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    paused_until REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    owner TEXT PRIMARY KEY,
+    level INTEGER NOT NULL,
+    since REAL NOT NULL,
+    seen REAL NOT NULL
+);
+"""
+
+
+class SharedQuotaScheduler(QuotaScheduler):
+    """
+    QuotaScheduler whose bucket is kept in a SQLite file.
+
+    Every process opening the same file draws from one bucket, which matters
+    because the app, tools/batch.py and tools/watch.py read with the same
+    service account and so share its quota. Each process still orders its
+    own callers; its first waiter registers its priority in the file and
+    only takes tokens when no other process has a waiter of higher priority,
+    or of the same priority that arrived earlier. A quota error pauses every
+    process.
+
+    Args:
+        path: SQLite file holding the bucket
+        reads_per_minute, burst, max_retries, backoff_base, backoff_max: As
+            for QuotaScheduler
+    """
+
+    # Longest wait of a first waiter before it looks at the other processes again
+    POLL = 0.25
+    # Waiters not seen for this long belong to a process that has exited
+    STALE = 5.0
+
+    def __init__(self, path: str, reads_per_minute: float, burst: int = 10, max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0):
+        super().__init__(reads_per_minute, burst, max_retries, backoff_base, backoff_max)
+        self.path = path
+        self._owner = uuid.uuid4().hex
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+            conn.execute('INSERT OR IGNORE INTO bucket (id, tokens, updated, paused_until) VALUES (0, ?, ?, 0)',
+                         (float(self.capacity), time.time()))
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit, so transactions are opened explicitly with BEGIN IMMEDIATE
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _take(self, reads: int, level: int, since: float) -> float:
+        # Wall-clock time, the only clock the processes have in common
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                delay = self._take_locked(conn, reads, level, since, now)
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        return min(delay, self.POLL)
+
+    def _take_locked(self, conn: sqlite3.Connection, reads: int, level: int, since: float, now: float) -> float:
+        conn.execute('DELETE FROM waiters WHERE seen < ?', (now - self.STALE,))
+        ahead = conn.execute(
+            'SELECT 1 FROM waiters WHERE owner != ? AND (level < ? OR (level = ? AND since < ?)) LIMIT 1',
+            (self._owner, level, level, since)
+        ).fetchone()
+        tokens, updated, paused_until = conn.execute(
+            'SELECT tokens, updated, paused_until FROM bucket WHERE id = 0').fetchone()
+        if now > updated:
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+            updated = now
+
+        if ahead is None and now >= paused_until and (self.rate <= 0 or tokens >= reads):
+            if self.rate > 0:
+                conn.execute('UPDATE bucket SET tokens = ?, updated = ? WHERE id = 0', (tokens - reads, updated))
+            conn.execute('DELETE FROM waiters WHERE owner = ?', (self._owner,))
+            return 0.0
+
+        conn.execute('INSERT OR REPLACE INTO waiters (owner, level, since, seen) VALUES (?, ?, ?, ?)',
+                     (self._owner, level, since, now))
+        if now < paused_until:
+            return paused_until - now
+        if ahead is not None:
+            return self.POLL
+        return (reads - tokens) / self.rate
+
+    def _leave(self):
+        with closing(self._connect()) as conn:
+            conn.execute('DELETE FROM waiters WHERE owner = ?', (self._owner,))
+
+    def _pause(self, seconds: float):
+        until = time.time() + seconds
+        # One statement, so it needs no explicit transaction; SET reads the old values
+        with closing(self._connect()) as conn:
+            conn.execute('UPDATE bucket SET paused_until = MAX(paused_until, ?), tokens = 0, '
+                         'updated = MAX(paused_until, ?) WHERE id = 0', (until, until))
+
+
+_scheduler: Optional[QuotaScheduler] = None
+_scheduler_lock = threading.Lock()
+
+# Relative SHEETS_QUOTA_PATH values are resolved here, not against the working
+# directory, so processes started from different directories share one bucket
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def get_scheduler() -> QuotaScheduler:
+    """The scheduler shared by every SheetsClient in the process, built from settings"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            from ..config.settings import settings
+            args = (settings.SHEETS_READS_PER_MINUTE, settings.SHEETS_READ_BURST, settings.SHEETS_MAX_RETRIES,
+                    settings.SHEETS_BACKOFF_BASE, settings.SHEETS_BACKOFF_MAX)
+            if settings.SHEETS_QUOTA_PATH and settings.SHEETS_READS_PER_MINUTE > 0:
+                path = os.path.join(_REPO_ROOT, settings.SHEETS_QUOTA_PATH)
+                _scheduler = SharedQuotaScheduler(path, *args)
+            else:
+                _scheduler = QuotaScheduler(*args)
+        return _scheduler
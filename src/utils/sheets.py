@@ -1,13 +1,77 @@
-import gspread
 import json
 import os
-from google.oauth2.service_account import Credentials
-from typing import Dict, List
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, TypeVar
+from .store import SheetStore
+from .quota import QuotaScheduler, get_scheduler
+from . import metrics
+
+if TYPE_CHECKING:
+    import gspread
+
+T = TypeVar('T')
+
+
+def _trim_row(row: List[str]) -> List[str]:
+    """Drop trailing empty cells, which the Sheets API omits when not padding"""
+    end = len(row)
+    while end and row[end - 1] == '':
+        end -= 1
+    return list(row[:end])
+
+
+def _column_letter(column: int) -> str:
+    """A1 letters of a 1-based column number, like gspread.utils.rowcol_to_a1 without the row"""
+    letters = ''
+    while column:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _cell_bytes(rows) -> int:
+    """UTF-8 size of the cell values, for metrics"""
+    return sum(len(cell.encode('utf-8')) for row in rows for cell in row)
+
+
+@dataclass
+class _SheetSnapshot:
+    """Worksheet contents as of the last fetch"""
+    store: SheetStore
+    fetched_at: float = field(default_factory=time.monotonic)
+    # Time of the last full download; appends since then keep it
+    loaded_at: float = field(default_factory=time.monotonic)
+
 
 class SheetsClient:
-    def __init__(self, credentials_path: str):
+    def __init__(self, credentials_path: str, client: Optional['gspread.Client'] = None,
+                 cache_ttl: Optional[float] = None, cache_max_sheets: Optional[int] = None,
+                 scheduler: Optional[QuotaScheduler] = None, max_age: Optional[float] = None):
         from ..config.settings import settings
         import traceback
+
+        # Reads go through the process-wide quota unless a scheduler is given
+        self.scheduler = scheduler or get_scheduler()
+        # Sheet id -> first worksheet, so fetches skip the metadata reads of open_by_key
+        self._worksheets: Dict[str, 'gspread.Worksheet'] = {}
+        self.cache_ttl = settings.SHEETS_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.cache_max_sheets = settings.SHEETS_CACHE_MAX_SHEETS if cache_max_sheets is None else cache_max_sheets
+        self.max_age = settings.SHEETS_SNAPSHOT_MAX_AGE if max_age is None else max_age
+        self._snapshots: "OrderedDict[str, _SheetSnapshot]" = OrderedDict()
+        self._snapshots_lock = threading.Lock()
+
+        if client is not None:
+            # Pre-authorized client (tests, offline tools); skip credential handling
+            self.client = client
+            return
+
+        # gspread and google-auth are slow to import, so they are only loaded
+        # when a real client is needed
+        import gspread
+        from google.oauth2.service_account import Credentials
         
         scope = ['https://www.googleapis.com/auth/spreadsheets.readonly']
         
@@ -80,25 +144,254 @@ class SheetsClient:
             # Re-raise with more context
             raise RuntimeError(f"Failed to initialize Google Sheets client: {str(e)}") from e
 
-    def get_sheet_data(self, sheet_id: str) -> List[Dict]:
-        sheet = self.client.open_by_key(sheet_id)
-        
-        # Get raw data with possible duplicate headers
-        list_of_lists = sheet.sheet1.get_all_values()
-        headers = list_of_lists[0]
-        data = list_of_lists[1:]
-
-        # Make headers unique
-        seen = {}
-        unique_headers = []
-        for h in headers:
-            if h in seen:
-                seen[h] += 1
-                unique_h = f"{h}_{seen[h]}"
-            else:
-                seen[h] = 0
-                unique_h = f"{h}_0" if h in unique_headers else h
-            unique_headers.append(unique_h)
+    def get_sheet_data(self, sheet_id: str, use_cache: bool = True) -> List[Dict]:
+        """
+        Get all rows of the first worksheet as records keyed by unique header.
+
+        Snapshots are kept per sheet for ``cache_ttl`` seconds. Once a snapshot
+        expires only the rows appended after it are fetched, together with the
+        timestamps of the rows already held. A changed header row or timestamp
+        (Google Forms updates it when a response is edited) triggers a full
+        reload instead, as does a snapshot last loaded in full more than
+        ``max_age`` seconds ago, which picks up cells edited by hand.
+
+        Args:
+            sheet_id: The spreadsheet key
+            use_cache: Set to False to force a full reload from the API
 
+        Returns:
+            List of row dictionaries
+        """
         # Convert to records
-        return [dict(zip(unique_headers, row)) for row in data]
+        return self.get_sheet_store(sheet_id, use_cache).records()
+
+    def get_sheet_store(self, sheet_id: str, use_cache: bool = True) -> SheetStore:
+        """
+        Get all rows of the first worksheet as a columnar store.
+
+        Uses the same snapshot cache as get_sheet_data(). The returned store
+        is shared and must not be modified.
+        """
+        return self._get_snapshot(sheet_id, use_cache).store
+
+    def get_email_records(self, sheet_id: str, email: str,
+                          email_column: str = 'Email Address') -> List[Dict]:
+        """
+        Get only the rows submitted by one email address.
+
+        A fresh cached snapshot is filtered in memory. Otherwise the header row
+        and the email column are fetched first, and the matching rows are then
+        read with a single batch request, so the transfer scales with the
+        candidate's submissions rather than with the sheet.
+
+        Args:
+            sheet_id: The spreadsheet key
+            email: Email address to match, case-insensitively
+            email_column: Header of the column holding the email address
+
+        Returns:
+            List of row dictionaries, keyed like get_sheet_data(). Columns past
+            the last header are included as far as the candidate's rows reach
+        """
+        return self.get_email_store(sheet_id, email, email_column).records()
+
+    def get_email_store(self, sheet_id: str, email: str,
+                        email_column: str = 'Email Address') -> SheetStore:
+        """Like get_email_records(), but returns the rows as a columnar store"""
+        target = email.lower()
+
+        with self._snapshots_lock:
+            snapshot = self._snapshots.get(sheet_id)
+        if snapshot is not None and time.monotonic() - snapshot.fetched_at < self.cache_ttl:
+            store = snapshot.store
+            if email_column in store.headers:
+                if email_column == store.email_column:
+                    positions = store.positions(email)
+                else:
+                    emails = store.column(email_column)
+                    positions = [p for p in range(len(store)) if emails[p].lower() == target]
+                return SheetStore(store.raw_headers, [store.row(p) for p in positions], email_column)
+            return SheetStore(store.raw_headers, email_column=email_column)
+
+        with metrics.stage('sheets.fetch', sheet_id=sheet_id, mode='targeted') as s:
+            headers = self._read(sheet_id, lambda ws: ws.row_values(1))
+            if email_column not in headers:
+                return SheetStore(headers, email_column=email_column)
+
+            emails = self._read(sheet_id, lambda ws: ws.col_values(headers.index(email_column) + 1))
+            row_numbers = [i + 1 for i, value in enumerate(emails)
+                           if i > 0 and (value or '').lower() == target]
+            if s:
+                s.set(rows=0, bytes=_cell_bytes([headers, emails]))
+            if not row_numbers:
+                return SheetStore(headers, email_column=email_column)
+
+            # Whole rows: the header row comes back without trailing blank headers,
+            # but their columns may still hold answers
+            ranges = self._read(sheet_id, lambda ws: ws.batch_get([f'A{n}:{n}' for n in row_numbers]))
+            rows = [(r[0] if r else []) for r in ranges]
+            # Name the extra columns like get_all_values() pads the header row
+            width = max([len(headers)] + [len(row) for row in rows])
+            headers = headers + [''] * (width - len(headers))
+            if s:
+                s.set(rows=len(rows), bytes=_cell_bytes([headers, emails]) + _cell_bytes(rows))
+            return SheetStore(headers, rows, email_column)
+
+    def _worksheet(self, sheet_id: str) -> 'gspread.Worksheet':
+        with self._snapshots_lock:
+            worksheet = self._worksheets.get(sheet_id)
+        if worksheet is None:
+            # open_by_key and sheet1 each read the spreadsheet metadata
+            worksheet = self.scheduler.call(lambda: self.client.open_by_key(sheet_id).sheet1, reads=2)
+            with self._snapshots_lock:
+                self._worksheets[sheet_id] = worksheet
+        return worksheet
+
+    def _read(self, sheet_id: str, read: Callable[['gspread.Worksheet'], T]) -> T:
+        """Make one read request against the sheet's first worksheet, under the quota"""
+        worksheet = self._worksheet(sheet_id)
+        try:
+            return self.scheduler.call(lambda: read(worksheet))
+        except Exception:
+            # The spreadsheet may have been deleted or its worksheets rearranged
+            with self._snapshots_lock:
+                self._worksheets.pop(sheet_id, None)
+            raise
+
+    def invalidate(self, sheet_id: Optional[str] = None):
+        """Drop the cached snapshot for one sheet, or for all sheets"""
+        with self._snapshots_lock:
+            if sheet_id is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(sheet_id, None)
+
+    def _get_snapshot(self, sheet_id: str, use_cache: bool = True) -> _SheetSnapshot:
+        if not use_cache or self.cache_max_sheets <= 0:
+            return self._fetch_full(sheet_id)
+
+        with self._snapshots_lock:
+            snapshot = self._snapshots.get(sheet_id)
+            if snapshot is not None:
+                self._snapshots.move_to_end(sheet_id)
+
+        if snapshot is None:
+            snapshot = self._fetch_full(sheet_id)
+        elif time.monotonic() - snapshot.fetched_at >= self.cache_ttl:
+            snapshot = self._fetch_appended(sheet_id, snapshot)
+        else:
+            return snapshot
+
+        with self._snapshots_lock:
+            self._snapshots[sheet_id] = snapshot
+            self._snapshots.move_to_end(sheet_id)
+            while len(self._snapshots) > self.cache_max_sheets:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def _fetch_full(self, sheet_id: str) -> _SheetSnapshot:
+        with metrics.stage('sheets.fetch', sheet_id=sheet_id, mode='full') as s:
+            # Get raw data with possible duplicate headers
+            list_of_lists = self._read(sheet_id, lambda ws: ws.get_all_values())
+            if s:
+                s.set(rows=max(len(list_of_lists) - 1, 0), bytes=_cell_bytes(list_of_lists))
+            return _SheetSnapshot(SheetStore(list_of_lists[0], list_of_lists[1:]))
+
+    def _fetch_appended(self, sheet_id: str, snapshot: _SheetSnapshot) -> _SheetSnapshot:
+        if time.monotonic() - snapshot.loaded_at >= self.max_age:
+            return self._fetch_full(sheet_id)
+
+        store = snapshot.store
+        timestamps = store.column('Timestamp') if 'Timestamp' in store.headers else None
+        new_rows = self.get_rows_after(sheet_id, store.raw_headers, len(store), timestamps)
+        if new_rows is None:
+            print(f"Header row or existing rows changed for sheet {sheet_id}, reloading")
+            return self._fetch_full(sheet_id)
+
+        # The store pads short rows like get_all_values() does
+        return _SheetSnapshot(store.extended(new_rows), loaded_at=snapshot.loaded_at)
+
+    def get_rows_after(self, sheet_id: str, headers: List[str], row_count: int,
+                       timestamps: Optional[List[str]] = None) -> Optional[List[List[str]]]:
+        """
+        Fetch the data rows appended after the first ``row_count`` rows.
+
+        The header row is read in the same request and compared to ``headers``.
+
+        Args:
+            sheet_id: The spreadsheet key
+            headers: Header row as of the previous fetch
+            row_count: Number of data rows already held by the caller
+            timestamps: Timestamp column of the rows already held; if given it
+                is read in the same request and compared as well
+
+        Returns:
+            The new rows (not padded), or None if the header row or one of the
+            timestamps has changed and the caller must reload the whole sheet
+        """
+        if not _trim_row(headers):
+            return None
+
+        ranges = ['1:1', f'A{row_count + 2}:{_column_letter(len(headers))}']  # 1-based, after the header row
+        check_timestamps = timestamps is not None and row_count > 0 and 'Timestamp' in headers
+        if check_timestamps:
+            letter = _column_letter(headers.index('Timestamp') + 1)
+            ranges.append(f'{letter}2:{letter}{row_count + 1}')
+
+        with metrics.stage('sheets.fetch', sheet_id=sheet_id, mode='append') as s:
+            header_range, new_range, *timestamp_ranges = self._read(sheet_id, lambda ws: ws.batch_get(ranges))
+            if s:
+                s.set(rows=len(new_range), bytes=_cell_bytes(header_range) + _cell_bytes(new_range)
+                      + sum(_cell_bytes(r) for r in timestamp_ranges))
+
+        header_row = header_range[0] if header_range else []
+        if _trim_row(header_row) != _trim_row(headers):
+            return None
+        if check_timestamps:
+            # The API leaves out trailing empty cells and rows
+            current = [row[0] if row else '' for row in timestamp_ranges[0]]
+            current += [''] * (row_count - len(current))
+            if current != list(timestamps):
+                return None
+        return [list(row) for row in new_range]
+
+    def get_columns(self, sheet_id: str, names: List[str],
+                    headers: Optional[List[str]] = None) -> Tuple[List[str], Dict[str, List[str]]]:
+        """
+        Read a few whole columns of the first worksheet, located by header.
+
+        This is much cheaper than downloading the sheet when only e.g. the
+        timestamps and emails are needed. With ``headers`` from a previous
+        call, the header row and the columns come back in one request; if the
+        header row has changed since, the columns are located again.
+
+        Args:
+            sheet_id: The spreadsheet key
+            names: Headers of the columns to read; missing ones are left out
+            headers: Header row as of the previous call, if any
+
+        Returns:
+            Tuple of the current header row and the values below the header
+            for each column found, all padded to the same length
+        """
+        with metrics.stage('sheets.fetch', sheet_id=sheet_id, mode='columns') as s:
+            if headers is None:
+                headers = self._read(sheet_id, lambda ws: ws.row_values(1))
+            while True:
+                found = [name for name in names if name in headers]
+                letters = [_column_letter(headers.index(name) + 1) for name in found]
+                header_range, *column_ranges = self._read(sheet_id, lambda ws: ws.batch_get(
+                    ['1:1'] + [f'{letter}2:{letter}' for letter in letters]))
+                header_row = header_range[0] if header_range else []
+                if _trim_row(header_row) == _trim_row(headers):
+                    break
+                headers = header_row
+
+            length = max((len(r) for r in column_ranges), default=0)
+            columns = {
+                name: [row[0] if row else '' for row in r] + [''] * (length - len(r))
+                for name, r in zip(found, column_ranges)
+            }
+            if s:
+                s.set(rows=length, bytes=_cell_bytes(header_range) + sum(_cell_bytes(r) for r in column_ranges))
+        return list(headers), columns
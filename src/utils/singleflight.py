@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Tuple
+
+from . import metrics
+
+
+class _SharedStream:
+    """Chunks of one iterator, buffered so every subscriber sees all of them"""
+
+    def __init__(self):
+        self.chunks: List = []
+        self.done = False
+        self.error = None
+        self.condition = threading.Condition()
+
+    def pump(self, fn: Callable[[], Iterable]):
+        try:
+            for chunk in fn():
+                with self.condition:
+                    self.chunks.append(chunk)
+                    self.condition.notify_all()
+        except Exception as e:
+            self.error = e
+        finally:
+            with self.condition:
+                self.done = True
+                self.condition.notify_all()
+
+    def subscribe(self) -> Iterator:
+        position = 0
+        while True:
+            with self.condition:
+                while position == len(self.chunks) and not self.done:
+                    self.condition.wait()
+                if position == len(self.chunks):
+                    if self.error is not None:
+                        raise self.error
+                    return
+                chunk = self.chunks[position]
+            position += 1
+            yield chunk
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key.
+
+    The first caller for a key runs the work; callers arriving while it is in
+    flight wait for it and receive the same result or exception. Nothing is
+    kept once the work finishes, so later calls run again (and can hit the
+    regular caches).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._streams: Dict[Hashable, _SharedStream] = {}
+
+    def _join(self, table: Dict, key: Hashable, factory) -> Tuple[object, bool]:
+        with self._lock:
+            entry = table.get(key)
+            if entry is not None:
+                return entry, False
+            entry = table[key] = factory()
+            return entry, True
+
+    def do(self, key: Hashable, fn: Callable):
+        """Run ``fn()`` unless a call for ``key`` is already in flight, then share its result"""
+        future, leader = self._join(self._calls, key, Future)
+        if not leader:
+            metrics.record('singleflight.shared', kind=str(key[0]) if isinstance(key, tuple) else 'call')
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stream(self, key: Hashable, fn: Callable[[], Iterable]) -> Iterator:
+        """
+        Share one iterator between concurrent callers.
+
+        The iterator returned by ``fn()`` is drained by a background thread
+        into a buffer, and every caller replays the buffer from the start,
+        so a slow or abandoned reader never holds up the others.
+        """
+        shared, leader = self._join(self._streams, key, _SharedStream)
+        if leader:
+            def run():
+                try:
+                    shared.pump(fn)
+                finally:
+                    with self._lock:
+                        del self._streams[key]
+            threading.Thread(target=run, name='singleflight-stream', daemon=True).start()
+        else:
+            metrics.record('singleflight.shared', kind=str(key[0]) if isinstance(key, tuple) else 'stream')
+        return shared.subscribe()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._streams)
@@ -0,0 +1,102 @@
+from typing import Dict, List, Optional, Sequence
+
+
+def make_unique_headers(headers: List[str]) -> List[str]:
+    """Suffix repeated header names so every column gets its own record key"""
+    seen = {}
+    unique_headers = []
+    for h in headers:
+        if h in seen:
+            seen[h] += 1
+            unique_h = f"{h}_{seen[h]}"
+        else:
+            seen[h] = 0
+            unique_h = f"{h}_0" if h in unique_headers else h
+        unique_headers.append(unique_h)
+    return unique_headers
+
+
+class SheetStore:
+    """
+    Column-oriented copy of one worksheet.
+
+    The header list is stored once and each column is a plain list of cell
+    values, so a sheet costs one pointer per cell instead of one dict per row.
+    Rows are indexed by lowercased email address for O(1) lookups.
+
+    Stores are treated as immutable once shared; use ``extended`` to get a new
+    store with appended rows.
+    """
+
+    def __init__(self, headers: List[str], rows: Sequence[Sequence[str]] = (),
+                 email_column: str = 'Email Address'):
+        self.raw_headers = list(headers)
+        self.headers = make_unique_headers(self.raw_headers)
+        self.email_column = email_column
+        self.columns: List[List[str]] = [[] for _ in self.headers]
+        self._email_index: Dict[str, List[int]] = {}
+        self._length = 0
+        self._append(rows)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _append(self, rows: Sequence[Sequence[str]]):
+        width = len(self.headers)
+        if not width:
+            self._length += len(rows)
+            return
+
+        # Pad short rows like get_all_values() so every column stays aligned
+        padded = [row if len(row) == width else (list(row) + [''] * (width - len(row)))[:width]
+                  for row in rows]
+        for column, values in zip(self.columns, zip(*padded)):
+            column.extend(values)
+
+        if self.email_column in self.headers:
+            emails = self.columns[self.headers.index(self.email_column)]
+            index = self._email_index
+            for position in range(self._length, self._length + len(padded)):
+                key = emails[position].lower()
+                # Build a new list rather than appending: position lists may
+                # be shared with the store this one was extended from
+                index[key] = index[key] + [position] if key in index else [position]
+        self._length += len(padded)
+
+    def extended(self, rows: Sequence[Sequence[str]]) -> 'SheetStore':
+        """Return a new store holding this store's rows followed by ``rows``"""
+        store = SheetStore.__new__(SheetStore)
+        store.raw_headers = self.raw_headers
+        store.headers = self.headers
+        store.email_column = self.email_column
+        store.columns = [list(column) for column in self.columns]
+        store._email_index = dict(self._email_index)
+        store._length = self._length
+        store._append(rows)
+        return store
+
+    def column(self, header: str) -> List[str]:
+        """Values of one column, by unique header name"""
+        return self.columns[self.headers.index(header)]
+
+    def positions(self, email: str) -> List[int]:
+        """Row positions submitted by ``email``, compared case-insensitively"""
+        return self._email_index.get(email.lower(), [])
+
+    def emails(self) -> List[str]:
+        """Distinct lowercased email addresses, in order of first submission"""
+        return [email for email in self._email_index if email]
+
+    def latest_positions(self) -> Dict[str, int]:
+        """Lowercased email -> position of that email's most recent row"""
+        return {email: positions[-1] for email, positions in self._email_index.items()}
+
+    def row(self, position: int) -> List[str]:
+        return [column[position] for column in self.columns]
+
+    def records(self, positions: Optional[Sequence[int]] = None) -> List[Dict]:
+        """Rows as dictionaries keyed by unique header, like get_sheet_data()"""
+        if positions is None:
+            positions = range(self._length)
+        headers = self.headers
+        return [dict(zip(headers, self.row(p))) for p in positions]
@@ -0,0 +1,11 @@
+import os
+
+# Settings are required at import time; offline tests only need placeholders
+os.environ.setdefault('DEEPSEEK_API_KEY', 'test-key')
+os.environ.setdefault('SHEET_IDS', 'sheet-a,sheet-b')
+# Keep tests from writing the LLM response cache and PDF artifacts into the working tree
+os.environ.setdefault('LLM_CACHE_ENABLED', 'false')
+os.environ.setdefault('ARTIFACTS_DIR', '')
+# Fake Sheets calls are not rate limited unless a test builds its own scheduler
+os.environ.setdefault('SHEETS_READS_PER_MINUTE', '0')
+os.environ.setdefault('SHEETS_QUOTA_PATH', '')
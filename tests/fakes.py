@@ -0,0 +1,281 @@
+"""In-memory stand-ins for Google Sheets and the DeepSeek API"""
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from gspread.utils import a1_range_to_grid_range
+
+from src.core.booster import InterviewBooster
+from src.llm.async_client import AsyncLLMClient
+from src.llm.cache import ResponseCache
+from src.llm.client import LLMClient
+from src.utils.sheets import SheetsClient
+
+
+def _trim(row: List[str]) -> List[str]:
+    row = list(row)
+    while row and row[-1] == '':
+        row.pop()
+    return row
+
+
+class FakeWorksheet:
+    def __init__(self, values: List[List[str]], delay: float = 0.0):
+        self.values = values
+        self.delay = delay
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def _record(self, name: str):
+        with self._lock:
+            self.calls.append(name)
+        if self.delay:
+            time.sleep(self.delay)
+
+    def _slice(self, range_name: str) -> List[List[str]]:
+        grid = a1_range_to_grid_range(range_name)
+        start_row = grid.get('startRowIndex', 0)
+        end_row = grid.get('endRowIndex', len(self.values))
+        start_col = grid.get('startColumnIndex', 0)
+        end_col = grid.get('endColumnIndex')
+        # The API trims trailing empty cells and rows
+        rows = [_trim(row[start_col:end_col]) for row in self.values[start_row:end_row]]
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    @property
+    def row_count(self) -> int:
+        return max(len(self.values), 1000)
+
+    def get_all_values(self) -> List[List[str]]:
+        self._record('get_all_values')
+        if not self.values:
+            return [[]]
+        width = max(len(row) for row in self.values)
+        return [list(row) + [''] * (width - len(row)) for row in self.values]
+
+    def row_values(self, row: int) -> List[str]:
+        self._record('row_values')
+        rows = self._slice(f'{row}:{row}')
+        return rows[0] if rows else []
+
+    def col_values(self, col: int) -> List[str]:
+        self._record('col_values')
+        return [row[col - 1] if len(row) >= col else '' for row in self.values]
+
+    def batch_get(self, ranges: List[str]) -> List[List[List[str]]]:
+        self._record('batch_get')
+        return [self._slice(r) for r in ranges]
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet: FakeWorksheet):
+        self.sheet1 = worksheet
+
+
+class FakeGspreadClient:
+    """Serves one worksheet per spreadsheet key, optionally with a per-call delay"""
+
+    def __init__(self, sheets: Dict[str, List[List[str]]], delays: Optional[Dict[str, float]] = None):
+        delays = delays or {}
+        self.worksheets = {
+            key: FakeWorksheet(values, delays.get(key, 0.0)) for key, values in sheets.items()
+        }
+        self.opened: List[str] = []
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self.opened.append(key)
+        if key not in self.worksheets:
+            raise KeyError(f"Spreadsheet not found: {key}")
+        return FakeSpreadsheet(self.worksheets[key])
+
+
+class FakeCompletions:
+    """
+    Stand-in for ``AsyncOpenAI().chat.completions``.
+
+    Every call is recorded and answered after ``delay`` seconds with
+    ``respond(kwargs)``, by default ``report <n>`` for the n-th call. Streams
+    come in two chunks, ``chunk_delay`` seconds apart. With ``usage`` as (prompt, completion) tokens the
+    responses report it.
+    """
+
+    def __init__(self, delay: float = 0.0, respond: Optional[Callable[[dict], str]] = None,
+                 usage: Optional[Tuple[int, int]] = None, chunk_delay: float = 0.0):
+        self.delay = delay
+        self.chunk_delay = chunk_delay
+        self.respond = respond
+        self.usage = usage
+        self.calls: List[dict] = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = self.respond(kwargs) if self.respond else f"report {len(self.calls)}"
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if kwargs.get('stream'):
+            return self._stream([content[:3], content[3:], None])
+        usage = SimpleNamespace(prompt_tokens=self.usage[0], completion_tokens=self.usage[1]) \
+            if self.usage else None
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+    async def _stream(self, parts):
+        for i, part in enumerate(parts):
+            if i and self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+
+
+def make_llm_client(completions: FakeCompletions, cache: Optional[ResponseCache] = None,
+                    **kwargs) -> LLMClient:
+    """LLMClient whose API calls go to ``completions``; kwargs go to AsyncLLMClient"""
+    fake_openai = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return LLMClient(cache=cache, async_client=AsyncLLMClient(client=fake_openai, **kwargs))
+
+
+def make_booster(sheets: Optional[Dict[str, List[List[str]]]] = None,
+                 completions: Optional[FakeCompletions] = None, delays: Optional[Dict[str, float]] = None,
+                 cache_ttl: Optional[float] = None, **kwargs) -> InterviewBooster:
+    """
+    Booster reading ``sheets`` from a FakeGspreadClient and calling ``completions``.
+
+    Both are optional; kwargs go to InterviewBooster. ``sheet_ids`` are the
+    keys of ``sheets``.
+    """
+    if sheets is not None:
+        kwargs.setdefault('sheets_client', SheetsClient(
+            'unused.json', client=FakeGspreadClient(sheets, delays), cache_ttl=cache_ttl))
+    if completions is not None:
+        kwargs.setdefault('llm_client', make_llm_client(completions))
+    booster = InterviewBooster(**kwargs)
+    if sheets is not None:
+        booster.sheet_ids = list(sheets)
+    return booster
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        fake = self.server.fake
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        status = fake._begin(body)
+        try:
+            if fake.latency:
+                time.sleep(fake.latency)
+            if status != 200:
+                self._send_json(status, {'error': {'message': 'simulated failure', 'type': 'rate_limit'}},
+                                {'Retry-After': '0'} if status == 429 else {})
+            elif body.get('stream'):
+                self._send_stream(fake, body)
+            else:
+                self._send_json(200, {
+                    'id': 'cmpl-fake', 'object': 'chat.completion', 'created': 0, 'model': body['model'],
+                    'choices': [{'index': 0, 'finish_reason': 'stop',
+                                 'message': {'role': 'assistant', 'content': fake.content}}],
+                    'usage': fake.usage(body),
+                })
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (e.g. a timeout test)
+            pass
+        finally:
+            fake._end()
+
+    def _send_json(self, status, payload, headers=None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, fake, body):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        words = fake.content.split(' ')
+        for i, word in enumerate(words):
+            chunk = {'id': 'cmpl-fake', 'object': 'chat.completion.chunk', 'created': 0, 'model': 'fake',
+                     'choices': [{'index': 0, 'finish_reason': None,
+                                  'delta': {'content': word + (' ' if i < len(words) - 1 else '')}}]}
+            self.wfile.write(f'data: {json.dumps(chunk)}\n\n'.encode())
+            self.wfile.flush()
+            if fake.chunk_delay:
+                time.sleep(fake.chunk_delay)
+        if (body.get('stream_options') or {}).get('include_usage'):
+            chunk = {'id': 'cmpl-fake', 'object': 'chat.completion.chunk', 'created': 0, 'model': 'fake',
+                     'choices': [], 'usage': fake.usage(body)}
+            self.wfile.write(f'data: {json.dumps(chunk)}\n\n'.encode())
+        self.wfile.write(b'data: [DONE]\n\n')
+
+
+class FakeOpenAIServer:
+    """
+    Local OpenAI-compatible ``/chat/completions`` endpoint.
+
+    The first ``fail_first`` requests get ``fail_status`` (429 by default);
+    later ones succeed after ``latency`` seconds with ``content``, streamed
+    word by word when requested. Peak concurrency is recorded. Usage reports
+    DeepSeek's context cache fields: the prompt prefix shared with an earlier
+    request counts as cache hits, in 64-token units.
+    """
+
+    def __init__(self, content: str = 'Your report.', latency: float = 0.0, fail_first: int = 0,
+                 fail_status: int = 429, chunk_delay: float = 0.0):
+        self.content = content
+        self.latency = latency
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.chunk_delay = chunk_delay
+        self.requests: List[dict] = []
+        self._prompts: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _CompletionHandler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def usage(self, body: dict) -> dict:
+        prompt = ''.join(m['role'] + '\0' + m['content'] + '\0' for m in body['messages'])
+        prompt_tokens = sum(len(m['content']) for m in body['messages']) // 4
+        completion_tokens = len(self.content) // 4
+        with self._lock:
+            shared = max((len(os.path.commonprefix([prompt, p])) for p in self._prompts), default=0)
+            self._prompts.append(prompt)
+        hit_tokens = min(shared // 4 // 64 * 64, prompt_tokens)
+        return {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+                'prompt_cache_hit_tokens': hit_tokens, 'prompt_cache_miss_tokens': prompt_tokens - hit_tokens}
+
+    def _begin(self, body: dict) -> int:
+        with self._lock:
+            self.requests.append(body)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return self.fail_status if len(self.requests) <= self.fail_first else 200
+
+    def _end(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def __enter__(self) -> 'FakeOpenAIServer':
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
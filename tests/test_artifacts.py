@@ -0,0 +1,56 @@
+import os
+
+from src.core.booster import InterviewBooster
+from src.utils.artifacts import ArtifactStore
+
+
+class CountingPDFGenerator:
+    def __init__(self):
+        self.rendered = []
+
+    def render(self, markdown_content, email):
+        self.rendered.append(markdown_content)
+        return b'%PDF ' + markdown_content.encode() * 20
+
+
+def make_booster(tmp_path, max_bytes=1024 * 1024):
+    gen = CountingPDFGenerator()
+    booster = InterviewBooster(pdf_gen=gen, artifacts=ArtifactStore(str(tmp_path / 'artifacts'), max_bytes))
+    return booster, gen
+
+
+class TestArtifactStore:
+    def test_identical_content_is_rendered_once(self, tmp_path):
+        booster, gen = make_booster(tmp_path)
+        first, md = booster.render_pdf_report('Report A', 'a@example.com')
+        second, _ = booster.render_pdf_report('Report A', 'A@example.com')
+        assert first == second
+        assert gen.rendered == [md]
+
+        booster.render_pdf_report('Report A', 'b@example.com')
+        assert len(gen.rendered) == 2
+
+    def test_versions_are_kept_and_shared_between_processes(self, tmp_path):
+        booster, _ = make_booster(tmp_path)
+        old_path, _ = booster.generate_pdf_report('Version 1', 'a@example.com')
+        new_path, new_md = booster.generate_pdf_report('Version 2', 'a@example.com')
+        assert old_path != new_path
+        assert os.path.exists(old_path) and os.path.exists(new_path)
+
+        # A store opened earlier, e.g. in another process, finds the new artifact on disk
+        other = ArtifactStore(str(tmp_path / 'artifacts'), 1024 * 1024)
+        key = other.make_key('Version 3', 'a@example.com')
+        booster.artifacts.put(key, b'%PDF 3')
+        assert key in other and other.get(key) == b'%PDF 3'
+
+    def test_least_recently_used_artifacts_are_evicted(self, tmp_path):
+        store = ArtifactStore(str(tmp_path), max_bytes=600)
+        for name in ('a', 'b', 'c'):
+            store.put(name, b'x' * 199)
+            os.utime(store.path(name), (0, {'a': 1, 'b': 2, 'c': 3}[name]))
+        store.get('a')
+        store.put('d', b'x' * 199)
+
+        assert 'b' not in store and store.get('b') is None
+        assert all(key in store for key in ('a', 'c', 'd'))
+        assert store.stats()['bytes'] <= 600
@@ -0,0 +1,46 @@
+import os
+
+from src.core.batch import BatchRunner, Checkpoint
+from tests.fakes import FakeCompletions, make_booster
+
+HEADERS = ['Timestamp', 'Email Address', 'Question']
+SHEETS = {
+    's1': [HEADERS, ['t', 'a@example.com', 'Agree'], ['t', 'B@example.com', 'No']],
+    's2': [HEADERS, ['t', 'c@example.com', 'Yes'], ['t', 'a@example.com', 'Neutral']],
+}
+
+
+def make_runner(tmp_path, completions):
+    booster = make_booster(SHEETS, completions)
+    checkpoint = Checkpoint(str(tmp_path / 'checkpoint.jsonl'))
+    return BatchRunner(booster, str(tmp_path / 'reports'), checkpoint, llm_workers=4, pdf_workers=1)
+
+
+class TestBatchRunner:
+    def test_distinct_emails_across_sheets(self, tmp_path):
+        runner = make_runner(tmp_path, FakeCompletions())
+        assert runner.booster.get_all_emails() == ['a@example.com', 'b@example.com', 'c@example.com']
+
+    def test_writes_every_report_and_resumes_from_checkpoint(self, tmp_path):
+        completions = FakeCompletions()
+        result = make_runner(tmp_path, completions).run()
+
+        assert sorted(result.written) == ['a@example.com', 'b@example.com', 'c@example.com']
+        assert not result.failed
+        assert result.reports_per_minute > 0
+        assert sorted(os.listdir(tmp_path / 'reports')) == [
+            'a_example.com_report.pdf', 'b_example.com_report.pdf', 'c_example.com_report.pdf']
+        assert len(completions.calls) == 3
+
+        # A new run with the same checkpoint has nothing left to do
+        resumed = make_runner(tmp_path, completions).run()
+        assert resumed.written == {}
+        assert sorted(resumed.skipped) == ['a@example.com', 'b@example.com', 'c@example.com']
+        assert len(completions.calls) == 3
+
+    def test_failed_candidates_are_not_checkpointed(self, tmp_path):
+        runner = make_runner(tmp_path, FakeCompletions())
+        result = runner.run(['a@example.com', 'nobody@example.com'])
+        assert list(result.written) == ['a@example.com']
+        assert result.failed == {'nobody@example.com': 'no responses found'}
+        assert 'nobody@example.com' not in Checkpoint(str(tmp_path / 'checkpoint.jsonl'))
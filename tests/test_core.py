@@ -1,5 +1,7 @@
+import time
 import pytest
 from src.core.booster import InterviewBooster
+from tests.fakes import FakeCompletions, make_booster, make_llm_client
 
 class TestInterviewBooster:
     @pytest.fixture
@@ -10,3 +12,136 @@ class TestInterviewBooster:
         result = booster.get_all_responses("test@example.com")
         assert isinstance(result.email, str)
         assert isinstance(result.sheet_data, dict)
+
+
+HEADERS = ['Timestamp', 'Email Address', 'Question']
+
+
+class TestParallelFetch:
+    def test_wall_time_close_to_slowest_sheet(self, monkeypatch):
+        from src.config import settings
+        monkeypatch.setattr(settings, 'SHEETS_MAX_CONCURRENCY', 4)
+        sheets = {key: [HEADERS, ['t', 'a@example.com', key]] for key in ('s1', 's2', 's3', 's4')}
+        delays = {'s1': 0.2, 's2': 0.3, 's3': 0.1, 's4': 0.2}
+        booster = make_booster(sheets, delays)
+
+        start = time.perf_counter()
+        result = booster.get_all_responses('A@example.com')
+        elapsed = time.perf_counter() - start
+
+        assert list(result.sheet_data) == ['s1', 's2', 's3', 's4']
+        assert [r[0]['responses']['Question'] for r in result.sheet_data.values()] == ['s1', 's2', 's3', 's4']
+        # Sequential fetching would take 0.8s
+        assert elapsed < 0.5
+
+    def test_failing_sheet_is_reported_per_sheet(self):
+        booster = make_booster({'ok': [HEADERS, ['t', 'a@example.com', 'yes']]})
+        booster.sheet_ids = ['missing', 'ok']
+        result = booster.get_all_responses('a@example.com')
+        assert list(result.sheet_data) == ['ok']
+        assert list(result.errors) == ['missing']
+
+
+class TestCompactPayload:
+    def test_questions_listed_once_and_empty_answers_dropped(self):
+        from src.core.booster import ResponseData
+
+        long_question = 'I tailor my resume to each job description before applying.'
+        data = ResponseData(email='a@example.com', sheet_data={'sheet-id-1234': [
+            {'timestamp': '1/5/2024 14:03:22', 'email': 'a@example.com',
+             'responses': {long_question: 'Agree', 'Never answered': '', 'Notes': 'line one\nline two'}},
+            {'timestamp': '2/5/2024 09:00:00', 'email': 'a@example.com',
+             'responses': {long_question: 'Neutral', 'Never answered': '', 'Notes': ''}},
+        ]})
+        booster = make_booster({})
+        payload = booster.format_for_llm(data)
+        context = booster.question_context(data)
+
+        assert long_question not in payload
+        assert context.count(long_question) == 1
+        assert 'sheet-id-1234' not in payload + context
+        assert '[S1] Questions\nQ1: ' + long_question + '\nQ2: Never answered\nQ3: Notes' in context
+        assert '[S1] Submission 1 (1/5/2024 14:03)\nQ1: Agree\nQ3: line one / line two' in payload
+        assert '[S1] Submission 2 (2/5/2024 09:00)\nQ1: Neutral' in payload
+        assert 'Q2' not in payload
+
+    def test_prompt_prefix_is_identical_for_every_candidate(self):
+        headers = ['Timestamp', 'Email Address', 'Q one', 'Q two']
+        completions = FakeCompletions()
+        booster = make_booster({
+            's1': [headers, ['1/5/2024 14:03:22', 'a@example.com', 'Agree', ''],
+                   ['1/6/2024 10:00:00', 'b@example.com', '', 'Yes']],
+            's2': [headers, ['1/7/2024 10:00:00', 'b@example.com', 'No', 'No']],
+        }, completions)
+        for email in ('a@example.com', 'b@example.com'):
+            booster.generate_report(booster.get_all_responses(email))
+
+        first, second = (call['messages'] for call in completions.calls)
+        assert first[0] == second[0]
+        # The user messages only differ from the candidate's answers on
+        prefix = first[1]['content'].split('User: ')[0]
+        assert second[1]['content'].startswith(prefix)
+        assert prefix.count('Q2: Q two') == 2
+        assert first[1]['content'].endswith('[S1] Submission 1 (1/5/2024 14:03)\nQ1: Agree')
+
+
+class TestSectionedReport:
+    @staticmethod
+    def respond(kwargs):
+        """Echo the section number of section calls"""
+        system = kwargs['messages'][0]['content']
+        if 'Section ' in system and 'ONE section' in system:
+            return 'Analysis of ' + system.split('Section ', 1)[1].split(':', 1)[0]
+        return '## Overall Score and Summary\nDoing well.\n## Additional Commentary\nKeep going!'
+
+    def test_sections_run_concurrently_and_keep_report_structure(self, monkeypatch):
+        from src.config import settings
+        from src.core.booster import ResponseData
+        from src.core.scoring import ScoringConfig, ScoringEngine
+
+        monkeypatch.setattr(settings, 'REPORT_MODE', 'sections')
+        completions = FakeCompletions(delay=0.3, respond=self.respond)
+        booster = make_booster({}, llm_client=make_llm_client(completions, max_in_flight=10))
+        booster.scoring = ScoringEngine(ScoringConfig(sheet_sections={'s1': 3, 's2': 4, 's3': 6}))
+        data = ResponseData(email='a@example.com', sheet_data={
+            sheet_id: [{'timestamp': 't', 'email': 'a@example.com', 'responses': {'Question': answer}}]
+            for sheet_id, answer in (('s1', 'Agree'), ('s2', 'Disagree'), ('s3', 'Disagree'))
+        })
+
+        start = time.perf_counter()
+        report = booster.generate_report(data)
+        elapsed = time.perf_counter() - start
+
+        # One summary call plus three section calls, all in parallel
+        assert len(completions.calls) == 4
+        assert elapsed < 0.6
+        headings = [line for line in report.splitlines() if line.startswith('## ')]
+        assert headings == [
+            '## Overall Score and Summary',
+            '## Section 1: Current Status Evaluation',
+            '## Section 2: Goals and Interest Areas',
+            '## Section 3: Job Search Strategies & Awareness (35/35)',
+            '## Section 4: Resume & LinkedIn Optimization (0/25)',
+            '## Section 5: Networking & Referrals',
+            '## Section 6: Mental Health Evaluation (0/10)',
+            '## Priority Recommendations',
+            '## Additional Commentary',
+        ]
+        assert 'Analysis of 4' in report
+        assert 'No responses were provided for this section.' in report
+        # Mental health below 6 comes first, then the weakest section
+        priorities = report.split('## Priority Recommendations')[1]
+        assert priorities.index('Mental Health') < priorities.index('Resume') < priorities.index('Job Search')
+
+
+class TestLazyStartup:
+    def test_constructing_booster_skips_heavy_imports(self):
+        import subprocess
+        import sys
+
+        code = ("import sys\n"
+                "from src.core.booster import InterviewBooster\n"
+                "InterviewBooster()\n"
+                "print(sorted(m for m in ('gspread', 'openai', 'reportlab', 'pandas', 'markdown2') if m in sys.modules))")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        assert output.strip() == '[]'
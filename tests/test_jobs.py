@@ -0,0 +1,97 @@
+import time
+
+from src.core.jobs import JobQueue, JobStore
+from tests.fakes import FakeCompletions, make_booster
+
+HEADERS = ['Timestamp', 'Email Address', 'Question']
+SHEETS = {'s1': [HEADERS, ['t', 'a@example.com', 'Agree'], ['t', 'b@example.com', 'No'],
+                 ['t', 'c@example.com', 'Yes']]}
+
+
+def make_queue(tmp_path, completions, max_workers=2):
+    booster = make_booster(SHEETS, completions)
+    return JobQueue(booster, JobStore(str(tmp_path / 'jobs.sqlite3')), max_workers=max_workers)
+
+
+def wait_for(queue, job_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f'job {job_id} did not finish')
+
+
+class TestJobQueue:
+    def test_job_runs_every_stage_and_keeps_its_result(self, tmp_path):
+        queue = make_queue(tmp_path, FakeCompletions(delay=0.2))
+        job_id = queue.submit(' A@Example.com')
+        statuses = set()
+        while not queue.get(job_id).finished:
+            statuses.add(queue.get(job_id).status)
+            time.sleep(0.01)
+        queue.shutdown()
+
+        job = queue.get(job_id)
+        assert job.status == 'done' and job.progress == 1.0
+        assert 'generating' in statuses
+        assert job.markdown == '# Interview Feedback Report\n\nreport 1'
+        assert job.pdf_name.endswith('.pdf')
+        # A new queue on the same file (an app restart) still has the result
+        restarted = make_queue(tmp_path, FakeCompletions(delay=0.2))
+        assert restarted.get(job_id).markdown == job.markdown
+        assert restarted.get_pdf(job_id).startswith(b'%PDF')
+
+    def test_unknown_email_fails_with_message(self, tmp_path):
+        queue = make_queue(tmp_path, FakeCompletions(delay=0.2))
+        job = wait_for(queue, queue.submit('nobody@example.com'))
+        assert job.status == 'failed'
+        assert job.error == 'No responses found for this email'
+        assert queue.get_pdf(job.id) is None
+
+    def test_resubmitting_a_running_job_returns_it(self, tmp_path):
+        queue = make_queue(tmp_path, FakeCompletions(delay=0.3))
+        first = queue.submit('a@example.com')
+        assert queue.submit('A@example.com') == first
+        assert queue.submit('a@example.com', refresh=True) != first
+        wait_for(queue, first)
+        assert queue.submit('a@example.com') != first
+
+    def test_workers_bound_concurrent_llm_calls(self, tmp_path):
+        completions = FakeCompletions(delay=0.2)
+        queue = make_queue(tmp_path, completions, max_workers=1)
+        job_ids = [queue.submit(email) for email in ('a@example.com', 'b@example.com', 'c@example.com')]
+        time.sleep(0.1)
+        statuses = [queue.get(job_id).status for job_id in job_ids]
+        assert statuses.count('queued') == 2
+        assert all(wait_for(queue, job_id).status == 'done' for job_id in job_ids)
+        assert len(completions.calls) == 3
+
+    def test_restart_fails_jobs_left_running(self, tmp_path):
+        store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+        job = store.create('a@example.com')
+        store.update(job.id, status='generating')
+        # The process running it stopped sending heartbeats
+        store.update(job.id, updated_at=time.time() - JobQueue.STALE - 1)
+        queue = make_queue(tmp_path, FakeCompletions(delay=0.2))
+        assert store.get(job.id).status == 'failed'
+        assert queue.submit('a@example.com') != job.id
+
+    def test_queues_sharing_a_store_keep_each_others_jobs(self, tmp_path):
+        class FastQueue(JobQueue):
+            HEARTBEAT = 0.05
+            STALE = 0.3
+
+        path = str(tmp_path / 'jobs.sqlite3')
+        first = FastQueue(make_booster(SHEETS, FakeCompletions(delay=0.8)), JobStore(path))
+        job_id = first.submit('a@example.com')
+        while first.get(job_id).status != 'generating':
+            time.sleep(0.01)
+
+        second = FastQueue(make_booster(SHEETS, FakeCompletions()), JobStore(path))
+        assert second.get(job_id).status == 'generating'
+        # The job outlives STALE while the second queue keeps checking for abandoned jobs
+        assert wait_for(second, job_id).status == 'done'
+        first.shutdown()
+        second.shutdown()
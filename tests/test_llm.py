@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+import openai
+import pytest
+
+from src.llm import client as client_module
+from src.llm.async_client import AsyncLLMClient
+from src.llm.cache import ResponseCache
+from src.llm.client import LLMClient
+from tests.fakes import FakeCompletions, FakeOpenAIServer, make_llm_client
+
+
+def make_client(tmp_path, max_bytes=1024 * 1024):
+    completions = FakeCompletions()
+    return make_llm_client(completions, ResponseCache(str(tmp_path), max_bytes)), completions
+
+
+class TestResponseCache:
+    def test_repeat_request_is_served_from_cache(self, tmp_path):
+        llm, completions = make_client(tmp_path)
+        assert llm.generate_feedback('payload') == 'report 1'
+        assert llm.generate_feedback('payload') == 'report 1'
+        assert len(completions.calls) == 1
+        assert llm.cache.stats()['hits'] == 1
+
+    def test_refresh_bypasses_and_replaces_entry(self, tmp_path):
+        llm, completions = make_client(tmp_path)
+        llm.generate_feedback('payload')
+        assert llm.generate_feedback('payload', refresh=True) == 'report 2'
+        assert llm.generate_feedback('payload') == 'report 2'
+        assert len(completions.calls) == 2
+
+    def test_prompt_change_invalidates(self, tmp_path, monkeypatch):
+        llm, completions = make_client(tmp_path)
+        llm.generate_feedback('payload')
+        monkeypatch.setattr(client_module, 'SYSTEM_PROMPT', 'edited prompt')
+        assert llm.generate_feedback('payload') == 'report 2'
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), max_bytes=60)
+        cache.set('a', 'x' * 20)
+        cache.set('b', 'y' * 20)
+        # Total is now over the limit: the oldest entry goes
+        assert cache.get('a') is None
+        assert cache.get('b') == 'y' * 20
+        assert cache.stats()['entries'] == 1
+
+    def test_size_limit_covers_entries_of_other_processes(self, tmp_path):
+        # Two caches on one directory stand in for the app and the watcher
+        app = ResponseCache(str(tmp_path), max_bytes=60)
+        watcher = ResponseCache(str(tmp_path), max_bytes=60)
+        watcher.set('a', 'x' * 20)
+        app.set('b', 'y' * 20)
+        assert watcher.get('a') is None
+        assert app.get('b') == 'y' * 20
+
+
+class TestStreaming:
+    def test_chunks_are_yielded_then_cached(self, tmp_path):
+        llm, completions = make_client(tmp_path)
+        assert list(llm.stream_feedback('payload')) == ['rep', 'ort 1']
+        assert completions.calls[0]['stream'] is True
+        # The finished stream is shared with the non-streaming path
+        assert llm.generate_feedback('payload') == 'report 1'
+        assert list(llm.stream_feedback('payload')) == ['report 1']
+        assert len(completions.calls) == 1
+
+    def test_closing_the_stream_early_releases_its_slot(self):
+        client = make_llm_client(FakeCompletions(chunk_delay=2.0), max_in_flight=1).async_client
+        stream = client.stream_sync([{'role': 'user', 'content': 'hi'}])
+        assert next(stream) == 'rep'
+        assert client.limiter.locked()
+        stream.close()
+
+        deadline = time.monotonic() + 1.0
+        while client.limiter.locked() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not client.limiter.locked()
+
+
+def make_async_client(server, **kwargs):
+    kwargs.setdefault('max_retries', 3)
+    return AsyncLLMClient(api_key='test-key', base_url=server.base_url, **kwargs)
+
+
+class TestAsyncClient:
+    def test_throttled_requests_are_retried(self):
+        with FakeOpenAIServer(fail_first=2) as server:
+            llm = LLMClient(cache=None, async_client=make_async_client(server))
+            assert llm.generate_feedback('payload') == 'Your report.'
+            assert len(server.requests) == 3
+
+    def test_gives_up_after_max_retries(self):
+        with FakeOpenAIServer(fail_first=10, fail_status=503) as server:
+            client = make_async_client(server, max_retries=1)
+            client.backoff_base = 0.01
+            with pytest.raises(openai.InternalServerError):
+                client.complete_sync([{'role': 'user', 'content': 'hi'}])
+            assert len(server.requests) == 2
+
+    def test_in_flight_requests_are_bounded(self):
+        with FakeOpenAIServer(latency=0.2) as server:
+            client = make_async_client(server, max_in_flight=2)
+
+            async def burst():
+                messages = [{'role': 'user', 'content': 'hi'}]
+                return await asyncio.gather(*(client.complete(messages) for _ in range(6)))
+
+            start = time.perf_counter()
+            responses = asyncio.run(burst())
+            elapsed = time.perf_counter() - start
+
+            assert len(responses) == 6
+            assert server.max_in_flight == 2
+            assert elapsed >= 0.55
+
+    def test_timeout_is_retried(self):
+        with FakeOpenAIServer(latency=0.5) as server:
+            client = make_async_client(server, max_retries=1, timeout=0.1)
+            client.backoff_base = 0.01
+            with pytest.raises(openai.APITimeoutError):
+                client.complete_sync([{'role': 'user', 'content': 'hi'}])
+            assert len(server.requests) == 2
+
+    def test_stream_from_server(self):
+        with FakeOpenAIServer(content='one two three', fail_first=1) as server:
+            client = make_async_client(server)
+            chunks = list(client.stream_sync([{'role': 'user', 'content': 'hi'}]))
+            assert chunks == ['one ', 'two ', 'three']
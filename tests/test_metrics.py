@@ -0,0 +1,63 @@
+import json
+
+from src.llm.async_client import AsyncLLMClient
+from src.llm.client import LLMClient
+from src.utils import metrics
+from tests.fakes import FakeOpenAIServer, make_booster
+
+HEADERS = ['Timestamp', 'Email Address', 'Question']
+
+
+class TestMetrics:
+    def test_disabled_stage_is_a_no_op(self):
+        assert not metrics.enabled()
+        with metrics.stage('anything', a=1) as s:
+            s.set(b=2)
+        assert not s
+
+    def test_pipeline_records_stages_tokens_and_sizes(self, tmp_path):
+        path = str(tmp_path / 'metrics.jsonl')
+        hook = metrics.enable_json_lines(path)
+        try:
+            with FakeOpenAIServer(content='## Overall Score and Summary report') as server:
+                sheets = {'s1': [HEADERS, ['t', 'a@example.com', 'Agree'], ['t', 'b@example.com', 'No']]}
+                booster = make_booster(sheets, llm_client=LLMClient(async_client=AsyncLLMClient(
+                    api_key='test-key', base_url=server.base_url, max_retries=0)))
+                data = booster.get_all_responses('a@example.com')
+                report = ''.join(booster.stream_report(data))
+                booster.render_pdf_report(report, 'a@example.com')
+        finally:
+            metrics.remove_hook(hook)
+
+        with open(path) as f:
+            records = {r['stage']: r for r in map(json.loads, f)}
+        assert list(records) == ['sheets.fetch', 'report.fetch', 'report.format', 'llm.stream', 'pdf.render']
+        assert records['sheets.fetch']['rows'] == 2 and records['sheets.fetch']['bytes'] > 0
+        assert records['report.fetch']['submissions'] == 1
+        assert records['report.format']['payload_chars'] > 0
+        assert records['llm.stream']['prompt_tokens'] > 0 and records['llm.stream']['completion_tokens'] > 0
+        assert records['llm.stream']['cached'] is False
+        assert records['pdf.render']['bytes'] > 0
+        assert all(r['ok'] and r['seconds'] >= 0 for r in records.values())
+
+    def test_second_candidate_reuses_the_cached_prompt_prefix(self):
+        records = []
+        hook = records.append
+        metrics.add_hook(hook)
+        try:
+            with FakeOpenAIServer(content='report') as server:
+                questions = [f'How would you approach problem number {i} in a production setting?' for i in range(40)]
+                sheets = {'s1': [['Timestamp', 'Email Address'] + questions,
+                                 ['t', 'a@example.com'] + ['Yes'] * 40,
+                                 ['t', 'b@example.com'] + ['No'] * 40]}
+                booster = make_booster(sheets, llm_client=LLMClient(async_client=AsyncLLMClient(
+                    api_key='test-key', base_url=server.base_url, max_retries=0)))
+                for email in ('a@example.com', 'b@example.com'):
+                    booster.generate_report(booster.get_all_responses(email))
+        finally:
+            metrics.remove_hook(hook)
+
+        first, second = [r for r in records if r['stage'] == 'llm.complete']
+        assert first['prompt_cache_hit_tokens'] == 0
+        assert second['prompt_cache_hit_tokens'] > 0
+        assert second['prompt_cache_hit_tokens'] + second['prompt_cache_miss_tokens'] == second['prompt_tokens']
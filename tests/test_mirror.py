@@ -0,0 +1,65 @@
+from src.core.booster import InterviewBooster
+from src.utils.mirror import SheetMirror
+from src.utils.sheets import SheetsClient
+from tests.fakes import FakeGspreadClient
+
+HEADERS = ['Timestamp', 'Email Address', 'Question', 'Question']
+
+
+class TestSheetMirror:
+    def make(self, tmp_path, values):
+        fake = FakeGspreadClient({'sheet': values})
+        client = SheetsClient('unused.json', client=fake, cache_max_sheets=0)
+        return SheetMirror(str(tmp_path / 'mirror.sqlite3')), client, fake.worksheets['sheet']
+
+    def test_incremental_sync_appends_new_rows(self, tmp_path):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes', 'no']]
+        mirror, client, worksheet = self.make(tmp_path, values)
+        assert mirror.sync(client, 'sheet') == 1
+
+        values.append(['t2', 'A@example.com', 'maybe'])
+        assert mirror.sync(client, 'sheet') == 1
+        assert worksheet.calls == ['get_all_values', 'batch_get']
+        assert mirror.get_state('sheet') == (HEADERS, 2)
+
+        store = mirror.get_email_store('sheet', 'a@EXAMPLE.com')
+        assert store.records() == [
+            {'Timestamp': 't1', 'Email Address': 'a@example.com', 'Question': 'yes', 'Question_1': 'no'},
+            {'Timestamp': 't2', 'Email Address': 'A@example.com', 'Question': 'maybe', 'Question_1': ''},
+        ]
+
+    def test_distinct_emails_in_submission_order(self, tmp_path):
+        values = [HEADERS, ['t1', 'b@example.com'], ['t2', 'a@example.com'], ['t3', 'B@example.com'], ['t4', '']]
+        mirror, client, _ = self.make(tmp_path, values)
+        mirror.sync(client, 'sheet')
+        assert mirror.get_emails('sheet') == ['b@example.com', 'a@example.com']
+
+    def test_header_change_reloads_sheet(self, tmp_path):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes', 'no']]
+        mirror, client, _ = self.make(tmp_path, values)
+        mirror.sync(client, 'sheet')
+
+        values[0] = HEADERS + ['New question']
+        assert mirror.sync(client, 'sheet') == 1
+        assert mirror.get_state('sheet') == (HEADERS + ['New question'], 1)
+
+    def test_edited_response_reloads_sheet(self, tmp_path):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes', 'no'], ['t2', 'b@example.com', 'no', 'no']]
+        mirror, client, _ = self.make(tmp_path, values)
+        mirror.sync(client, 'sheet')
+
+        values[1] = ['t3', 'a@example.com', 'changed', 'no']
+        assert mirror.sync(client, 'sheet') == 2
+        assert mirror.get_email_store('sheet', 'a@example.com').records()[0]['Question'] == 'changed'
+
+    def test_booster_serves_from_mirror_without_sheets_client(self, tmp_path):
+        mirror, client, _ = self.make(tmp_path, [HEADERS, ['t1', 'a@example.com', 'yes', 'no']])
+        mirror.sync(client, 'sheet')
+
+        booster = InterviewBooster(mirror=mirror)
+        booster.sheet_ids = ['sheet', 'unsynced']
+        result = booster.get_all_responses('a@example.com')
+
+        assert booster.sheets_client is None
+        assert result.sheet_data['sheet'][0]['responses'] == {'Question': 'yes', 'Question_1': 'no'}
+        assert list(result.errors) == ['unsynced']
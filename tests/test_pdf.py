@@ -0,0 +1,48 @@
+import os
+
+from src.utils.pdf import PDFGenerator
+
+REPORT = "# Interview Feedback Report\n\n## Overall Score and Summary\n\nScore: 72/100\n"
+
+
+class TestInMemoryRendering:
+    def test_render_returns_pdf_bytes_without_touching_disk(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pdf = PDFGenerator().render(REPORT, 'a@example.com')
+        assert pdf.startswith(b'%PDF')
+        assert os.listdir(tmp_path) == []
+
+    def test_create_report_saves_the_rendered_bytes(self, tmp_path):
+        gen = PDFGenerator()
+        path = gen.create_report(REPORT, 'a b@example.com', str(tmp_path))
+        assert os.path.basename(path) == 'a_b_example.com_report.pdf'
+        with open(path, 'rb') as f:
+            assert f.read().startswith(b'%PDF')
+        assert os.listdir(tmp_path) == ['a_b_example.com_report.pdf']
+
+
+class TestMarkdownConverter:
+    def convert(self, markdown_content):
+        from src.utils.flowables import MarkdownConverter
+        from src.utils.pdf import CONTENT_WIDTH
+
+        return MarkdownConverter(PDFGenerator().styles, CONTENT_WIDTH).convert(markdown_content)
+
+    def test_headings_use_custom_styles_and_text_is_escaped(self):
+        from reportlab.platypus import Paragraph
+
+        story = self.convert("## Section 3\n### Areas for Improvement\nScore **20/35** & <rising>\nsame paragraph")
+        paragraphs = [f for f in story if isinstance(f, Paragraph)]
+        assert [p.style.name for p in paragraphs] == ['CustomHeading2', 'CustomHeading3', 'CustomBodyText']
+        assert paragraphs[2].text == 'Score <b>20/35</b> &amp; &lt;rising&gt; same paragraph'
+
+    def test_nested_lists_and_tables(self):
+        from reportlab.platypus import ListFlowable, Table
+
+        story = self.convert("- one\n  - nested\n- two\n1. first\n2. second\n\n"
+                             "| Section | Score |\n|---|---|\n| Resume | 18/25 |")
+        lists = [f for f in story if isinstance(f, ListFlowable)]
+        assert [l._bulletType for l in lists] == ['bullet', '1']
+        assert len(lists[0]._flowables) == 2
+        tables = [f for f in story if isinstance(f, Table)]
+        assert len(tables) == 1 and tables[0]._cellvalues[1][1].text == '18/25'
@@ -0,0 +1,145 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import quota
+from src.utils.quota import QuotaScheduler, SharedQuotaScheduler
+from src.utils.sheets import SheetsClient
+from tests.fakes import FakeGspreadClient
+
+HEADERS = ['Timestamp', 'Email Address', 'Question']
+
+
+class QuotaError(Exception):
+    response = SimpleNamespace(status_code=429)
+
+
+class TestQuotaScheduler:
+    def test_reads_are_spread_at_the_configured_rate(self):
+        scheduler = QuotaScheduler(reads_per_minute=600, burst=2)
+        start = time.perf_counter()
+        for _ in range(6):
+            scheduler.acquire()
+        # Two reads from the burst, then one every 0.1s
+        assert 0.35 < time.perf_counter() - start < 0.6
+
+    def test_interactive_reads_go_before_waiting_background_reads(self):
+        scheduler = QuotaScheduler(reads_per_minute=600, burst=1)
+        scheduler.acquire()
+        order = []
+
+        def read(level, name):
+            with quota.priority(level):
+                scheduler.acquire()
+            order.append(name)
+
+        background = threading.Thread(target=read, args=(quota.BACKGROUND, 'background'))
+        background.start()
+        time.sleep(0.02)
+        interactive = threading.Thread(target=read, args=(quota.INTERACTIVE, 'interactive'))
+        interactive.start()
+        background.join()
+        interactive.join()
+        assert order == ['interactive', 'background']
+
+    def test_no_reads_are_saved_up_during_a_pause(self):
+        scheduler = QuotaScheduler(reads_per_minute=600, burst=10)
+        scheduler.pause(0.3)
+        start = time.perf_counter()
+        for _ in range(3):
+            scheduler.acquire()
+        # The bucket refills from empty after the pause: one read every 0.1s
+        assert time.perf_counter() - start >= 0.55
+
+    def test_quota_errors_back_off_and_retry(self):
+        scheduler = QuotaScheduler(reads_per_minute=0, backoff_base=0.05, backoff_max=0.1)
+        attempts = []
+
+        def flaky():
+            attempts.append(time.perf_counter())
+            if len(attempts) < 3:
+                raise QuotaError()
+            return 'rows'
+
+        assert scheduler.call(flaky) == 'rows'
+        assert attempts[1] - attempts[0] >= 0.05
+        assert attempts[2] - attempts[1] >= 0.05
+
+    def test_other_errors_and_exhausted_retries_are_raised(self):
+        scheduler = QuotaScheduler(reads_per_minute=0, max_retries=1, backoff_base=0.01)
+        with pytest.raises(KeyError):
+            scheduler.call(lambda: {}['missing'])
+        calls = []
+
+        def always_throttled():
+            calls.append(1)
+            raise QuotaError()
+
+        with pytest.raises(QuotaError):
+            scheduler.call(always_throttled)
+        assert len(calls) == 2
+
+
+class TestSharedQuotaScheduler:
+    """Two schedulers on one file stand in for two processes"""
+
+    def test_processes_draw_from_one_bucket(self, tmp_path):
+        path = str(tmp_path / 'quota.sqlite3')
+        schedulers = [SharedQuotaScheduler(path, reads_per_minute=600, burst=2) for _ in range(2)]
+        start = time.perf_counter()
+        for i in range(6):
+            schedulers[i % 2].acquire()
+        # Two reads from the burst, then one every 0.1s whichever process asks
+        assert 0.35 < time.perf_counter() - start < 0.8
+
+    def test_interactive_process_goes_before_background_process(self, tmp_path):
+        path = str(tmp_path / 'quota.sqlite3')
+        app = SharedQuotaScheduler(path, reads_per_minute=600, burst=1)
+        watcher = SharedQuotaScheduler(path, reads_per_minute=600, burst=1)
+        app.acquire()
+        order = []
+
+        def read(scheduler, level, name):
+            scheduler.acquire(level=level)
+            order.append(name)
+
+        background = threading.Thread(target=read, args=(watcher, quota.BACKGROUND, 'background'))
+        background.start()
+        time.sleep(0.02)
+        interactive = threading.Thread(target=read, args=(app, quota.INTERACTIVE, 'interactive'))
+        interactive.start()
+        background.join()
+        interactive.join()
+        assert order == ['interactive', 'background']
+
+    def test_pause_holds_every_process(self, tmp_path):
+        path = str(tmp_path / 'quota.sqlite3')
+        first = SharedQuotaScheduler(path, reads_per_minute=600, burst=10)
+        second = SharedQuotaScheduler(path, reads_per_minute=600, burst=10)
+        first.pause(0.3)
+        start = time.perf_counter()
+        second.acquire()
+        assert time.perf_counter() - start >= 0.35
+
+
+class TestWorksheetHandles:
+    def test_handle_is_reused_across_fetches(self):
+        fake = FakeGspreadClient({'s1': [HEADERS, ['t', 'a@example.com', 'yes']]})
+        client = SheetsClient('unused.json', client=fake, scheduler=QuotaScheduler(0))
+        client.get_sheet_data('s1', use_cache=False)
+        client.get_sheet_data('s1', use_cache=False)
+        client.get_email_records('s1', 'a@example.com')
+        assert fake.opened == ['s1']
+
+    def test_failed_read_reopens_the_spreadsheet(self):
+        fake = FakeGspreadClient({'s1': [HEADERS]})
+        client = SheetsClient('unused.json', client=fake, scheduler=QuotaScheduler(0))
+        client.get_sheet_data('s1', use_cache=False)
+        fake.worksheets['s1'].get_all_values = lambda: {}['gone']
+        with pytest.raises(KeyError):
+            client.get_sheet_data('s1', use_cache=False)
+        del fake.worksheets['s1'].get_all_values
+        client.get_sheet_data('s1', use_cache=False)
+        assert fake.opened == ['s1', 's1']
@@ -0,0 +1,59 @@
+import pytest
+
+from src.core.booster import ResponseData
+from src.core.scoring import QuestionRule, ScoringConfig, ScoringEngine
+from src.utils.store import SheetStore
+
+CONFIG = ScoringConfig(
+    sheet_sections={'status': 1, 'strategy': 3},
+    questions={
+        'Goals': QuestionRule(section=2),
+        'Anything else?': QuestionRule(type='text'),
+        'Confidence (1-5)': QuestionRule(section=6, type='scale'),
+    },
+)
+
+
+def responses(sheet_id, answers):
+    return {sheet_id: [{'timestamp': 't', 'email': 'a@example.com', 'responses': answers}]}
+
+
+class TestScoringEngine:
+    def test_scoring_rules_and_weights(self):
+        data = ResponseData(email='a@example.com', sheet_data={
+            **responses('status', {'Happy with interviews': 'Neutral', 'Got interviews': 'Yes',
+                                   'Anything else?': 'Yes', 'Goals': 'Agree'}),
+            **responses('strategy', {'Tailor resume': 'Strongly agree', 'Track applications': 'Disagree',
+                                     'Unanswered': '', 'Confidence (1-5)': '3'}),
+        })
+        scores = ScoringEngine(CONFIG).score_responses(data)
+        by_section = {s.section: s for s in scores.sections}
+
+        # Neutral = half, Yes = full; the text question is not scored
+        assert (by_section[1].earned, by_section[1].possible, by_section[1].score) == (1.5, 2, 7.5)
+        # Unanswered questions do not count
+        assert (by_section[3].earned, by_section[3].possible, by_section[3].score) == (1, 2, 17.5)
+        assert by_section[2].score is None
+        assert by_section[6].score == 5.0
+        # Rescaled to 100 over the weighted sections that were answered
+        assert scores.total == pytest.approx(round((7.5 + 17.5 + 5.0) * 100 / 55, 1))
+        assert 'Total score: 54.5 / 100' in scores.format_for_llm()
+
+    def test_cohort_matches_single_candidate(self):
+        headers = ['Timestamp', 'Email Address', 'Tailor resume', 'Track applications']
+        store = SheetStore(headers, [
+            ['t1', 'a@example.com', 'Agree', 'No'],
+            ['t2', 'b@example.com', 'Neutral', 'Yes'],
+            ['t3', 'A@example.com', 'Agree', 'Yes'],
+        ])
+        engine = ScoringEngine(CONFIG)
+        cohort = engine.score_cohort({'strategy': store})
+
+        assert sorted(cohort.index) == ['a@example.com', 'b@example.com']
+        # Only the latest submission of each candidate is scored
+        assert cohort.loc['a@example.com', 'section_3'] == 35.0
+        assert cohort.loc['b@example.com', 'total'] == 75.0
+
+        single = engine.score_responses(ResponseData(email='b@example.com', sheet_data=responses(
+            'strategy', {'Tailor resume': 'Neutral', 'Track applications': 'Yes'})))
+        assert single.total == cohort.loc['b@example.com', 'total']
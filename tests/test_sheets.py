@@ -0,0 +1,138 @@
+from src.utils.sheets import SheetsClient
+from tests.fakes import FakeGspreadClient
+
+HEADERS = ['Timestamp', 'Email Address', 'Question', 'Question']
+
+
+def make_client(values, **kwargs):
+    fake = FakeGspreadClient({'sheet': values})
+    return SheetsClient('unused.json', client=fake, **kwargs), fake.worksheets['sheet']
+
+
+class TestSheetSnapshotCache:
+    def test_duplicate_headers_are_made_unique(self):
+        client, _ = make_client([HEADERS, ['t1', 'a@example.com', 'yes', 'no']])
+        records = client.get_sheet_data('sheet')
+        assert records == [{
+            'Timestamp': 't1', 'Email Address': 'a@example.com',
+            'Question': 'yes', 'Question_1': 'no',
+        }]
+
+    def test_fresh_snapshot_skips_api(self):
+        client, worksheet = make_client([HEADERS, ['t1', 'a@example.com', 'yes', 'no']], cache_ttl=60)
+        client.get_sheet_data('sheet')
+        client.get_sheet_data('sheet')
+        assert worksheet.calls == ['get_all_values']
+
+    def test_expired_snapshot_fetches_only_appended_rows(self):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes', 'no']]
+        client, worksheet = make_client(values, cache_ttl=0)
+        client.get_sheet_data('sheet')
+        values.append(['t2', 'b@example.com', 'maybe'])
+        records = client.get_sheet_data('sheet')
+        assert worksheet.calls == ['get_all_values', 'batch_get']
+        assert [r['Email Address'] for r in records] == ['a@example.com', 'b@example.com']
+        # Short rows are padded so every record has every header key
+        assert records[1]['Question_1'] == ''
+
+    def test_header_change_forces_full_reload(self):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes', 'no']]
+        client, worksheet = make_client(values, cache_ttl=0)
+        client.get_sheet_data('sheet')
+        values[0] = HEADERS + ['New question']
+        values.append(['t2', 'b@example.com', 'yes', 'no', 'extra'])
+        records = client.get_sheet_data('sheet')
+        assert worksheet.calls == ['get_all_values', 'batch_get', 'get_all_values']
+        assert records[1]['New question'] == 'extra'
+
+    def test_edited_response_forces_full_reload(self):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes', 'no'], ['t2', 'b@example.com', 'no', 'no']]
+        client, worksheet = make_client(values, cache_ttl=0)
+        client.get_sheet_data('sheet')
+        # Editing a form response rewrites the row and its timestamp
+        values[1] = ['t3', 'a@example.com', 'changed', 'no']
+        records = client.get_sheet_data('sheet')
+        assert worksheet.calls == ['get_all_values', 'batch_get', 'get_all_values']
+        assert records[0]['Question'] == 'changed'
+
+    def test_old_snapshot_is_reloaded_in_full(self):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes', 'no']]
+        client, worksheet = make_client(values, cache_ttl=0, max_age=0)
+        client.get_sheet_data('sheet')
+        # A cell edited by hand keeps the timestamp
+        values[1][2] = 'changed'
+        assert client.get_sheet_data('sheet')[0]['Question'] == 'changed'
+        assert worksheet.calls == ['get_all_values', 'get_all_values']
+
+    def test_cache_is_size_bounded(self):
+        fake = FakeGspreadClient({'a': [HEADERS], 'b': [HEADERS], 'c': [HEADERS]})
+        client = SheetsClient('unused.json', client=fake, cache_ttl=60, cache_max_sheets=2)
+        for key in ('a', 'b', 'c', 'a'):
+            client.get_sheet_data(key)
+        assert fake.worksheets['a'].calls == ['get_all_values', 'get_all_values']
+        assert list(client._snapshots) == ['c', 'a']
+
+
+class TestTargetedLookup:
+    VALUES = [
+        HEADERS,
+        ['t1', 'a@example.com', 'yes', 'no'],
+        ['t2', 'b@example.com', 'no', 'no'],
+        ['t3', 'A@Example.com', 'maybe'],
+    ]
+
+    def test_matches_full_download_records(self):
+        client, worksheet = make_client([list(r) for r in self.VALUES], cache_max_sheets=0)
+        expected = [r for r in client.get_sheet_data('sheet')
+                    if r['Email Address'].lower() == 'a@example.com']
+        worksheet.calls.clear()
+
+        assert client.get_email_records('sheet', 'a@example.com') == expected
+        assert worksheet.calls == ['row_values', 'col_values', 'batch_get']
+
+    def test_blank_headers_match_full_download(self):
+        values = [
+            ['Timestamp', 'Email Address', '', 'Question', ''],
+            ['t1', 'a@example.com', 'unlabelled', 'yes', 'trailing'],
+            ['t2', 'b@example.com', '', 'no'],
+        ]
+        client, _ = make_client(values, cache_max_sheets=0)
+        expected = [r for r in client.get_sheet_data('sheet') if r['Email Address'] == 'a@example.com']
+        records = client.get_email_records('sheet', 'a@example.com')
+        assert records == expected
+        assert records[0]['_1'] == 'trailing'
+
+    def test_no_match_skips_row_fetch(self):
+        client, worksheet = make_client([list(r) for r in self.VALUES])
+        assert client.get_email_records('sheet', 'nobody@example.com') == []
+        assert worksheet.calls == ['row_values', 'col_values']
+
+    def test_fresh_snapshot_is_filtered_in_memory(self):
+        client, worksheet = make_client([list(r) for r in self.VALUES], cache_ttl=60)
+        client.get_sheet_data('sheet')
+        records = client.get_email_records('sheet', 'B@example.com')
+        assert [r['Timestamp'] for r in records] == ['t2']
+        assert worksheet.calls == ['get_all_values']
+
+
+class TestColumnPoll:
+    def test_reads_columns_in_one_request_once_headers_are_known(self):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes'], ['t2', '', 'no']]
+        client, worksheet = make_client(values)
+        headers, columns = client.get_columns('sheet', ['Timestamp', 'Email Address', 'Missing'])
+        assert columns == {'Timestamp': ['t1', 't2'], 'Email Address': ['a@example.com', '']}
+        assert worksheet.calls == ['row_values', 'batch_get']
+
+        values.append(['t3', 'b@example.com'])
+        _, columns = client.get_columns('sheet', ['Email Address'], headers)
+        assert columns == {'Email Address': ['a@example.com', '', 'b@example.com']}
+        assert worksheet.calls == ['row_values', 'batch_get', 'batch_get']
+
+    def test_moved_column_is_located_again(self):
+        values = [HEADERS, ['t1', 'a@example.com', 'yes']]
+        client, worksheet = make_client(values)
+        headers, _ = client.get_columns('sheet', ['Email Address'])
+        values[:] = [['Email Address'] + HEADERS, ['a@example.com', 't1']]
+        headers, columns = client.get_columns('sheet', ['Email Address'], headers)
+        assert headers[0] == 'Email Address'
+        assert columns == {'Email Address': ['a@example.com']}
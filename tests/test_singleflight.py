@@ -0,0 +1,105 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.booster import ResponseData
+from src.utils.singleflight import SingleFlight
+from tests.fakes import FakeCompletions, make_booster
+
+
+def make_slow_booster():
+    completions = FakeCompletions(delay=0.2)
+    return make_booster(completions=completions), completions
+
+
+def make_data(email='a@example.com', answer='Agree'):
+    # Rows keep the address as submitted whatever the casing of the lookup
+    return ResponseData(email=email, sheet_data={'s1': [
+        {'timestamp': 't', 'email': 'a@example.com', 'responses': {'Question': answer}}]})
+
+
+def run_together(fn, args_list):
+    with ThreadPoolExecutor(max_workers=len(args_list)) as pool:
+        return list(pool.map(lambda args: fn(*args), args_list))
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_run(self):
+        flights = SingleFlight()
+        calls = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.2)
+            return len(calls)
+
+        results = run_together(lambda: flights.do('key', work), [()] * 5)
+        assert results == [1] * 5
+        assert len(calls) == 1
+        assert flights.in_flight() == 0
+        # Nothing is kept once the call finished
+        assert flights.do('key', work) == 2
+
+    def test_error_reaches_every_waiter(self):
+        flights = SingleFlight()
+        started = threading.Event()
+
+        def work():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError('boom')
+
+        def call():
+            with pytest.raises(ValueError, match='boom'):
+                flights.do('key', work)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        call()
+        leader.join()
+
+    def test_stream_replays_every_chunk_to_each_reader(self):
+        flights = SingleFlight()
+        calls = []
+
+        def chunks():
+            calls.append(1)
+            for part in ('a', 'b', 'c'):
+                time.sleep(0.05)
+                yield part
+
+        first = flights.stream('key', chunks)
+        assert next(first) == 'a'
+        second = flights.stream('key', chunks)
+        assert list(second) == ['a', 'b', 'c']
+        assert list(first) == ['b', 'c']
+        assert len(calls) == 1
+
+
+class TestCoalescedReports:
+    def test_same_candidate_and_data_make_one_llm_call(self):
+        booster, completions = make_slow_booster()
+        reports = run_together(booster.generate_report, [(make_data('a@example.com'),),
+                                                         (make_data(' A@Example.com'),)] * 3)
+        assert len(completions.calls) == 1
+        assert set(reports) == {'report 1'}
+
+    def test_different_data_is_not_coalesced(self):
+        booster, completions = make_slow_booster()
+        run_together(booster.generate_report, [(make_data(answer='Agree'),), (make_data(answer='Disagree'),)])
+        assert len(completions.calls) == 2
+
+    def test_concurrent_streams_share_one_call(self):
+        booster, completions = make_slow_booster()
+        reports = run_together(lambda: ''.join(booster.stream_report(make_data())), [()] * 3)
+        assert reports == ['report 1'] * 3
+        assert len(completions.calls) == 1
+
+    def test_fetches_of_differently_written_emails_share_the_rows(self):
+        sheets = {'s1': [['Timestamp', 'Email Address', 'Question'], ['t', 'a@example.com', 'Agree']]}
+        booster = make_booster(sheets, delays={'s1': 0.1})
+        results = run_together(booster.get_all_responses, [(' A@example.com',), ('a@example.com',)])
+        assert [len(r.sheet_data['s1']) for r in results] == [1, 1]
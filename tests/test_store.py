@@ -0,0 +1,29 @@
+from src.utils.store import SheetStore
+
+HEADERS = ['Timestamp', 'Email Address', 'Question', 'Question']
+ROWS = [
+    ['t1', 'a@example.com', 'yes', 'no'],
+    ['t2', 'b@example.com', 'no'],
+    ['t3', 'A@Example.com', 'maybe', 'yes'],
+]
+
+
+class TestSheetStore:
+    def test_records_match_list_of_dicts(self):
+        store = SheetStore(HEADERS, ROWS)
+        assert store.records() == [
+            {'Timestamp': 't1', 'Email Address': 'a@example.com', 'Question': 'yes', 'Question_1': 'no'},
+            {'Timestamp': 't2', 'Email Address': 'b@example.com', 'Question': 'no', 'Question_1': ''},
+            {'Timestamp': 't3', 'Email Address': 'A@Example.com', 'Question': 'maybe', 'Question_1': 'yes'},
+        ]
+
+    def test_email_index_is_case_insensitive(self):
+        store = SheetStore(HEADERS, ROWS)
+        assert store.positions('A@EXAMPLE.COM') == [0, 2]
+        assert store.positions('nobody@example.com') == []
+
+    def test_extended_leaves_original_untouched(self):
+        store = SheetStore(HEADERS, ROWS)
+        extended = store.extended([['t4', 'a@example.com', 'yes', 'yes']])
+        assert len(store) == 3 and store.positions('a@example.com') == [0, 2]
+        assert len(extended) == 4 and extended.positions('a@example.com') == [0, 2, 3]
@@ -0,0 +1,87 @@
+from src.core.watcher import SubmissionWatcher
+from src.llm.cache import ResponseCache
+from tests.fakes import FakeCompletions, make_booster, make_llm_client
+
+HEADERS = ['Timestamp', 'Email Address', 'Question']
+
+
+def make_watcher(tmp_path, values, completions, **kwargs):
+    booster = make_booster({'s1': values}, cache_ttl=60, llm_client=make_llm_client(
+        completions, ResponseCache(str(tmp_path / 'cache'), 1024 * 1024)))
+    return SubmissionWatcher(booster, str(tmp_path / 'state.json'), **kwargs)
+
+
+class TestSubmissionWatcher:
+    def test_new_and_edited_submissions_are_pregenerated_once(self, tmp_path):
+        values = [HEADERS, ['t1', 'a@example.com', 'Agree'], ['t1', 'b@example.com', 'No']]
+        completions = FakeCompletions(usage=(100, 50))
+        watcher = make_watcher(tmp_path, values, completions)
+        # The first poll only records what is already there
+        assert watcher.poll() == []
+        # Warm the booster's sheet snapshot so the watcher has to invalidate it
+        watcher.booster.get_all_responses('a@example.com')
+
+        values.append(['t2', 'C@example.com', 'Yes'])
+        values[1] = ['t3', 'a@example.com', 'Disagree']
+        values[1:] = sorted(values[1:], key=lambda row: row[1], reverse=True)
+        assert watcher.poll() == ['a@example.com', 'c@example.com']
+        watcher.wait()
+        assert len(completions.calls) == 2
+        assert 'Disagree' in completions.calls[0]['messages'][1]['content'] + \
+            completions.calls[1]['messages'][1]['content']
+
+        # Nothing changed: no calls, and a later request is served from the cache
+        assert watcher.poll() == []
+        watcher.close()
+        booster = watcher.booster
+        booster.generate_report(booster.get_all_responses('c@example.com'))
+        assert len(completions.calls) == 2
+
+    def test_state_survives_restart(self, tmp_path):
+        values = [HEADERS, ['t1', 'a@example.com', 'Agree']]
+        watcher = make_watcher(tmp_path, values, FakeCompletions(usage=(100, 50)))
+        watcher.poll()
+        watcher.close()
+
+        values.append(['t2', 'b@example.com', 'No'])
+        restarted = make_watcher(tmp_path, values, FakeCompletions(usage=(100, 50)))
+        assert restarted.poll() == ['b@example.com']
+        restarted.close()
+
+    def test_daily_budget_pauses_pregeneration(self, tmp_path):
+        values = [HEADERS]
+        completions = FakeCompletions(usage=(100, 50))
+        watcher = make_watcher(tmp_path, values, completions, max_concurrency=1, daily_token_budget=300)
+        watcher.poll()
+        values.extend(['t1', f'user{i}@example.com', 'Agree'] for i in range(4))
+        watcher.poll()
+        watcher.wait()
+        watcher.close()
+
+        # Two reports of 150 tokens use up the budget; the rest wait
+        assert len(completions.calls) == 2
+        assert watcher.budget.spent == 300
+        assert watcher.pending == ['user2@example.com', 'user3@example.com']
+        restarted = make_watcher(tmp_path, values, completions, daily_token_budget=300)
+        assert restarted.budget.exhausted()
+        assert restarted.pending == watcher.pending
+        restarted.close()
+
+    def test_app_process_sees_edits_and_gets_the_pregenerated_report(self, tmp_path):
+        values = [HEADERS, ['t1', 'a@example.com', 'Agree']]
+        completions = FakeCompletions(usage=(100, 50))
+        watcher = make_watcher(tmp_path, values, completions)
+        watcher.poll()
+        # The app has its own client and snapshot, and shares only the response cache
+        app = make_booster({'s1': values}, cache_ttl=0, llm_client=make_llm_client(
+            completions, ResponseCache(str(tmp_path / 'cache'), 1024 * 1024)))
+        app.get_all_responses('a@example.com')
+
+        values[1] = ['t2', 'a@example.com', 'Disagree']
+        assert watcher.poll() == ['a@example.com']
+        watcher.wait()
+        watcher.close()
+        data = app.get_all_responses('a@example.com')
+        assert data.sheet_data['s1'][0]['responses']['Question'] == 'Disagree'
+        app.generate_report(data)
+        assert len(completions.calls) == 1
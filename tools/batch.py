@@ -0,0 +1,41 @@
+"""Generate PDF reports for every respondent in SHEET_IDS"""
+import argparse
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.config import settings
+from src.core.batch import BatchRunner, Checkpoint
+from src.core.booster import InterviewBooster
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--output-dir', default=settings.REPORTS_DIR or 'reports',
+                        help='Directory the PDFs are written to (default: REPORTS_DIR or reports)')
+    parser.add_argument('--checkpoint',
+                        help='Checkpoint file of finished candidates (default: <output-dir>/checkpoint.jsonl)')
+    parser.add_argument('--llm-workers', type=int, default=settings.LLM_MAX_IN_FLIGHT,
+                        help='Candidates fetched and sent to the LLM at once')
+    parser.add_argument('--pdf-workers', type=int, default=os.cpu_count(),
+                        help='Processes rendering PDFs')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Regenerate reports instead of reusing cached completions')
+    parser.add_argument('--email', action='append',
+                        help='Only generate the report for this email (repeatable)')
+    args = parser.parse_args()
+
+    checkpoint = Checkpoint(args.checkpoint or os.path.join(args.output_dir, 'checkpoint.jsonl'))
+    runner = BatchRunner(InterviewBooster(), args.output_dir, checkpoint,
+                         llm_workers=args.llm_workers, pdf_workers=args.pdf_workers,
+                         refresh=args.refresh)
+    emails = [e.lower() for e in args.email] if args.email else None
+    result = runner.run(emails)
+
+    print(f"{len(result.written)} reports written, {len(result.skipped)} skipped, "
+          f"{len(result.failed)} failed in {result.elapsed:.1f}s "
+          f"({result.reports_per_minute:.1f} reports/min)")
+    return 1 if result.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Mirror every sheet in SHEET_IDS into the local SQLite store"""
+import argparse
+import os
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.config import settings
+from src.utils.mirror import SheetMirror
+from src.utils.sheets import SheetsClient
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mirror', default=settings.MIRROR_PATH,
+                        help='Path of the SQLite mirror (default: MIRROR_PATH)')
+    parser.add_argument('--full', action='store_true',
+                        help='Reload every row instead of appending new ones')
+    args = parser.parse_args()
+
+    mirror = SheetMirror(args.mirror)
+    sheets_client = SheetsClient(settings.CREDENTIALS_PATH)
+    sheet_ids = [id.strip() for id in settings.SHEET_IDS.split(',')]
+
+    failed = False
+    for sheet_id in sheet_ids:
+        start = time.perf_counter()
+        try:
+            written = mirror.sync(sheets_client, sheet_id, full=args.full)
+        except Exception as e:
+            print(f"{sheet_id}: sync failed: {e}")
+            failed = True
+            continue
+        _, row_count = mirror.get_state(sheet_id)
+        print(f"{sheet_id}: {written} rows written, {row_count} mirrored "
+              f"({time.perf_counter() - start:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,78 +1,87 @@
 import os
 import sys
+import time
 import streamlit as st
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.config import settings
 from src.core.booster import InterviewBooster
-booster = InterviewBooster()
-# Create reports directory
-os.makedirs('reports', exist_ok=True)
+from src.core.jobs import JobQueue, JobStore
+
+# Seconds between status checks while a job is running
+POLL_INTERVAL = 1.0
+
+STATUS_TEXT = {
+    'queued': 'Waiting for a free worker...',
+    'fetching': 'Fetching responses...',
+    'generating': 'Generating report...',
+    'rendering': 'Building PDF...',
+}
+
+
+@st.cache_resource
+def get_booster() -> InterviewBooster:
+    """One booster per process, shared by every session and rerun"""
+    return InterviewBooster()
+
+
+@st.cache_resource
+def get_job_queue() -> JobQueue:
+    """One job queue per process; jobs run outside the script thread and survive reruns"""
+    store = JobStore(settings.JOBS_DB_PATH)
+    store.purge(settings.JOBS_RETENTION_DAYS * 24 * 3600)
+    return JobQueue(get_booster(), store, max_workers=settings.JOBS_MAX_WORKERS)
+
 
 def main():
+    jobs = get_job_queue()
     st.title('Interview Booster Report Generator')
     email = st.text_input('Enter candidate email:')
-    
+    refresh = st.checkbox('Regenerate instead of reusing a cached report')
+
     if st.button('Generate Report'):
         if not email:
             st.warning('Please enter a valid email address')
             return
-            
-        with st.spinner('Generating report...'):
-            # Get candidate data
-            data = booster.get_all_responses(email)
-            
-            # Check if we have data for this email
-            if not any(data.sheet_data.values()):
-                st.warning('No responses found for this email')
-                return
-                
-            # Generate the text report
-            text_report = booster.generate_report(data)
-            
-            # Generate the PDF report
-            try:
-                pdf_path, markdown_content = booster.generate_pdf_report(text_report, email)
-                
-                # Store in session state for persistence
-                st.session_state.pdf_path = pdf_path
-                st.session_state.report_md = markdown_content
-                
-                st.success('Report generated successfully!')
-                
-                # Provide download button for the PDF
-                with open(pdf_path, 'rb') as pdf_file:
-                    pdf_data = pdf_file.read()
-                    
-                st.download_button(
-                    label="Download PDF Report",
-                    data=pdf_data,
-                    file_name=os.path.basename(pdf_path),
-                    mime='application/pdf',
-                    key='pdf_download'
-                )
-                
-                # Display the report content
-                st.markdown("## Report Preview")
-                st.markdown(markdown_content)
-                
-            except Exception as e:
-                st.error(f"Error generating PDF report: {str(e)}")
-    
-    # Always show report if it exists in session state
-    elif 'report_md' in st.session_state:
-        st.markdown("## Previous Report")
-        st.markdown(st.session_state.report_md)
-        
-        if 'pdf_path' in st.session_state and os.path.exists(st.session_state.pdf_path):
-            with open(st.session_state.pdf_path, 'rb') as pdf_file:
-                pdf_data = pdf_file.read()
-                
-            st.download_button(
-                label="Download PDF Report",
-                data=pdf_data,
-                file_name=os.path.basename(st.session_state.pdf_path),
-                mime='application/pdf',
-                key='pdf_download_previous'
-            )
+        # The job id is kept in the URL too, so a browser refresh finds the job again
+        st.session_state.job_id = jobs.submit(email, refresh=refresh)
+        st.query_params['job'] = st.session_state.job_id
+
+    job_id = st.session_state.get('job_id') or st.query_params.get('job')
+    if not job_id:
+        return
+    job = jobs.get(job_id)
+    if job is None:
+        st.warning('This report job no longer exists')
+        return
+
+    for sheet_id in job.warnings:
+        st.warning(f'Could not load responses from: {sheet_id}')
+
+    if not job.finished:
+        st.progress(job.progress, text=STATUS_TEXT[job.status])
+        if job.markdown:
+            st.markdown("## Report Preview")
+            st.markdown(job.markdown)
+        # Poll by rerunning the script; the job keeps running in the meantime
+        time.sleep(POLL_INTERVAL)
+        st.rerun()
+
+    if job.status == 'failed':
+        st.error(f"Error generating report: {job.error}")
+        return
+
+    st.success('Report generated successfully!')
+    st.markdown("## Report")
+    st.markdown(job.markdown)
+
+    # Provide download button for the PDF
+    st.download_button(
+        label="Download PDF Report",
+        data=jobs.get_pdf(job.id),
+        file_name=job.pdf_name,
+        mime='application/pdf',
+        key='pdf_download'
+    )
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,55 @@
+"""Pre-generate reports for candidates with new or changed submissions in SHEET_IDS"""
+import argparse
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.config import settings
+from src.core.booster import InterviewBooster
+from src.core.watcher import SubmissionWatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--interval', type=float, default=settings.WATCH_INTERVAL,
+                        help='Seconds between polls of the sheets (default: WATCH_INTERVAL)')
+    parser.add_argument('--max-concurrency', type=int, default=settings.WATCH_MAX_CONCURRENCY,
+                        help='Reports generated at once (default: WATCH_MAX_CONCURRENCY)')
+    parser.add_argument('--daily-token-budget', type=int, default=settings.WATCH_DAILY_TOKEN_BUDGET,
+                        help='Tokens spent per day before pausing, 0 for no limit '
+                             '(default: WATCH_DAILY_TOKEN_BUDGET)')
+    parser.add_argument('--state', default=settings.WATCH_STATE_PATH,
+                        help='State file (default: WATCH_STATE_PATH)')
+    parser.add_argument('--backfill', action='store_true',
+                        help='On the first poll, also generate reports for existing submissions')
+    parser.add_argument('--once', action='store_true',
+                        help='Poll once, wait for the reports and exit')
+    args = parser.parse_args()
+
+    if not settings.LLM_CACHE_ENABLED:
+        print("LLM_CACHE_ENABLED is off, so pre-generated reports cannot be reused")
+        return 1
+    if settings.DATA_SOURCE == 'mirror':
+        # The watcher polls the Sheets API; reports must be built from the same rows
+        print("The watcher needs DATA_SOURCE=sheets")
+        return 1
+
+    watcher = SubmissionWatcher(InterviewBooster(), args.state, max_concurrency=args.max_concurrency,
+                                daily_token_budget=args.daily_token_budget, backfill=args.backfill)
+    try:
+        if args.once:
+            found = watcher.poll()
+            print(f"{len(found)} candidates with new submissions")
+            watcher.wait()
+        else:
+            print(f"Polling {len(watcher.booster.sheet_ids)} sheets every {args.interval:g}s")
+            watcher.run(args.interval)
+    except KeyboardInterrupt:
+        print("Stopping, waiting for running reports...")
+    finally:
+        watcher.close()
+        print(f"{watcher.budget.spent} tokens spent today, {len(watcher.pending)} reports waiting")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())